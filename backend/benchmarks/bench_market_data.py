@@ -0,0 +1,79 @@
+"""
+Micro-benchmark: trades messages decoded and bucketed into units per second, on one core.
+
+Compares the previous decode path (json.loads, Decimal(str(px)) for every
+print, unit via Decimal division) with the market-data fast path (orjson when
+installed, float prices, unit via integer ticks).
+
+Run from backend/:
+    python -m benchmarks.bench_market_data
+"""
+
+import json
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.exchange.market_data import JSON_BACKEND, loads
+from src.strategy.unit_tracker import UnitTracker
+
+MESSAGES = 20_000
+PRINTS_PER_MESSAGE = 4
+
+
+def make_frames(count=MESSAGES, seed=1):
+    """Trades frames shaped like the exchange's, with a random walk in price"""
+    rng = random.Random(seed)
+    price = 2000.0
+    frames = []
+    for i in range(count):
+        trades = []
+        for _ in range(PRINTS_PER_MESSAGE):
+            price += rng.choice((-0.1, 0.1))
+            trades.append({
+                "coin": "ETH", "side": rng.choice("AB"), "px": f"{price:.1f}", "sz": "0.1234",
+                "time": 1_700_000_000_000 + i, "hash": "0x" + "ab" * 32, "tid": i,
+                "users": ["0x" + "12" * 20, "0x" + "34" * 20],
+            })
+        frames.append(json.dumps({"channel": "trades", "data": trades}))
+    return frames
+
+
+def legacy_path(frames, tracker):
+    """json.loads + Decimal(str(px)) + Decimal unit math for every print"""
+    for frame in frames:
+        for trade in json.loads(frame)["data"]:
+            tracker.unit_of(Decimal(str(trade["px"])))
+
+
+def fast_path(frames, tracker):
+    """Fast JSON + float prices + integer-tick unit math"""
+    for frame in frames:
+        for trade in loads(frame)["data"]:
+            tracker.tick_unit_of(float(trade["px"]))
+
+
+def main():
+    frames = make_frames()
+    tracker = UnitTracker(unit_size_usd=Decimal("0.5"), anchor_price=Decimal("2000"))
+
+    results = {}
+    for name, fn in (("legacy", legacy_path), (f"fast ({JSON_BACKEND})", fast_path)):
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            fn(frames, tracker)
+            best = min(best, time.perf_counter() - start)
+        results[name] = MESSAGES / best
+        print(f"{name:>16}: {results[name]:10,.0f} msgs/s")
+
+    legacy, fast = results.values()
+    print(f"{'speedup':>16}: {fast / legacy:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
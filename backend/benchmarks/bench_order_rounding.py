@@ -0,0 +1,55 @@
+"""
+Micro-benchmark: per-order price/size formatting cost.
+
+Compares the rounding the order methods used to re-derive on every call
+(tick size from szDecimals, Decimal division and float round trips) with the
+precompiled InstrumentSpec quantizers.
+
+Run from backend/:
+    python -m benchmarks.bench_order_rounding
+"""
+
+import sys
+import timeit
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.exchange.instrument_spec import InstrumentSpec
+
+MARKET_INFO = {"name": "ETH", "szDecimals": 4, "maxLeverage": 25, "assetId": 1}
+PRICE = Decimal("2001.2345")
+SIZE = Decimal("1.234567")
+ITERATIONS = 200_000
+
+
+def legacy_rounding(market_info=MARKET_INFO, price=PRICE, size=SIZE):
+    """Rounding as previously inlined in place_stop_buy / place_limit_order"""
+    tick_size = Decimal(str(market_info.get("szDecimals", 4)))
+    tick_size = Decimal("10") ** -tick_size
+    rounded_trigger = (price / tick_size).quantize(Decimal('1'), rounding='ROUND_HALF_UP') * tick_size
+    rounded_limit = (price / tick_size).quantize(Decimal('1'), rounding='ROUND_HALF_UP') * tick_size
+    sz_decimals = int(market_info.get("szDecimals", 4))
+    rounded_size = round(float(size), sz_decimals)
+    return float(rounded_trigger), float(rounded_limit), rounded_size
+
+
+def spec_rounding(spec=InstrumentSpec.from_meta(1, MARKET_INFO), price=PRICE, size=SIZE):
+    """Rounding through the precompiled InstrumentSpec"""
+    rounded_price = spec.round_price(price)
+    return float(rounded_price), float(rounded_price), float(spec.round_size(size))
+
+
+def main():
+    results = {}
+    for name, fn in (("legacy", legacy_rounding), ("instrument_spec", spec_rounding)):
+        best = min(timeit.repeat(fn, number=ITERATIONS, repeat=5))
+        results[name] = best / ITERATIONS * 1e9
+        print(f"{name:>16}: {results[name]:8.0f} ns/order")
+
+    print(f"{'speedup':>16}: {results['legacy'] / results['instrument_spec']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Micro-benchmark: UnitTracker cost per price update, in ns/tick, at realistic crossing rates.
+
+Compares recomputing the unit on every tick (Decimal subtract, divide, floor)
+with the cached-threshold fast path, fed Decimals (update_price) or integer
+ticks (update_ticks). The crossing rate is set by the unit size relative to the
+random walk's step. Then compares the update_price loop with process_array on a
+long historical series, and N independent trackers with one UnitTrackerGroup.
+
+Run from backend/:
+    python -m benchmarks.bench_unit_tracker
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.strategy.unit_tracker import UnitTracker, UnitTrackerGroup
+
+TICKS = 200_000
+HISTORY_TICKS = 2_000_000
+STEP = 0.01  # one price increment
+ANCHOR = Decimal("150")
+
+# Unit sizes giving roughly 5%, 1% and 0.1% of ticks crossing a boundary
+UNIT_SIZES = (Decimal("0.05"), Decimal("0.25"), Decimal("2.5"))
+
+
+def make_walk(count=TICKS, seed=1):
+    """Random walk of exchange prices (two decimals), as floats"""
+    rng = random.Random(seed)
+    price, prices = float(ANCHOR), []
+    for _ in range(count):
+        price = round(price + rng.choice((-STEP, 0.0, STEP)), 2)
+        prices.append(price)
+    return prices
+
+
+class RecomputingTracker(UnitTracker):
+    """The previous update_price: Decimal unit math on every tick"""
+
+    def update_price(self, price):
+        self.current_price = price
+        return self._cross(self.unit_of(price), price)
+
+
+def decimal_prices(tracker, prices):
+    """update_price (cached thresholds, unless the tracker recomputes every tick)"""
+    update = tracker.update_price
+    for price in prices:
+        update(price)
+
+
+def cached_ticks(tracker, prices):
+    """update_ticks with cached integer thresholds"""
+    update = tracker.update_ticks
+    for ticks in prices:
+        update(ticks)
+
+
+def best_of(fn, make_tracker, prices, repeat=5):
+    """Best wall time over a few runs, each on a fresh tracker"""
+    best = float("inf")
+    for _ in range(repeat):
+        tracker = make_tracker()
+        start = time.perf_counter_ns()
+        fn(tracker, prices)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(prices)
+
+
+def main():
+    logger.remove()  # crossing logs are not what is being measured
+    walk = make_walk()
+    decimals = [Decimal(repr(price)) for price in walk]
+
+    print(f"{'unit size':>10} {'crossings':>10} {'recompute':>11} {'cached':>9} {'ticks':>9}")
+    for unit_size in UNIT_SIZES:
+        def make_tracker(cls=UnitTracker):
+            return cls(unit_size_usd=unit_size, anchor_price=ANCHOR)
+
+        counter = make_tracker()
+        crossings = sum(1 for price in decimals if counter.update_price(price))
+        ticks = [counter.to_ticks(price) for price in walk]
+
+        legacy = best_of(decimal_prices, lambda: make_tracker(RecomputingTracker), decimals)
+        cached = best_of(decimal_prices, make_tracker, decimals)
+        tick = best_of(cached_ticks, make_tracker, ticks)
+        print(f"{unit_size:>10} {crossings / len(walk):>9.2%} {legacy:>8.0f} ns {cached:>6.0f} ns {tick:>6.0f} ns")
+
+    history = np.array(make_walk(count=HISTORY_TICKS, seed=2))
+    timestamps = np.arange(HISTORY_TICKS, dtype=np.int64)
+    history_decimals = [Decimal(repr(price)) for price in history.tolist()]
+    print(f"\n{HISTORY_TICKS:,} historical prices, unit size {UNIT_SIZES[0]}")
+
+    start = time.perf_counter()
+    decimal_prices(UnitTracker(unit_size_usd=UNIT_SIZES[0], anchor_price=ANCHOR), history_decimals)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    events = UnitTracker(unit_size_usd=UNIT_SIZES[0], anchor_price=ANCHOR).process_array(history, timestamps)
+    bulk = time.perf_counter() - start
+    print(f"  update_price loop {loop:6.2f} s")
+    print(f"  process_array     {bulk:6.2f} s  ({len(events):,} crossings, {loop / bulk:.0f}x)")
+
+    print(f"\n{'trackers':>10} {'separate':>11} {'group':>9}")
+    for count in (1, 2, 4, 8):
+        sizes = [UNIT_SIZES[-1] * (index + 1) for index in range(count)]
+
+        def separate(trackers, prices):
+            for price in prices:
+                for tracker in trackers:
+                    tracker.update_price(price)
+
+        def grouped(group, prices):
+            update = group.update_price
+            for price in prices:
+                update(price)
+
+        alone = best_of(separate, lambda: [UnitTracker(unit_size_usd=size, anchor_price=ANCHOR) for size in sizes], decimals)
+        shared = best_of(grouped, lambda: UnitTrackerGroup({
+            str(size): UnitTracker(unit_size_usd=size, anchor_price=ANCHOR) for size in sizes
+        }), decimals)
+        print(f"{count:>10} {alone:>8.0f} ns {shared:>6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Feed Bridge
+Bounded hand-off between the WebSocket reader and the strategy's consumers.
+
+Price ticks are conflated: while the consumer is busy, newer prices overwrite
+the pending one and only the newest price plus the high and low seen since the
+last hand-off are kept, so a burst of prints costs one consumer wake-up.
+Alongside them the slot keeps the ordered path of bucket extremes (e.g. unit
+levels): consecutive prices in the same bucket collapse into one point and a
+run moving in one direction collapses into its furthest point, so every
+boundary crossing and reversal inside a burst survives conflation.
+Fills and order updates must never be lost, so they go through a bounded FIFO
+queue; when it is full the reader waits (backpressure) instead of dropping.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Union
+
+
+# Prices are offered as they were decoded (floats on the market-data fast path)
+Price = Union[float, Decimal]
+
+
+@dataclass
+class PriceBatch:
+    """Prices conflated into a single hand-off"""
+    last: Price
+    high: Price
+    low: Price
+    ticks: int
+    decoded_ns: int  # time.monotonic_ns() when the oldest tick in the batch was offered
+    path: List[Price] = field(default_factory=list)  # Ordered bucket extremes, always ending with last
+    received_ns: int = 0  # time.monotonic_ns() when the oldest tick's frame was read, if known
+    exchange_ms: Optional[int] = None  # Exchange timestamp of the oldest tick, if known
+
+
+class ConflatingPriceSlot:
+    """
+    Single-entry price slot for one symbol. Must be used from a single event loop.
+    """
+
+    def __init__(self, bucket: Optional[Callable[[Price], Any]] = None):
+        """
+        Initialize the slot.
+
+        Args:
+            bucket: Maps a price to an ordered bucket (e.g. its unit); prices are their own bucket if None
+        """
+        self.bucket = bucket
+        self._batch: Optional[PriceBatch] = None
+        self._path_keys: List[Any] = []
+        self._ready = asyncio.Event()
+
+        # Counters
+        self.ticks_in = 0
+        self.batches_out = 0
+        self.superseded = 0
+
+    def put(self, price: Price, received_ns: int = 0, exchange_ms: Optional[int] = None) -> None:
+        """
+        Offer a price. Never blocks; merges into the pending batch if there is one.
+
+        Args:
+            price: Latest traded price
+            received_ns: time.monotonic_ns() when its frame was read (for latency tracing)
+            exchange_ms: Exchange timestamp of the price (for latency tracing)
+        """
+        self.ticks_in += 1
+        key = self.bucket(price) if self.bucket else price
+        batch = self._batch
+        if batch is None:
+            self._batch = PriceBatch(
+                price, price, price, 1, time.monotonic_ns(), [price], received_ns, exchange_ms
+            )
+            self._path_keys = [key]
+            self._ready.set()
+            return
+
+        batch.last = price
+        if price > batch.high:
+            batch.high = price
+        elif price < batch.low:
+            batch.low = price
+        batch.ticks += 1
+        self.superseded += 1
+
+        keys, path = self._path_keys, batch.path
+        if key == keys[-1]:
+            path[-1] = price
+        elif len(keys) > 1 and (key > keys[-1]) == (keys[-1] > keys[-2]):
+            # Same direction as the last leg: move its extreme further
+            keys[-1] = key
+            path[-1] = price
+        else:
+            # First leg or a reversal: the previous point is a turning point
+            keys.append(key)
+            path.append(price)
+
+    async def get(self) -> PriceBatch:
+        """
+        Wait for and take the pending batch.
+
+        Returns:
+            Everything offered since the previous get()
+        """
+        while self._batch is None:
+            self._ready.clear()
+            await self._ready.wait()
+
+        batch, self._batch = self._batch, None
+        self._ready.clear()
+        self.batches_out += 1
+        return batch
+
+    def depth(self) -> int:
+        """1 if a batch is waiting for the consumer, else 0"""
+        return 0 if self._batch is None else 1
+
+    def get_stats(self) -> dict:
+        """Get conflation statistics"""
+        return {
+            "depth": self.depth(),
+            "ticks_in": self.ticks_in,
+            "batches_out": self.batches_out,
+            "dropped": self.superseded,
+            "conflation_ratio": self.ticks_in / self.batches_out if self.batches_out else 0.0,
+        }
+
+
+class LosslessQueue:
+    """
+    Bounded FIFO for messages that must all be processed in order.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Messages held before the producer has to wait
+        """
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+        # Counters
+        self.enqueued = 0
+        self.full_waits = 0
+        self.max_depth = 0
+
+    async def put(self, item: Any) -> None:
+        """
+        Enqueue an item, waiting for room if the queue is full.
+
+        Args:
+            item: Message to hand off
+        """
+        if self._queue.full():
+            self.full_waits += 1
+        await self._queue.put(item)
+        self.enqueued += 1
+        depth = self._queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    async def get(self) -> Any:
+        """Wait for and take the oldest item"""
+        return await self._queue.get()
+
+    def depth(self) -> int:
+        """Number of items waiting"""
+        return self._queue.qsize()
+
+    def get_stats(self) -> dict:
+        """Get queue statistics"""
+        return {
+            "depth": self.depth(),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "full_waits": self.full_waits,
+            "dropped": 0,
+        }
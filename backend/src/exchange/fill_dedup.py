@@ -0,0 +1,83 @@
+"""
+Fill De-duplication
+Bounded LRU index of fills already delivered, so every fill reaches the
+strategy exactly once however it arrives: the live userFills stream, the
+snapshot sent on every (re)subscribe, or a userFillsByTime backfill.
+
+Fills are keyed by exchange identity (tid + oid), never by local clock time.
+Memory is O(capacity): the oldest keys are evicted once the index is full,
+which is safe as long as capacity exceeds the number of fills a snapshot or
+backfill can replay.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+
+def fill_key(fill: Dict[str, Any]) -> Hashable:
+    """
+    Identity of a fill.
+
+    Args:
+        fill: Fill in the userFills / userFillsByTime shape
+
+    Returns:
+        (tid, oid) when the trade id is present, otherwise hash, oid, time, price and size
+    """
+    tid = fill.get("tid")
+    if tid is not None:
+        return (tid, fill.get("oid"))
+    return (fill.get("hash"), fill.get("oid"), fill.get("time"), fill.get("px"), fill.get("sz"))
+
+
+class FillDeduplicator:
+    """
+    Set of recently delivered fill keys with least-recently-seen eviction.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        """
+        Initialize the index.
+
+        Args:
+            capacity: Fill keys remembered before the oldest are evicted
+        """
+        self.capacity = capacity
+        self._seen: "OrderedDict[Hashable, None]" = OrderedDict()
+
+        # Counters
+        self.accepted = 0
+        self.duplicates = 0
+
+    def add(self, fill: Dict[str, Any]) -> bool:
+        """
+        Record a fill.
+
+        Args:
+            fill: Fill to record
+
+        Returns:
+            True the first time a fill is seen, False for every repeat
+        """
+        key = fill_key(fill)
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            self.duplicates += 1
+            return False
+
+        self._seen[key] = None
+        if len(self._seen) > self.capacity:
+            self._seen.popitem(last=False)
+        self.accepted += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def get_stats(self) -> dict:
+        """Get de-duplication statistics"""
+        return {
+            "size": len(self._seen),
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+        }
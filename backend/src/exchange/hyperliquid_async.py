@@ -0,0 +1,1068 @@
+"""
+Async Hyperliquid Client
+Non-blocking counterpart of HyperliquidClient with the same method surface.
+Requests go through a pooled httpx.AsyncClient, so awaiting an order never
+blocks the event loop the strategy and WebSocket handlers run on.
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple
+from decimal import Decimal
+
+import httpx
+from loguru import logger
+from hyperliquid.utils.types import Cloid
+from hyperliquid.utils.signing import (
+    Account,
+    get_timestamp_ms,
+    order_request_to_order_wire,
+    order_wires_to_order_action,
+    sign_l1_action,
+)
+
+from .wallet_config import WalletConfig, WalletType
+from .market_metadata import MarketMetadataCache
+from .instrument_spec import InstrumentSpec
+from .price_provider import PriceProvider
+from .rate_limiter import RequestScheduler, Priority, info_weight, action_weight, action_priority
+from .snapshot_cache import AsyncSnapshotCache
+from ..monitoring.latency import current_trace
+from .hyperliquid_sdk import (
+    Position,
+    Balance,
+    AccountSnapshot,
+    OrderResult,
+    OrderSpec,
+    build_order_request,
+    parse_user_state,
+    parse_bulk_order_response,
+    parse_bulk_cancel_response,
+    order_response,
+    status_from_order_query,
+    is_duplicate_cloid_error,
+)
+
+MAINNET_URL = "https://api.hyperliquid.xyz"
+TESTNET_URL = "https://api.hyperliquid-testnet.xyz"
+
+
+class AsyncHyperliquidClient:
+    """
+    Async client for interacting with Hyperliquid exchange.
+    Handles both main wallet and sub-wallet operations.
+    """
+
+    def __init__(
+        self,
+        config: WalletConfig,
+        wallet_type: WalletType = "main",
+        mainnet: bool = False,
+        metadata_ttl_seconds: float = 300.0,
+        state_ttl_seconds: float = 1.0,
+        price_provider: Optional[PriceProvider] = None,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+        http_client: Optional[httpx.AsyncClient] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        order_retries: int = 2
+    ):
+        """
+        Initialize the async Hyperliquid client. Call start() before use.
+
+        Args:
+            config: WalletConfig object containing credentials and addresses
+            wallet_type: Which wallet to use for trading ("main", "sub", "long", "short", "hedge")
+            mainnet: Whether to use mainnet (True) or testnet (False) - matches SDK convention
+            metadata_ttl_seconds: How often the market metadata cache refreshes in the background
+            state_ttl_seconds: How long account snapshots (balance, positions, open orders) are reused
+            price_provider: Optional source of streamed prices used for order sizing (see set_price_provider)
+            timeout: Per-request timeout in seconds
+            max_connections: Size of the keep-alive connection pool
+            http_client: Optional pre-built httpx.AsyncClient (mainly for tests)
+            scheduler: Rate-limit scheduler every request waits on (default: Hyperliquid's 1200 weight/min)
+            order_retries: How often a timed-out order placement carrying a cloid is retried
+        """
+        self.config = config
+        self.order_retries = order_retries
+        self.wallet_type = wallet_type
+        self.mainnet = mainnet
+        self.base_url = MAINNET_URL if mainnet else TESTNET_URL
+
+        self._wallet = Account.from_key(config.private_key)
+        self.active_wallet_address = config.get_wallet_address(wallet_type)
+        self.vault_address = self._resolve_vault_address()
+
+        # Pooled transport - connections are reused across requests
+        self._http = http_client or httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            headers={"Content-Type": "application/json"}
+        )
+
+        # Every request takes its rate-limit weight from here, cancels first
+        self.scheduler = scheduler or RequestScheduler()
+        self._last_nonce = 0  # Actions signed in the same millisecond still get distinct nonces
+
+        self.market_cache = MarketMetadataCache(ttl_seconds=metadata_ttl_seconds)
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Optional local price source for order sizing
+        self.price_provider = price_provider
+
+        # Account reads are per wallet and invalidated by our own actions
+        self.state_cache = AsyncSnapshotCache(ttl_seconds=state_ttl_seconds)
+
+    def _resolve_vault_address(self) -> Optional[str]:
+        """Sub-wallet trading goes through vault_address, main wallet trades directly."""
+        if self.active_wallet_address == self.config.sub_wallet_address:
+            logger.info(f"Initialized with {self.wallet_type} wallet (sub): {self.active_wallet_address[:8]}...")
+            return self.active_wallet_address
+        logger.info(f"Initialized with {self.wallet_type} wallet (main): {self.active_wallet_address[:8]}...")
+        return None
+
+    async def start(self) -> None:
+        """Load market metadata and start its background refresh."""
+        await self._refresh_meta()
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._meta_refresh_loop())
+
+    async def close(self) -> None:
+        """Stop background work and close the connection pool."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        await self._http.aclose()
+
+    def get_user_address(self) -> str:
+        """
+        Get the current trading wallet address.
+
+        Returns:
+            The wallet address being used for trading
+        """
+        return self.active_wallet_address
+
+    def switch_wallet(self, wallet_type: WalletType):
+        """
+        Switch to a different wallet type.
+
+        Args:
+            wallet_type: The wallet type to switch to
+        """
+        if wallet_type != self.wallet_type:
+            self.wallet_type = wallet_type
+            self.active_wallet_address = self.config.get_wallet_address(wallet_type)
+            self.vault_address = self._resolve_vault_address()
+            self.state_cache.invalidate()
+
+    # ============================================================================
+    # TRANSPORT
+    # ============================================================================
+
+    async def _post_info(self, payload: Dict[str, Any]) -> Any:
+        """POST a read request to /info once the rate limiter allows it."""
+        await self.scheduler.acquire(info_weight(payload), Priority.READ)
+        response = await self._http.post("/info", json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def _post_action(self, action: Dict[str, Any], priority: Optional[Priority] = None) -> Any:
+        """
+        Sign an L1 action and POST it to /exchange once the rate limiter allows it.
+        Signing happens after the wait, with a nonce above every one signed before,
+        so actions released together are not rejected as duplicates.
+
+        Args:
+            action: Unsigned action
+            priority: Scheduling lane; derived from the action when omitted
+        """
+        if priority is None:
+            priority = action_priority(action)
+        await self.scheduler.acquire(action_weight(action), priority)
+
+        # Orders placed in reaction to a price move carry its latency trace
+        trace = current_trace.get()
+        if trace is not None:
+            trace.sign_started_ns = time.monotonic_ns()
+
+        nonce = self._next_nonce()
+        signature = sign_l1_action(self._wallet, action, self.vault_address, nonce, None, self.mainnet)
+        payload = {
+            "action": action,
+            "nonce": nonce,
+            "signature": signature,
+            "vaultAddress": self.vault_address,
+            "expiresAfter": None,
+        }
+        if trace is not None:
+            trace.signed_ns = time.monotonic_ns()
+        try:
+            response = await self._http.post("/exchange", json=payload)
+            if trace is not None:
+                trace.responded_ns = time.monotonic_ns()
+            response.raise_for_status()
+            return response.json()
+        finally:
+            # Any action we send may change balance, positions or open orders
+            self.state_cache.invalidate()
+
+    def _next_nonce(self) -> int:
+        """Current time in ms, or one past the last nonce if that is not later"""
+        self._last_nonce = max(self._last_nonce + 1, get_timestamp_ms())
+        return self._last_nonce
+
+    async def _refresh_meta(self) -> None:
+        """Fetch meta on the loop and push it into the cache."""
+        meta = await self._post_info({"type": "meta"})
+        self.market_cache.update(meta)
+
+    async def _meta_refresh_loop(self) -> None:
+        """Reload meta on the TTL. Failures keep the previous map."""
+        while True:
+            await asyncio.sleep(self.market_cache.ttl_seconds)
+            try:
+                await self._refresh_meta()
+            except Exception as e:
+                logger.warning(f"Market metadata refresh failed, keeping cached data: {e}")
+
+    async def _order_action(
+        self,
+        symbol: str,
+        is_buy: bool,
+        size: float,
+        limit_px: float,
+        order_type: Dict[str, Any],
+        reduce_only: bool,
+        cloid: Optional[str] = None
+    ) -> Any:
+        """Build, sign and send a single order action."""
+        instrument = await self.get_instrument_spec(symbol)
+        order_wire = order_request_to_order_wire(
+            {
+                "coin": symbol,
+                "is_buy": is_buy,
+                "sz": size,
+                "limit_px": limit_px,
+                "order_type": order_type,
+                "reduce_only": reduce_only,
+                "cloid": Cloid.from_str(cloid) if cloid else None,
+            },
+            instrument.asset_id
+        )
+        return await self._submit_orders([order_wire])
+
+    async def _submit_orders(self, order_wires: List[Dict[str, Any]]) -> Any:
+        """
+        Send order wires in one action, retrying safely on timeouts.
+
+        A timed-out request may or may not have landed. Orders that carry a cloid
+        are looked up by cloid; those the exchange knows are kept, the rest are
+        resent with the same cloid. A resend rejected as a duplicate cloid is
+        resolved by cloid as well. If retries run out, a cancel by cloid is sent
+        so a late-arriving request cannot leave a stray order behind.
+
+        Args:
+            order_wires: Order wires (optionally with a cloid under "c")
+
+        Returns:
+            Order response in the exchange's shape, one status per wire
+
+        Raises:
+            The transport error if it failed and an order has no cloid to resolve it
+        """
+        statuses: List[Optional[Dict[str, Any]]] = [None] * len(order_wires)
+        pending = list(range(len(order_wires)))
+
+        for attempt in range(self.order_retries + 1):
+            batch = [order_wires[i] for i in pending]
+            try:
+                result = await self._post_action(order_wires_to_order_action(batch))
+            except httpx.TransportError as e:
+                if any(wire.get("c") is None for wire in batch):
+                    raise
+                logger.warning(f"Order request failed ({e!r}), resolving {len(batch)} orders by cloid "
+                               f"(attempt {attempt + 1}/{self.order_retries + 1})")
+                for i in pending:
+                    statuses[i] = await self._order_status_by_cloid(order_wires[i]["c"])
+                pending = [i for i in pending if statuses[i] is None]
+                if not pending:
+                    break
+                continue
+
+            if result.get("status") != "ok":
+                if len(pending) == len(order_wires):
+                    return result
+                for i in pending:
+                    statuses[i] = {"error": f"Bulk order failed: {result.get('response')}"}
+                pending = []
+                break
+
+            for i, status in zip(pending, _statuses(result)):
+                cloid = order_wires[i].get("c")
+                if cloid is not None and is_duplicate_cloid_error(status):
+                    status = await self._order_status_by_cloid(cloid) or status
+                statuses[i] = status
+            pending = []
+            break
+
+        if pending:
+            await self._hedge_cancel_by_cloid([order_wires[i] for i in pending])
+            for i in pending:
+                statuses[i] = {"error": "Order request timed out and was not found by cloid; cancel sent"}
+
+        return order_response(statuses)
+
+    async def _order_status_by_cloid(self, cloid: str) -> Optional[Dict[str, Any]]:
+        """Look an order up by cloid; None if the exchange has never seen it."""
+        try:
+            response = await self._post_info({"type": "orderStatus", "user": self.get_user_address(), "oid": cloid})
+            return status_from_order_query(response)
+        except Exception as e:
+            logger.warning(f"Order lookup by cloid {cloid} failed: {e}")
+            return None
+
+    async def _hedge_cancel_by_cloid(self, order_wires: List[Dict[str, Any]]) -> None:
+        """Best-effort cancel of orders whose placement could not be confirmed."""
+        try:
+            await self._post_action({
+                "type": "cancelByCloid",
+                "cancels": [{"asset": wire["a"], "cloid": wire["c"]} for wire in order_wires],
+            })
+        except Exception as e:
+            logger.error(f"Hedge cancel by cloid failed: {e}")
+
+    # ============================================================================
+    # ACCOUNT INFORMATION
+    # ============================================================================
+
+    def invalidate_account_cache(self) -> None:
+        """
+        Drop cached account snapshots. Called after our own exchange actions and
+        by the strategy when fills or order updates arrive.
+        """
+        self.state_cache.invalidate()
+
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        """
+        Get balance and positions from one (possibly shared) clearinghouseState read.
+
+        Returns:
+            AccountSnapshot for the current wallet
+        """
+        payload = {"type": "clearinghouseState", "user": self.get_user_address()}
+
+        async def fetch() -> AccountSnapshot:
+            return parse_user_state(await self._post_info(payload))
+
+        return await self.state_cache.get("clearinghouseState", fetch)
+
+    async def get_balance(self) -> Balance:
+        """
+        Get account balance for the current wallet.
+
+        Returns:
+            Balance object with total value, margin used, and available balance
+        """
+        try:
+            return (await self.get_account_snapshot()).balance
+        except Exception as e:
+            logger.error(f"Failed to get balance: {e}")
+            raise
+
+    async def get_positions(self) -> Dict[str, Position]:
+        """
+        Get all open positions for the current wallet.
+
+        Returns:
+            Dictionary mapping symbol to Position object
+        """
+        try:
+            return dict((await self.get_account_snapshot()).positions)
+        except Exception as e:
+            logger.error(f"Failed to get positions: {e}")
+            raise
+
+    async def get_position(self, symbol: str) -> Optional[Position]:
+        """
+        Get position for a specific symbol.
+
+        Args:
+            symbol: Trading symbol (e.g., "ETH")
+
+        Returns:
+            Position object if exists, None otherwise
+        """
+        positions = await self.get_positions()
+        return positions.get(symbol)
+
+    # ============================================================================
+    # MARKET DATA
+    # ============================================================================
+
+    def set_price_provider(self, provider: Optional[PriceProvider]) -> None:
+        """
+        Plug in a local price source (e.g. the strategy's WebSocket trade feed).
+        calculate_position_size prefers it over REST while its price is fresh.
+
+        Args:
+            provider: Object with get_price(symbol) -> Optional[Decimal], or None to always use REST
+        """
+        self.price_provider = provider
+
+    async def _sizing_price(self, symbol: str) -> Decimal:
+        """Freshest streamed price, falling back to a REST fetch when it is missing or stale."""
+        if self.price_provider is not None:
+            price = self.price_provider.get_price(symbol)
+            if price is not None:
+                return price
+        return await self.get_current_price(symbol)
+
+    async def get_current_price(self, symbol: str) -> Decimal:
+        """
+        Get current market price for a symbol.
+
+        Args:
+            symbol: Trading symbol (e.g., "ETH")
+
+        Returns:
+            Current mid-market price
+        """
+        try:
+            all_mids = await self._post_info({"type": "allMids"})
+            price = all_mids.get(symbol, 0)
+            if price == 0:
+                raise ValueError(f"Could not get price for {symbol}")
+            return Decimal(str(price))
+        except Exception as e:
+            logger.error(f"Failed to get price for {symbol}: {e}")
+            raise
+
+    async def get_market_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get market metadata for a symbol including szDecimals and assetId.
+        Served from the metadata cache; only a cache miss reaches the exchange.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Market information including szDecimals, maxLeverage, assetId
+        """
+        market = self.market_cache.lookup(symbol)
+        if market is not None:
+            return market
+
+        try:
+            await self._refresh_meta()
+            market = self.market_cache.lookup(symbol)
+            if market is None:
+                raise ValueError(f"Market info not found for {symbol}")
+            return market
+        except Exception as e:
+            logger.error(f"Failed to get market info: {e}")
+            raise
+
+    async def get_instrument_spec(self, symbol: str) -> InstrumentSpec:
+        """
+        Get the precompiled rounding rules for a symbol.
+        Built once per metadata refresh; only a cache miss reaches the exchange.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            InstrumentSpec with price and size quantizers
+        """
+        spec = self.market_cache.lookup_spec(symbol)
+        if spec is not None:
+            return spec
+
+        try:
+            await self._refresh_meta()
+            spec = self.market_cache.lookup_spec(symbol)
+            if spec is None:
+                raise ValueError(f"Market info not found for {symbol}")
+            return spec
+        except Exception as e:
+            logger.error(f"Failed to get instrument spec: {e}")
+            raise
+
+    # ============================================================================
+    # TRADING OPERATIONS
+    # ============================================================================
+
+    async def set_leverage(self, symbol: str, leverage: int) -> bool:
+        """
+        Set leverage for a symbol.
+
+        Args:
+            symbol: Trading symbol
+            leverage: Leverage multiplier (e.g., 10 for 10x)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            market_info = await self.get_market_info(symbol)
+            max_allowed = int(market_info.get("maxLeverage", 20))
+            if leverage > max_allowed:
+                logger.warning(f"Requested {leverage}x exceeds max {max_allowed}x for {symbol}, using max")
+                leverage = max_allowed
+
+            logger.info(f"Setting leverage to {leverage}x for {symbol}")
+
+            result = await self._post_action({
+                "type": "updateLeverage",
+                "asset": market_info["assetId"],
+                "isCross": True,  # Use cross margin
+                "leverage": leverage,
+            })
+
+            if result.get("status") == "ok":
+                logger.info(f"✅ Successfully set leverage to {leverage}x for {symbol}")
+                return True
+            else:
+                error_msg = result.get("response", "Unknown error")
+                logger.error(f"❌ Failed to set {leverage}x leverage: {error_msg}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error setting leverage: {e}")
+            return False
+
+    async def calculate_position_size(self, symbol: str, usd_amount: Decimal) -> Decimal:
+        """
+        Calculate position size in base currency from USD amount.
+        Prices from the plugged-in price provider when fresh, otherwise from REST.
+
+        Args:
+            symbol: Trading symbol
+            usd_amount: Position size in USD
+
+        Returns:
+            Position size in base currency, properly rounded
+        """
+        current_price = await self._sizing_price(symbol)
+        instrument = await self.get_instrument_spec(symbol)
+        return instrument.round_size(usd_amount / current_price)
+
+    async def _slippage_price(self, symbol: str, is_buy: bool, slippage: float) -> float:
+        """Aggressive limit price for a market order, rounded like the SDK does."""
+        mid = await self.get_current_price(symbol)
+        instrument = await self.get_instrument_spec(symbol)
+        factor = Decimal(str(1 + slippage if is_buy else 1 - slippage))
+        return float(instrument.round_price(mid * factor))
+
+    async def open_position(
+        self,
+        symbol: str,
+        usd_amount: Decimal,
+        is_long: bool = True,
+        leverage: Optional[int] = None,
+        slippage: float = 0.01
+    ) -> OrderResult:
+        """
+        Open a new position.
+
+        Args:
+            symbol: Trading symbol (e.g., "ETH")
+            usd_amount: Position size in USD
+            is_long: True for long, False for short
+            leverage: Optional leverage to set before opening
+            slippage: Maximum slippage tolerance (default 1%)
+
+        Returns:
+            OrderResult with execution details
+        """
+        try:
+            if leverage:
+                market_info = await self.get_market_info(symbol)
+                max_lev = int(market_info.get("maxLeverage", 20))
+                if not (1 <= leverage <= max_lev):
+                    return OrderResult(
+                        success=False,
+                        error_message=f"Invalid leverage {leverage} for {symbol}. Max allowed: {max_lev}"
+                    )
+                await self.set_leverage(symbol, leverage)
+
+            position_size_coin = await self.calculate_position_size(symbol, usd_amount)
+
+            logger.info(
+                f"Opening {'LONG' if is_long else 'SHORT'} position: "
+                f"{position_size_coin} {symbol} (${usd_amount})"
+            )
+
+            px = await self._slippage_price(symbol, is_long, slippage)
+            result = await self._order_action(
+                symbol, is_long, float(position_size_coin), px, {"limit": {"tif": "Ioc"}}, False
+            )
+
+            statuses = _statuses(result)
+            if statuses and "filled" in statuses[0]:
+                filled = statuses[0]["filled"]
+                return OrderResult(
+                    success=True,
+                    order_id=str(filled.get("oid")),
+                    filled_size=Decimal(str(filled.get("totalSz", 0))),
+                    average_price=Decimal(str(filled.get("avgPx", 0)))
+                )
+            elif statuses and "error" in statuses[0]:
+                return OrderResult(success=False, error_message=statuses[0]["error"])
+
+            return OrderResult(success=False, error_message=f"Unexpected response: {result}")
+
+        except Exception as e:
+            logger.error(f"Failed to open position: {e}")
+            return OrderResult(success=False, error_message=str(e))
+
+    async def close_position(self, symbol: str, slippage: float = 0.01) -> OrderResult:
+        """
+        Close an existing position.
+
+        Args:
+            symbol: Trading symbol
+            slippage: Maximum slippage tolerance
+
+        Returns:
+            OrderResult with execution details
+        """
+        try:
+            position = await self.get_position(symbol)
+            if not position:
+                return OrderResult(success=False, error_message=f"No position to close for {symbol}")
+
+            logger.info(f"Closing {position.side} position: {position.size} {symbol}")
+
+            is_buy = not position.is_long  # Opposite side to close
+            px = await self._slippage_price(symbol, is_buy, slippage)
+            result = await self._order_action(
+                symbol, is_buy, float(position.size), px, {"limit": {"tif": "Ioc"}}, True
+            )
+
+            statuses = _statuses(result)
+            if statuses and "filled" in statuses[0]:
+                filled = statuses[0]["filled"]
+                return OrderResult(
+                    success=True,
+                    order_id=str(filled.get("oid")),
+                    filled_size=Decimal(str(filled.get("totalSz", 0))),
+                    average_price=Decimal(str(filled.get("avgPx", 0)))
+                )
+
+            return OrderResult(success=False, error_message=f"Failed to close: {result}")
+
+        except Exception as e:
+            logger.error(f"Failed to close position: {e}")
+            return OrderResult(success=False, error_message=str(e))
+
+    async def close_all_positions(self) -> Dict[str, OrderResult]:
+        """
+        Close all open positions.
+
+        Returns:
+            Dictionary mapping symbol to OrderResult
+        """
+        results = {}
+        positions = await self.get_positions()
+
+        for symbol in positions:
+            logger.info(f"Closing {symbol} position...")
+            results[symbol] = await self.close_position(symbol)
+
+        return results
+
+    async def _place_trigger_order(
+        self,
+        symbol: str,
+        is_buy: bool,
+        size: Decimal,
+        trigger_price: Decimal,
+        limit_price: Decimal,
+        reduce_only: bool,
+        cloid: Optional[str] = None
+    ) -> OrderResult:
+        """Shared implementation of the stop order variants."""
+        instrument = await self.get_instrument_spec(symbol)
+        rounded_trigger = instrument.round_price(trigger_price)
+        rounded_limit = instrument.round_price(limit_price)
+        rounded_size = float(instrument.round_size(size))
+
+        logger.info(
+            f"Placing {'BUY' if is_buy else 'SELL'} stop order: "
+            f"{size} {symbol} triggers @ ${rounded_trigger:.2f}, limit @ ${rounded_limit:.2f}"
+        )
+
+        order_type = {"trigger": {"triggerPx": float(rounded_trigger), "isMarket": True, "tpsl": "sl"}}
+        result = await self._order_action(
+            symbol, is_buy, rounded_size, float(rounded_limit), order_type, reduce_only, cloid
+        )
+
+        if result.get("status") != "ok":
+            error_msg = result.get("response", "Unknown error")
+            return OrderResult(success=False, error_message=f"Stop order failed: {error_msg}")
+
+        statuses = _statuses(result)
+        if statuses and "resting" in statuses[0]:
+            return OrderResult(
+                success=True,
+                order_id=str(statuses[0]["resting"].get("oid")),
+                filled_size=Decimal("0"),
+                average_price=Decimal(str(rounded_limit))
+            )
+        elif statuses and "error" in statuses[0]:
+            return OrderResult(success=False, error_message=statuses[0]["error"])
+        return OrderResult(success=False, error_message=f"Unexpected response: {statuses}")
+
+    async def place_stop_order(
+        self,
+        symbol: str,
+        is_buy: bool,
+        size: Decimal,
+        trigger_price: Decimal,
+        reduce_only: bool = True,
+        cloid: Optional[str] = None
+    ) -> OrderResult:
+        """
+        Place a stop loss order that triggers at specified price.
+
+        Args:
+            symbol: Trading symbol
+            is_buy: True for stop buy, False for stop sell
+            size: Order size in base currency
+            trigger_price: Price that triggers the stop
+            reduce_only: If True, only reduces position (default True for stops)
+            cloid: Optional client order id; makes a timed-out placement safe to retry
+
+        Returns:
+            OrderResult with order details
+        """
+        try:
+            return await self._place_trigger_order(
+                symbol, is_buy, size, trigger_price, trigger_price, reduce_only, cloid
+            )
+        except Exception as e:
+            logger.error(f"Failed to place stop order: {e}", exc_info=True)
+            return OrderResult(success=False, error_message=str(e))
+
+    async def place_stop_buy(
+        self,
+        symbol: str,
+        size: Decimal,
+        trigger_price: Decimal,
+        limit_price: Optional[Decimal] = None,
+        reduce_only: bool = False,
+        cloid: Optional[str] = None
+    ) -> OrderResult:
+        """
+        Place a stop limit buy order that triggers when price rises to specified level.
+
+        Args:
+            symbol: Trading symbol
+            size: Order size in base currency
+            trigger_price: Price that triggers the order (above current market)
+            limit_price: Limit price for execution (if None, uses trigger_price)
+            reduce_only: If True, only reduces position (usually False for entries)
+            cloid: Optional client order id; makes a timed-out placement safe to retry
+
+        Returns:
+            OrderResult with order details
+        """
+        try:
+            if limit_price is None:
+                limit_price = trigger_price
+            return await self._place_trigger_order(
+                symbol, True, size, trigger_price, limit_price, reduce_only, cloid
+            )
+        except Exception as e:
+            logger.error(f"Failed to place stop buy order: {e}", exc_info=True)
+            return OrderResult(success=False, error_message=str(e))
+
+    async def place_limit_order(
+        self,
+        symbol: str,
+        is_buy: bool,
+        price: Decimal,
+        size: Decimal,
+        reduce_only: bool = False,
+        post_only: bool = True,
+        cloid: Optional[str] = None
+    ) -> OrderResult:
+        """
+        Place a limit order.
+
+        Args:
+            symbol: Trading symbol (e.g., "ETH")
+            is_buy: True for buy, False for sell
+            price: Limit price
+            size: Order size in base currency
+            reduce_only: If True, order can only reduce position
+            post_only: If True, order will only make (not take)
+            cloid: Optional client order id; makes a timed-out placement safe to retry
+
+        Returns:
+            OrderResult with order details
+        """
+        try:
+            instrument = await self.get_instrument_spec(symbol)
+            rounded_price = instrument.round_price(price)
+            rounded_size = instrument.round_size(size)
+
+            logger.info(
+                f"Placing {'BUY' if is_buy else 'SELL'} limit order: "
+                f"{rounded_size} {symbol} @ ${rounded_price:.2f}"
+            )
+
+            result = await self._order_action(
+                symbol, is_buy, float(rounded_size), float(rounded_price), {"limit": {"tif": "Gtc"}}, reduce_only, cloid
+            )
+
+            statuses = _statuses(result)
+            if statuses and "resting" in statuses[0]:
+                return OrderResult(
+                    success=True,
+                    order_id=str(statuses[0]["resting"].get("oid")),
+                    filled_size=Decimal("0"),
+                    average_price=Decimal(str(price))
+                )
+            elif statuses and "filled" in statuses[0]:
+                filled = statuses[0]["filled"]
+                return OrderResult(
+                    success=True,
+                    order_id=str(filled.get("oid")),
+                    filled_size=Decimal(str(filled.get("totalSz", 0))),
+                    average_price=Decimal(str(filled.get("avgPx", 0)))
+                )
+            elif statuses and "error" in statuses[0]:
+                return OrderResult(success=False, error_message=statuses[0]["error"])
+
+            return OrderResult(success=False, error_message=f"Unexpected response: {result}")
+
+        except Exception as e:
+            logger.error(f"Failed to place limit order: {e}", exc_info=True)
+            return OrderResult(success=False, error_message=str(e))
+
+    async def place_orders_bulk(self, orders: List[OrderSpec]) -> List[OrderResult]:
+        """
+        Place several orders with a single signed batch action.
+
+        Args:
+            orders: Order specifications (limit orders, or stop orders when trigger_price is set)
+
+        Returns:
+            One OrderResult per spec, in the same order
+        """
+        if not orders:
+            return []
+
+        try:
+            order_wires = []
+            prices = []
+            for spec in orders:
+                instrument = await self.get_instrument_spec(spec.symbol)
+                order_request, rounded_price = build_order_request(spec, instrument)
+                order_wires.append(order_request_to_order_wire(order_request, instrument.asset_id))
+                prices.append(rounded_price)
+
+            logger.info(f"Placing {len(orders)} orders in one batch: "
+                        f"{[(('BUY' if o.is_buy else 'SELL'), f'{p:.2f}') for o, p in zip(orders, prices)]}")
+
+            result = await self._submit_orders(order_wires)
+            return parse_bulk_order_response(result, prices)
+
+        except Exception as e:
+            logger.error(f"Failed to place bulk orders: {e}", exc_info=True)
+            return [OrderResult(success=False, error_message=str(e)) for _ in orders]
+
+    async def replace_order(self, order_id: str, order: OrderSpec) -> OrderResult:
+        """
+        Move a resting order to a new price/size in a single modify action,
+        instead of placing a new order and cancelling the old one.
+
+        Args:
+            order_id: ID of the resting order to modify
+            order: New order specification (same symbol and side as the original)
+
+        Returns:
+            OrderResult carrying the ID of the modified order
+        """
+        return (await self.replace_orders_bulk([(order_id, order)]))[0]
+
+    async def replace_orders_bulk(self, replacements: List[Tuple[str, OrderSpec]]) -> List[OrderResult]:
+        """
+        Modify several resting orders with a single signed batchModify action.
+
+        Args:
+            replacements: (order ID, new order specification) pairs
+
+        Returns:
+            One OrderResult per replacement, in the same order
+        """
+        if not replacements:
+            return []
+
+        try:
+            modifies = []
+            prices = []
+            for order_id, spec in replacements:
+                instrument = await self.get_instrument_spec(spec.symbol)
+                order_request, rounded_price = build_order_request(spec, instrument)
+                modifies.append({
+                    "oid": int(order_id),
+                    "order": order_request_to_order_wire(order_request, instrument.asset_id),
+                })
+                prices.append(rounded_price)
+
+            logger.info(f"Modifying {len(replacements)} orders in one batch: "
+                        f"{[(oid, f'{p:.2f}') for (oid, _), p in zip(replacements, prices)]}")
+
+            result = await self._post_action({"type": "batchModify", "modifies": modifies})
+            return parse_bulk_order_response(result, prices)
+
+        except Exception as e:
+            logger.error(f"Failed to modify orders: {e}", exc_info=True)
+            return [OrderResult(success=False, error_message=str(e)) for _ in replacements]
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        """
+        Cancel an open order.
+
+        Args:
+            symbol: Trading symbol
+            order_id: Order ID to cancel
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            market_info = await self.get_market_info(symbol)
+            result = await self._post_action({
+                "type": "cancel",
+                "cancels": [{"a": market_info["assetId"], "o": int(order_id)}],
+            })
+
+            if result.get("status") == "ok":
+                logger.info(f"Cancelled order {order_id} for {symbol}")
+                return True
+            else:
+                logger.warning(f"Failed to cancel order: {result}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error cancelling order: {e}")
+            return False
+
+    async def cancel_orders_bulk(self, symbol: str, order_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel several orders with a single signed batch action.
+
+        Args:
+            symbol: Trading symbol
+            order_ids: Order IDs to cancel
+
+        Returns:
+            Mapping of order ID to True if cancelled
+        """
+        if not order_ids:
+            return {}
+
+        try:
+            market_info = await self.get_market_info(symbol)
+            result = await self._post_action({
+                "type": "cancel",
+                "cancels": [{"a": market_info["assetId"], "o": int(oid)} for oid in order_ids],
+            })
+            outcome = parse_bulk_cancel_response(result, order_ids)
+            logger.info(f"Cancelled {sum(outcome.values())}/{len(order_ids)} orders for {symbol} in one batch")
+            return outcome
+
+        except Exception as e:
+            logger.error(f"Error cancelling orders: {e}")
+            return {order_id: False for order_id in order_ids}
+
+    async def cancel_all_orders(self, symbol: str) -> int:
+        """
+        Cancel all open orders for a symbol with one batched cancel.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Number of orders cancelled
+        """
+        try:
+            open_orders = await self.get_open_orders(symbol)
+            order_ids = [str(order["oid"]) for order in open_orders if order.get("oid")]
+            if not order_ids:
+                return 0
+
+            outcome = await self.cancel_orders_bulk(symbol, order_ids)
+            cancelled_count = sum(outcome.values())
+
+            logger.info(f"Cancelled {cancelled_count} orders for {symbol}")
+            return cancelled_count
+
+        except Exception as e:
+            logger.error(f"Error cancelling all orders: {e}")
+            return 0
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> list:
+        """
+        Get all open orders.
+
+        Args:
+            symbol: Optional symbol to filter by
+
+        Returns:
+            List of open orders
+        """
+        try:
+            payload = {"type": "openOrders", "user": self.get_user_address()}
+            open_orders = list(await self.state_cache.get("openOrders", lambda: self._post_info(payload)))
+
+            if symbol:
+                open_orders = [o for o in open_orders if o.get("coin") == symbol]
+
+            return open_orders
+
+        except Exception as e:
+            logger.error(f"Failed to get open orders: {e}")
+            return []
+
+    async def get_order_history(self, symbol: Optional[str] = None, limit: int = 100) -> list:
+        """
+        Get order fill history from Hyperliquid.
+
+        Args:
+            symbol: Optional symbol to filter by
+            limit: Maximum number of fills to retrieve
+
+        Returns:
+            List of filled orders
+        """
+        try:
+            fills = await self._post_info({"type": "userFills", "user": self.get_user_address()})
+
+            if symbol:
+                fills = [f for f in fills if f.get("coin") == symbol]
+
+            return fills[:limit]
+
+        except Exception as e:
+            logger.error(f"Failed to get order history: {e}")
+            return []
+
+
+def _statuses(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract the per-order statuses from an /exchange response."""
+    if not isinstance(result, dict) or result.get("status") != "ok":
+        return []
+    response = result.get("response", {})
+    if not isinstance(response, dict):
+        return []
+    return response.get("data", {}).get("statuses", [])
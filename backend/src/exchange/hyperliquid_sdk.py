@@ -3,16 +3,22 @@ Hyperliquid SDK Wrapper
 Provides a clean interface to the Hyperliquid exchange
 """
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List
 from decimal import Decimal
 from dataclasses import dataclass
 
+import requests
 from loguru import logger
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 from hyperliquid.utils.signing import Account
+from hyperliquid.utils.types import Cloid
 
 from .wallet_config import WalletConfig, WalletType
+from .market_metadata import MarketMetadataCache
+from .instrument_spec import InstrumentSpec
+from .price_provider import PriceProvider
+from .snapshot_cache import SnapshotCache
 
 @dataclass
 class Position:
@@ -37,6 +43,13 @@ class Balance:
     available: Decimal
 
 
+@dataclass
+class AccountSnapshot:
+    """Balance and positions parsed from one clearinghouseState response"""
+    balance: Balance
+    positions: Dict[str, Position]
+
+
 @dataclass
 class OrderResult:
     """Represents the result of an order"""
@@ -47,13 +60,239 @@ class OrderResult:
     error_message: Optional[str] = None
 
 
+@dataclass
+class OrderSpec:
+    """Specification of a single order within a bulk placement"""
+    symbol: str
+    is_buy: bool
+    price: Decimal  # Limit price
+    size: Decimal  # Order size in base currency
+    reduce_only: bool = False
+    trigger_price: Optional[Decimal] = None  # Set for stop orders, None for plain limit orders
+    cloid: Optional[str] = None  # Client order id ("0x" + 32 hex), makes the placement safe to retry
+
+
+def parse_user_state(user_state: Dict[str, Any]) -> AccountSnapshot:
+    """
+    Parse a clearinghouseState response into balance and open positions.
+
+    Args:
+        user_state: Raw clearinghouseState response
+
+    Returns:
+        AccountSnapshot for the wallet
+    """
+    margin_summary = user_state.get("marginSummary", {})
+    total_value = Decimal(str(margin_summary.get("accountValue", 0)))
+    margin_used = Decimal(str(margin_summary.get("totalMarginUsed", 0)))
+
+    positions = {}
+    for asset_position in user_state.get("assetPositions", []):
+        position_data = asset_position.get("position", {})
+        szi = float(position_data.get("szi", 0))
+
+        if szi != 0:  # Has an open position
+            symbol = position_data.get("coin")
+            positions[symbol] = Position(
+                symbol=symbol,
+                is_long=szi > 0,
+                size=Decimal(str(abs(szi))),
+                entry_price=Decimal(str(position_data.get("entryPx", 0))),
+                unrealized_pnl=Decimal(str(asset_position.get("unrealizedPnl", 0))),
+                margin_used=Decimal(str(position_data.get("marginUsed", 0)))
+            )
+
+    return AccountSnapshot(
+        balance=Balance(
+            total_value=total_value,
+            margin_used=margin_used,
+            available=total_value - margin_used
+        ),
+        positions=positions
+    )
+
+
+def build_order_request(spec: OrderSpec, instrument: InstrumentSpec) -> Tuple[Dict[str, Any], Decimal]:
+    """
+    Round an OrderSpec to the market's precision and build the SDK order request.
+
+    Args:
+        spec: Order specification
+        instrument: InstrumentSpec for spec.symbol
+
+    Returns:
+        Tuple of (SDK OrderRequest dict, rounded limit price)
+    """
+    rounded_price = instrument.round_price(spec.price)
+
+    if spec.trigger_price is not None:
+        rounded_trigger = instrument.round_price(spec.trigger_price)
+        order_type = {"trigger": {"triggerPx": float(rounded_trigger), "isMarket": True, "tpsl": "sl"}}
+    else:
+        order_type = {"limit": {"tif": "Gtc"}}
+
+    order_request = {
+        "coin": spec.symbol,
+        "is_buy": spec.is_buy,
+        "sz": float(instrument.round_size(spec.size)),
+        "limit_px": float(rounded_price),
+        "order_type": order_type,
+        "reduce_only": spec.reduce_only,
+    }
+    if spec.cloid is not None:
+        order_request["cloid"] = Cloid.from_str(spec.cloid)
+    return order_request, rounded_price
+
+
+def order_response(statuses: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Build an order response in the exchange's shape from per-order statuses,
+    e.g. after some of them were resolved by cloid instead of by the response.
+
+    Args:
+        statuses: Status entries in submission order (None where nothing is known)
+
+    Returns:
+        Response dict as returned by the order endpoint
+    """
+    return {
+        "status": "ok",
+        "response": {"type": "order", "data": {"statuses": [
+            status if status is not None else {"error": "No status returned for order"}
+            for status in statuses
+        ]}}
+    }
+
+
+def status_from_order_query(response: Any) -> Optional[Dict[str, Any]]:
+    """
+    Convert an orderStatus lookup (by cloid) into an order-response status entry.
+
+    Args:
+        response: Raw orderStatus response
+
+    Returns:
+        {"resting": ...}, {"filled": ...} or {"error": ...}, or None if the exchange never saw the order
+    """
+    if not isinstance(response, dict) or response.get("status") != "order":
+        return None
+
+    order_info = response.get("order", {})
+    order = order_info.get("order", {})
+    status = order_info.get("status")
+
+    if status in ("open", "triggered"):
+        return {"resting": {"oid": order.get("oid")}}
+    if status == "filled":
+        return {"filled": {"oid": order.get("oid"), "totalSz": order.get("origSz"), "avgPx": order.get("limitPx")}}
+    return {"error": f"Order {order.get('cloid')} is {status}"}
+
+
+def is_duplicate_cloid_error(status: Any) -> bool:
+    """True if an order was rejected because its cloid is already in use (i.e. an earlier attempt landed)."""
+    if not isinstance(status, dict) or "error" not in status:
+        return False
+    message = str(status["error"]).lower()
+    return "cloid" in message and "duplicate" in message
+
+
+def parse_order_status(status: Dict[str, Any], price: Decimal) -> OrderResult:
+    """
+    Convert one entry of an order response's `statuses` list into an OrderResult.
+
+    Args:
+        status: Status entry ({"resting": ...}, {"filled": ...} or {"error": ...})
+        price: Limit price reported for resting orders
+
+    Returns:
+        OrderResult for that order
+    """
+    if "resting" in status:
+        return OrderResult(
+            success=True,
+            order_id=str(status["resting"].get("oid")),
+            filled_size=Decimal("0"),
+            average_price=price
+        )
+    elif "filled" in status:
+        filled = status["filled"]
+        return OrderResult(
+            success=True,
+            order_id=str(filled.get("oid")),
+            filled_size=Decimal(str(filled.get("totalSz", 0))),
+            average_price=Decimal(str(filled.get("avgPx", 0)))
+        )
+    elif "error" in status:
+        return OrderResult(success=False, error_message=status["error"])
+    return OrderResult(success=False, error_message=f"Unexpected status: {status}")
+
+
+def parse_bulk_cancel_response(result: Any, order_ids: List[str]) -> Dict[str, bool]:
+    """
+    Map a batched cancel response back to a success flag per order ID.
+
+    Args:
+        result: Raw /exchange response
+        order_ids: Order IDs in submission order
+
+    Returns:
+        Mapping of order ID to True if cancelled
+    """
+    if not isinstance(result, dict) or result.get("status") != "ok":
+        return {order_id: False for order_id in order_ids}
+
+    statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+    outcome = {}
+    for i, order_id in enumerate(order_ids):
+        status = statuses[i] if i < len(statuses) else None
+        outcome[order_id] = status == "success"
+        if status != "success":
+            logger.warning(f"Failed to cancel order {order_id}: {status}")
+    return outcome
+
+
+def parse_bulk_order_response(result: Any, prices: List[Decimal]) -> List[OrderResult]:
+    """
+    Map a batched order response back to one OrderResult per submitted order.
+
+    Args:
+        result: Raw /exchange response
+        prices: Rounded limit prices in submission order
+
+    Returns:
+        OrderResults in submission order
+    """
+    if not isinstance(result, dict) or result.get("status") != "ok":
+        error_msg = result.get("response", "Unknown error") if isinstance(result, dict) else result
+        return [OrderResult(success=False, error_message=f"Bulk order failed: {error_msg}") for _ in prices]
+
+    statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+    results = []
+    for i, price in enumerate(prices):
+        if i < len(statuses):
+            results.append(parse_order_status(statuses[i], price))
+        else:
+            results.append(OrderResult(success=False, error_message="No status returned for order"))
+    return results
+
+
 class HyperliquidClient:
     """
     Main client for interacting with Hyperliquid exchange.
     Handles both main wallet and sub-wallet operations.
     """
     
-    def __init__(self, config: WalletConfig, wallet_type: WalletType = "main", mainnet: bool = False):
+    def __init__(
+        self,
+        config: WalletConfig,
+        wallet_type: WalletType = "main",
+        mainnet: bool = False,
+        metadata_ttl_seconds: float = 300.0,
+        state_ttl_seconds: float = 1.0,
+        price_provider: Optional[PriceProvider] = None,
+        timeout: Optional[float] = 10.0,
+        order_retries: int = 2
+    ):
         """
         Initialize the Hyperliquid client with explicit configuration.
 
@@ -61,8 +300,15 @@ class HyperliquidClient:
             config: WalletConfig object containing credentials and addresses
             wallet_type: Which wallet to use for trading ("main", "sub", "long", "short", "hedge")
             mainnet: Whether to use mainnet (True) or testnet (False) - matches SDK convention
+            metadata_ttl_seconds: How often the market metadata cache refreshes in the background
+            state_ttl_seconds: How long account snapshots (balance, positions, open orders) are reused
+            price_provider: Optional source of streamed prices used for order sizing (see set_price_provider)
+            timeout: Per-request timeout in seconds for the SDK's HTTP calls
+            order_retries: How often a timed-out order placement carrying a cloid is retried
         """
         self.config = config
+        self.timeout = timeout
+        self.order_retries = order_retries
         self.wallet_type = wallet_type
         self.mainnet = mainnet
 
@@ -75,8 +321,18 @@ class HyperliquidClient:
         # Get the active wallet address based on type
         self.active_wallet_address = config.get_wallet_address(wallet_type)
 
+        # Market metadata is network-wide, so the cache survives wallet switches
+        self.market_cache = MarketMetadataCache(lambda: self.info.meta(), ttl_seconds=metadata_ttl_seconds)
+
+        # Optional local price source for order sizing
+        self.price_provider = price_provider
+
+        # Account reads are per wallet and invalidated by our own actions
+        self.state_cache = SnapshotCache(ttl_seconds=state_ttl_seconds)
+
         # Initialize wallet and clients
         self._initialize_clients()
+        self.market_cache.start_background_refresh()
         
     def _initialize_clients(self):
         """Initialize the SDK clients with provided configuration"""
@@ -84,7 +340,12 @@ class HyperliquidClient:
         wallet = Account.from_key(self.config.private_key)
 
         # Initialize Info client for read operations
-        self.info = Info(self.base_url, skip_ws=True)
+        self.info = Info(self.base_url, skip_ws=True, timeout=self.timeout)
+
+        # Load market metadata once and seed the SDK Exchange with it
+        if self.market_cache.raw_meta is None:
+            self.market_cache.load()
+        meta = self.market_cache.raw_meta
 
         # Determine vault_address parameter based on wallet type
         # If using sub wallet, we need to pass it as vault_address
@@ -96,14 +357,18 @@ class HyperliquidClient:
             self.exchange = Exchange(
                 wallet=wallet,
                 base_url=self.base_url,
-                vault_address=self.active_wallet_address
+                meta=meta,
+                vault_address=self.active_wallet_address,
+                timeout=self.timeout
             )
             logger.info(f"Initialized with {self.wallet_type} wallet (sub): {self.active_wallet_address[:8]}...")
         else:
             # Trade on main wallet (no vault_address needed)
             self.exchange = Exchange(
                 wallet=wallet,
-                base_url=self.base_url
+                base_url=self.base_url,
+                meta=meta,
+                timeout=self.timeout
             )
             logger.info(f"Initialized with {self.wallet_type} wallet (main): {self.active_wallet_address[:8]}...")
     
@@ -126,12 +391,37 @@ class HyperliquidClient:
         if wallet_type != self.wallet_type:
             self.wallet_type = wallet_type
             self.active_wallet_address = self.config.get_wallet_address(wallet_type)
+            self.state_cache.invalidate()
             self._initialize_clients()
+
+    def close(self):
+        """Stop background work owned by the client."""
+        self.market_cache.stop_background_refresh()
     
     # ============================================================================
     # ACCOUNT INFORMATION
     # ============================================================================
     
+    def invalidate_account_cache(self) -> None:
+        """
+        Drop cached account snapshots. Called after our own exchange actions and
+        by the strategy when fills or order updates arrive.
+        """
+        self.state_cache.invalidate()
+
+    def get_account_snapshot(self) -> AccountSnapshot:
+        """
+        Get balance and positions from one (possibly shared) clearinghouseState read.
+
+        Returns:
+            AccountSnapshot for the current wallet
+        """
+        address = self.get_user_address()
+        return self.state_cache.get(
+            "clearinghouseState",
+            lambda: parse_user_state(self.info.user_state(address))
+        )
+
     def get_balance(self) -> Balance:
         """
         Get account balance for the current wallet.
@@ -140,17 +430,7 @@ class HyperliquidClient:
             Balance object with total value, margin used, and available balance
         """
         try:
-            user_state = self.info.user_state(self.get_user_address())
-            margin_summary = user_state.get("marginSummary", {})
-            
-            total_value = Decimal(str(margin_summary.get("accountValue", 0)))
-            margin_used = Decimal(str(margin_summary.get("totalMarginUsed", 0)))
-            
-            return Balance(
-                total_value=total_value,
-                margin_used=margin_used,
-                available=total_value - margin_used
-            )
+            return self.get_account_snapshot().balance
         except Exception as e:
             logger.error(f"Failed to get balance: {e}")
             raise
@@ -163,25 +443,7 @@ class HyperliquidClient:
             Dictionary mapping symbol to Position object
         """
         try:
-            user_state = self.info.user_state(self.get_user_address())
-            positions = {}
-            
-            for asset_position in user_state.get("assetPositions", []):
-                position_data = asset_position.get("position", {})
-                szi = float(position_data.get("szi", 0))
-                
-                if szi != 0:  # Has an open position
-                    symbol = position_data.get("coin")
-                    positions[symbol] = Position(
-                        symbol=symbol,
-                        is_long=szi > 0,
-                        size=Decimal(str(abs(szi))),
-                        entry_price=Decimal(str(position_data.get("entryPx", 0))),
-                        unrealized_pnl=Decimal(str(asset_position.get("unrealizedPnl", 0))),
-                        margin_used=Decimal(str(position_data.get("marginUsed", 0)))
-                    )
-            
-            return positions
+            return dict(self.get_account_snapshot().positions)
         except Exception as e:
             logger.error(f"Failed to get positions: {e}")
             raise
@@ -203,6 +465,24 @@ class HyperliquidClient:
     # MARKET DATA
     # ============================================================================
     
+    def set_price_provider(self, provider: Optional[PriceProvider]) -> None:
+        """
+        Plug in a local price source (e.g. the strategy's WebSocket trade feed).
+        calculate_position_size prefers it over REST while its price is fresh.
+
+        Args:
+            provider: Object with get_price(symbol) -> Optional[Decimal], or None to always use REST
+        """
+        self.price_provider = provider
+
+    def _sizing_price(self, symbol: str) -> Decimal:
+        """Freshest streamed price, falling back to a REST fetch when it is missing or stale."""
+        if self.price_provider is not None:
+            price = self.price_provider.get_price(symbol)
+            if price is not None:
+                return price
+        return self.get_current_price(symbol)
+
     def get_current_price(self, symbol: str) -> Decimal:
         """
         Get current market price for a symbol.
@@ -226,6 +506,7 @@ class HyperliquidClient:
     def get_market_info(self, symbol: str) -> Dict[str, Any]:
         """
         Get market metadata for a symbol including tickSize and szDecimals.
+        Served from the metadata cache; only a cache miss reaches the exchange.
         
         Args:
             symbol: Trading symbol
@@ -234,19 +515,28 @@ class HyperliquidClient:
             Market information including tickSize, szDecimals, etc.
         """
         try:
-            meta = self.info.meta()
-            # The asset details are in the 'universe' key
-            assets = meta.get("universe", [])
-            
-            for asset in assets:
-                if asset.get("name") == symbol:
-                    return asset
-            
-            raise ValueError(f"Market info not found for {symbol}")
+            return self.market_cache.get(symbol)
         except Exception as e:
             logger.error(f"Failed to get market info: {e}")
             raise
     
+    def get_instrument_spec(self, symbol: str) -> InstrumentSpec:
+        """
+        Get the precompiled rounding rules for a symbol.
+        Built once per metadata refresh; only a cache miss reaches the exchange.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            InstrumentSpec with price and size quantizers
+        """
+        try:
+            return self.market_cache.get_spec(symbol)
+        except Exception as e:
+            logger.error(f"Failed to get instrument spec: {e}")
+            raise
+    
     # ============================================================================
     # TRADING OPERATIONS
     # ============================================================================
@@ -278,6 +568,7 @@ class HyperliquidClient:
                 name=symbol,
                 is_cross=True  # Use cross margin
             )
+            self.invalidate_account_cache()
     
             # logger.info(f"RAW LEVERAGE RESPONSE: {result}")
 
@@ -296,6 +587,7 @@ class HyperliquidClient:
     def calculate_position_size(self, symbol: str, usd_amount: Decimal) -> Decimal:
         """
         Calculate position size in base currency from USD amount.
+        Prices from the plugged-in price provider when fresh, otherwise from REST.
         
         Args:
             symbol: Trading symbol
@@ -304,15 +596,8 @@ class HyperliquidClient:
         Returns:
             Position size in base currency, properly rounded
         """
-        current_price = self.get_current_price(symbol)
-        
-        # Get market info for decimals
-        market_info = self.get_market_info(symbol)
-        sz_decimals = int(market_info["szDecimals"])
-        
-        # Calculate and round to appropriate decimals
-        size = usd_amount / current_price
-        return Decimal(str(round(float(size), sz_decimals)))
+        current_price = self._sizing_price(symbol)
+        return self.get_instrument_spec(symbol).round_size(usd_amount / current_price)
     
     def open_position(
         self, 
@@ -366,6 +651,7 @@ class HyperliquidClient:
                 px=None,  # Let SDK calculate
                 slippage=slippage
             )
+            self.invalidate_account_cache()
             
             # logger.info(f"RAW OPEN POSITION RESPONSE: {result}")
 
@@ -433,6 +719,7 @@ class HyperliquidClient:
                 px=None,
                 slippage=slippage
             )
+            self.invalidate_account_cache()
             
             # logger.info(f"RAW CLOSE POSITION RESPONSE: {result}")
             
@@ -485,7 +772,8 @@ class HyperliquidClient:
         is_buy: bool,
         size: Decimal,
         trigger_price: Decimal,
-        reduce_only: bool = True
+        reduce_only: bool = True,
+        cloid: Optional[str] = None
     ) -> OrderResult:
         """
         Place a stop loss order that triggers at specified price.
@@ -496,26 +784,21 @@ class HyperliquidClient:
             size: Order size in base currency
             trigger_price: Price that triggers the stop
             reduce_only: If True, only reduces position (default True for stops)
+            cloid: Optional client order id; makes a timed-out placement safe to retry
             
         Returns:
             OrderResult with order details
         """
         try:
-            # Get tick size from market info and round trigger price
-            # TODO: I don't like that these values are hard coded. we should be able to get the tick_size and szDecimals from the coin meta.
-            market_info = self.get_market_info(symbol)
-            tick_size = Decimal(str(market_info.get("szDecimals", 4)))
-            tick_size = Decimal("10") ** -tick_size  # Convert decimals to tick size
-
-            # Round to tick size
-            multiplier = trigger_price / tick_size
-            rounded_trigger = multiplier.quantize(Decimal('1'), rounding='ROUND_HALF_UP') * tick_size
+            # Round trigger price and size with the market's precompiled rules
+            instrument = self.get_instrument_spec(symbol)
+            rounded_trigger = instrument.round_price(trigger_price)
             
             logger.info(
                 f"Placing {'BUY' if is_buy else 'SELL'} stop order: "
                 f"{size} {symbol} triggers @ ${rounded_trigger:.2f}"
             )
-            logger.info(f"Original trigger: ${trigger_price}, Rounded: ${rounded_trigger}, Tick size: ${tick_size}")
+            logger.info(f"Original trigger: ${trigger_price}, Rounded: ${rounded_trigger}")
             
             # Create stop loss order type
             # Use limit orders for all stops with proper tick sizing
@@ -531,21 +814,17 @@ class HyperliquidClient:
             # Use the trigger price as the limit price
             limit_px = rounded_trigger
             
-            # Get market info for proper decimal formatting
-            market_info = self.get_market_info(symbol)
-            sz_decimals = int(market_info.get("szDecimals", 4))
-            
-            # Round size to appropriate decimals
-            rounded_size = round(float(size), sz_decimals)
-            
-            result = self.exchange.order(
-                symbol, 
-                is_buy, 
-                rounded_size, 
-                float(limit_px), 
-                order_type, 
-                reduce_only
-            )
+            rounded_size = float(instrument.round_size(size))
+            
+            result = self._submit_orders([{
+                "coin": symbol,
+                "is_buy": is_buy,
+                "sz": rounded_size,
+                "limit_px": float(limit_px),
+                "order_type": order_type,
+                "reduce_only": reduce_only,
+                "cloid": Cloid.from_str(cloid) if cloid else None,
+            }])
             
             # logger.info(f"RAW STOP ORDER RESPONSE: {result}")
 
@@ -583,7 +862,8 @@ class HyperliquidClient:
         size: Decimal,
         trigger_price: Decimal,
         limit_price: Optional[Decimal] = None,
-        reduce_only: bool = False
+        reduce_only: bool = False,
+        cloid: Optional[str] = None
     ) -> OrderResult:
         """
         Place a stop limit buy order that triggers when price rises to specified level.
@@ -594,25 +874,20 @@ class HyperliquidClient:
             trigger_price: Price that triggers the order (above current market)
             limit_price: Limit price for execution (if None, uses trigger_price)
             reduce_only: If True, only reduces position (usually False for entries)
+            cloid: Optional client order id; makes a timed-out placement safe to retry
             
         Returns:
             OrderResult with order details
         """
         try:
-            # Get tick size from market info and round prices
-            market_info = self.get_market_info(symbol)
-            tick_size = Decimal(str(market_info.get("szDecimals", 4)))
-            tick_size = Decimal("10") ** -tick_size  # Convert decimals to tick size
-
-            # Round trigger price to tick size
-            multiplier = trigger_price / tick_size
-            rounded_trigger = multiplier.quantize(Decimal('1'), rounding='ROUND_HALF_UP') * tick_size
+            # Round prices with the market's precompiled rules
+            instrument = self.get_instrument_spec(symbol)
+            rounded_trigger = instrument.round_price(trigger_price)
 
             # Use trigger as limit if not specified
             if limit_price is None:
                 limit_price = trigger_price
-            multiplier = limit_price / tick_size
-            rounded_limit = multiplier.quantize(Decimal('1'), rounding='ROUND_HALF_UP') * tick_size
+            rounded_limit = instrument.round_price(limit_price)
             
             logger.info(
                 f"Placing STOP LIMIT BUY order: "
@@ -629,21 +904,17 @@ class HyperliquidClient:
                 }
             }
 
-            # Get market info for proper decimal formatting
-            market_info = self.get_market_info(symbol)            
-            sz_decimals = int(market_info.get("szDecimals", 4))
+            rounded_size = float(instrument.round_size(size))
             
-            # Round size to appropriate decimals
-            rounded_size = round(float(size), sz_decimals)
-            
-            result = self.exchange.order(
-                symbol, 
-                True,  # is_buy = True
-                rounded_size, 
-                float(rounded_limit), 
-                order_type, 
-                reduce_only
-            )
+            result = self._submit_orders([{
+                "coin": symbol,
+                "is_buy": True,
+                "sz": rounded_size,
+                "limit_px": float(rounded_limit),
+                "order_type": order_type,
+                "reduce_only": reduce_only,
+                "cloid": Cloid.from_str(cloid) if cloid else None,
+            }])
             
             # logger.info(f"RAW STOP BUY RESPONSE: {result}")
             # Parse result
@@ -680,7 +951,8 @@ class HyperliquidClient:
         price: Decimal,
         size: Decimal,
         reduce_only: bool = False,
-        post_only: bool = True
+        post_only: bool = True,
+        cloid: Optional[str] = None
     ) -> OrderResult:
         """
         Place a limit order.
@@ -692,51 +964,32 @@ class HyperliquidClient:
             size: Order size in base currency
             reduce_only: If True, order can only reduce position
             post_only: If True, order will only make (not take)
+            cloid: Optional client order id; makes a timed-out placement safe to retry
             
         Returns:
             OrderResult with order details
         """
         try:
-            # Ensure price and size are Decimals
-            price = Decimal(str(price))
-            size = Decimal(str(size))
-
-            # Get market info for proper decimal formatting
-            market_info = self.get_market_info(symbol)
-            sz_decimals = int(market_info.get("szDecimals", 4))
-
-            # Get tick size from market info
-            tick_decimals = int(market_info.get("szDecimals", 4))
-            tick_size = Decimal(10) ** Decimal(-tick_decimals)
-
-            # Round price to the nearest tick size using Decimal arithmetic
-            rounded_price = (price / tick_size).quantize(Decimal('1'), rounding='ROUND_HALF_UP') * tick_size
-
-            # Round size to appropriate decimals using Decimal
-            rounded_size = size.quantize(Decimal(10) ** Decimal(-sz_decimals), rounding='ROUND_HALF_UP')
+            # Round price and size with the market's precompiled rules
+            instrument = self.get_instrument_spec(symbol)
+            rounded_price = instrument.round_price(price)
+            rounded_size = instrument.round_size(size)
             
             logger.info(
                 f"Placing {'BUY' if is_buy else 'SELL'} limit order: "
                 f"{rounded_size} {symbol} @ ${rounded_price:.2f}"
             )
             
-            # Create order request
-            order = {
-                "a": 1,  # Asset ID (1 for perp)
-                "b": is_buy,
-                "p": str(rounded_price),
-                "s": str(rounded_size),
-                "r": reduce_only,
-                "t": {"limit": {"tif": "Gtc"}},  # Good till cancelled
-                "c": None  # No client order ID for now
-            }
-
-            if post_only:
-                order["t"]["limit"]["tif"] = "Alo"  # Add liquidity only
-
             # Place the order with rounded price (convert to float for SDK)
-            result = self.exchange.order(symbol, is_buy, float(rounded_size), float(rounded_price),
-                                        {"limit": {"tif": "Gtc"}}, reduce_only=reduce_only)
+            result = self._submit_orders([{
+                "coin": symbol,
+                "is_buy": is_buy,
+                "sz": float(rounded_size),
+                "limit_px": float(rounded_price),
+                "order_type": {"limit": {"tif": "Gtc"}},
+                "reduce_only": reduce_only,
+                "cloid": Cloid.from_str(cloid) if cloid else None,
+            }])
             
             # logger.info(f"RAW LIMIT ORDER RESPONSE: {result}")
             # Parse result
@@ -770,6 +1023,165 @@ class HyperliquidClient:
             logger.error(f"Failed to place limit order: {e}", exc_info=True)
             return OrderResult(success=False, error_message=str(e))
     
+    def _submit_orders(self, order_requests: List[Dict[str, Any]]) -> Any:
+        """
+        Send order requests in one batch, retrying safely on timeouts.
+
+        A timed-out request may or may not have landed. Orders that carry a cloid
+        are looked up by cloid; those the exchange knows are kept, the rest are
+        resent with the same cloid. A resend rejected as a duplicate cloid is
+        resolved by cloid as well. If retries run out, a cancel by cloid is sent
+        so a late-arriving request cannot leave a stray order behind.
+
+        Args:
+            order_requests: SDK order requests (optionally with a "cloid")
+
+        Returns:
+            Order response in the exchange's shape, one status per request
+
+        Raises:
+            The transport error if it timed out and an order has no cloid to resolve it
+        """
+        statuses: List[Optional[Dict[str, Any]]] = [None] * len(order_requests)
+        pending = list(range(len(order_requests)))
+
+        try:
+            for attempt in range(self.order_retries + 1):
+                batch = [order_requests[i] for i in pending]
+                try:
+                    result = self.exchange.bulk_orders(batch)
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    if any(request.get("cloid") is None for request in batch):
+                        raise
+                    logger.warning(f"Order request failed ({e}), resolving {len(batch)} orders by cloid "
+                                   f"(attempt {attempt + 1}/{self.order_retries + 1})")
+                    for i in pending:
+                        statuses[i] = self._order_status_by_cloid(order_requests[i]["cloid"])
+                    pending = [i for i in pending if statuses[i] is None]
+                    if not pending:
+                        break
+                    continue
+
+                if result.get("status") != "ok":
+                    if len(pending) == len(order_requests):
+                        return result
+                    for i in pending:
+                        statuses[i] = {"error": f"Bulk order failed: {result.get('response')}"}
+                    pending = []
+                    break
+
+                batch_statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                for i, status in zip(pending, batch_statuses):
+                    cloid = order_requests[i].get("cloid")
+                    if cloid is not None and is_duplicate_cloid_error(status):
+                        status = self._order_status_by_cloid(cloid) or status
+                    statuses[i] = status
+                pending = []
+                break
+
+            if pending:
+                self._hedge_cancel_by_cloid([order_requests[i] for i in pending])
+                for i in pending:
+                    statuses[i] = {"error": "Order request timed out and was not found by cloid; cancel sent"}
+
+            return order_response(statuses)
+        finally:
+            self.invalidate_account_cache()
+
+    def _order_status_by_cloid(self, cloid: Cloid) -> Optional[Dict[str, Any]]:
+        """Look an order up by cloid; None if the exchange has never seen it."""
+        try:
+            return status_from_order_query(self.info.query_order_by_cloid(self.get_user_address(), cloid))
+        except Exception as e:
+            logger.warning(f"Order lookup by cloid {cloid} failed: {e}")
+            return None
+
+    def _hedge_cancel_by_cloid(self, order_requests: List[Dict[str, Any]]) -> None:
+        """Best-effort cancel of orders whose placement could not be confirmed."""
+        try:
+            self.exchange.bulk_cancel_by_cloid([
+                {"coin": request["coin"], "cloid": request["cloid"]} for request in order_requests
+            ])
+        except Exception as e:
+            logger.error(f"Hedge cancel by cloid failed: {e}")
+
+    def place_orders_bulk(self, orders: List[OrderSpec]) -> List[OrderResult]:
+        """
+        Place several orders with a single signed batch action.
+
+        Args:
+            orders: Order specifications (limit orders, or stop orders when trigger_price is set)
+
+        Returns:
+            One OrderResult per spec, in the same order
+        """
+        if not orders:
+            return []
+
+        try:
+            order_requests = []
+            prices = []
+            for spec in orders:
+                order_request, rounded_price = build_order_request(spec, self.get_instrument_spec(spec.symbol))
+                order_requests.append(order_request)
+                prices.append(rounded_price)
+
+            logger.info(f"Placing {len(orders)} orders in one batch: "
+                        f"{[(('BUY' if o.is_buy else 'SELL'), f'{p:.2f}') for o, p in zip(orders, prices)]}")
+
+            result = self._submit_orders(order_requests)
+            return parse_bulk_order_response(result, prices)
+
+        except Exception as e:
+            logger.error(f"Failed to place bulk orders: {e}", exc_info=True)
+            return [OrderResult(success=False, error_message=str(e)) for _ in orders]
+
+    def replace_order(self, order_id: str, order: OrderSpec) -> OrderResult:
+        """
+        Move a resting order to a new price/size in a single modify action,
+        instead of placing a new order and cancelling the old one.
+
+        Args:
+            order_id: ID of the resting order to modify
+            order: New order specification (same symbol and side as the original)
+
+        Returns:
+            OrderResult carrying the ID of the modified order
+        """
+        return self.replace_orders_bulk([(order_id, order)])[0]
+
+    def replace_orders_bulk(self, replacements: List[Tuple[str, OrderSpec]]) -> List[OrderResult]:
+        """
+        Modify several resting orders with a single signed batchModify action.
+
+        Args:
+            replacements: (order ID, new order specification) pairs
+
+        Returns:
+            One OrderResult per replacement, in the same order
+        """
+        if not replacements:
+            return []
+
+        try:
+            modify_requests = []
+            prices = []
+            for order_id, spec in replacements:
+                order_request, rounded_price = build_order_request(spec, self.get_instrument_spec(spec.symbol))
+                modify_requests.append({"oid": int(order_id), "order": order_request})
+                prices.append(rounded_price)
+
+            logger.info(f"Modifying {len(replacements)} orders in one batch: "
+                        f"{[(oid, f'{p:.2f}') for (oid, _), p in zip(replacements, prices)]}")
+
+            result = self.exchange.bulk_modify_orders_new(modify_requests)
+            self.invalidate_account_cache()
+            return parse_bulk_order_response(result, prices)
+
+        except Exception as e:
+            logger.error(f"Failed to modify orders: {e}", exc_info=True)
+            return [OrderResult(success=False, error_message=str(e)) for _ in replacements]
+
     def cancel_order(self, symbol: str, order_id: str) -> bool:
         """
         Cancel an open order.
@@ -783,6 +1195,7 @@ class HyperliquidClient:
         """
         try:
             result = self.exchange.cancel(symbol, int(order_id))
+            self.invalidate_account_cache()
             
             # logger.info(f"RAW CANCEL . ORDER RESPONSE for {order_id}: {result}")
             
@@ -797,9 +1210,34 @@ class HyperliquidClient:
             logger.error(f"Error cancelling order: {e}")
             return False
     
+    def cancel_orders_bulk(self, symbol: str, order_ids: List[str]) -> Dict[str, bool]:
+        """
+        Cancel several orders with a single signed batch action.
+
+        Args:
+            symbol: Trading symbol
+            order_ids: Order IDs to cancel
+
+        Returns:
+            Mapping of order ID to True if cancelled
+        """
+        if not order_ids:
+            return {}
+
+        try:
+            result = self.exchange.bulk_cancel([{"coin": symbol, "oid": int(oid)} for oid in order_ids])
+            self.invalidate_account_cache()
+            outcome = parse_bulk_cancel_response(result, order_ids)
+            logger.info(f"Cancelled {sum(outcome.values())}/{len(order_ids)} orders for {symbol} in one batch")
+            return outcome
+
+        except Exception as e:
+            logger.error(f"Error cancelling orders: {e}")
+            return {order_id: False for order_id in order_ids}
+
     def cancel_all_orders(self, symbol: str) -> int:
         """
-        Cancel all open orders for a symbol.
+        Cancel all open orders for a symbol with one batched cancel.
 
         Args:
             symbol: Trading symbol
@@ -810,14 +1248,12 @@ class HyperliquidClient:
         try:
             # Get all open orders for this symbol
             open_orders = self.get_open_orders(symbol)
-            if not open_orders:
+            order_ids = [str(order["oid"]) for order in open_orders if order.get("oid")]
+            if not order_ids:
                 return 0
 
-            cancelled_count = 0
-            for order in open_orders:
-                order_id = order.get("oid")
-                if order_id and self.cancel_order(symbol, str(order_id)):
-                    cancelled_count += 1
+            outcome = self.cancel_orders_bulk(symbol, order_ids)
+            cancelled_count = sum(outcome.values())
 
             logger.info(f"Cancelled {cancelled_count} orders for {symbol}")
             return cancelled_count
@@ -837,8 +1273,9 @@ class HyperliquidClient:
             List of open orders
         """
         try:
-            user_state = self.info.user_state(self.get_user_address())
-            open_orders = user_state.get("openOrders", [])
+            # clearinghouseState carries no orders, they come from the openOrders endpoint
+            address = self.get_user_address()
+            open_orders = list(self.state_cache.get("openOrders", lambda: self.info.open_orders(address)))
 
             if symbol:
                 open_orders = [o for o in open_orders if o.get("coin") == symbol]
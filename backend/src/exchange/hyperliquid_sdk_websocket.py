@@ -1,53 +1,197 @@
 """
-WebSocket client for HyperLiquid using the official SDK.
-The SDK's Info class has built-in WebSocket functionality via subscribe/unsubscribe.
+WebSocket client for HyperLiquid.
+Frames are read by a native asyncio WebSocket connection on the caller's event loop,
+so subscription handlers run on the strategy's loop without any thread hop.
+
+One connection serves any number of subscribers. Each exchange subscription is
+a route keyed by (channel, coin or user); routes are reference-counted, so the
+subscribe message is sent for the first subscriber only and the unsubscribe
+message after the last one leaves. Incoming frames are routed through the
+precomputed route table and fanned out to every subscriber on the route.
+
+A connection that closes or goes silent is re-established with exponential
+backoff, every registered channel is resubscribed, and fills that happened
+during the outage are fetched with userFillsByTime and replayed through the
+normal fill callbacks.
+
+An optional TapeRecorder keeps every raw frame for replay.
 """
 import asyncio
+import functools
+import json
+import random
+import time
+import httpx
+from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import datetime
-from typing import Dict, Callable, Any, Optional
+from typing import Dict, Callable, Any, Awaitable, List, Optional, Set, Tuple
 from loguru import logger
-from hyperliquid.info import Info
+from websockets.asyncio.client import connect as ws_connect, ClientConnection
+from websockets.exceptions import ConnectionClosed
+from hyperliquid.utils.constants import MAINNET_API_URL, TESTNET_API_URL
+from .feed_bridge import ConflatingPriceSlot, LosslessQueue
+from .fill_dedup import FillDeduplicator
+from .market_data import PriceSource, book_price, loads, to_decimal, top_of_book
+from .tape_recorder import TapeRecorder
+from ..monitoring.latency import LatencyTrace, current_trace
+
+# Hyperliquid closes connections that have not sent anything for 60 seconds
+PING_INTERVAL_SECONDS = 50
+
+# No frame at all (not even a pong) for this long means the connection is dead
+STALE_AFTER_SECONDS = 75
+HEALTH_CHECK_SECONDS = 5
+
+# Backfill window start before startup when no fill has been seen (covers local clock skew)
+BACKFILL_MARGIN_MS = 60_000
+
+# (channel, coin or lower-cased user)
+RouteKey = Tuple[str, str]
+
+# How to find the route key of a message payload, per channel. orderUpdates messages carry
+# no user: they belong to the one user whose order updates the connection carries.
+ROUTE_KEYS: Dict[str, Optional[Callable[[Any], str]]] = {
+    "trades": lambda data: data[0]["coin"],
+    "bbo": lambda data: data["coin"],
+    "l2Book": lambda data: data["coin"],
+    "userFills": lambda data: data["user"].lower(),
+    "orderUpdates": None,
+}
+
+
+def route_key(subscription: Dict[str, Any]) -> RouteKey:
+    """
+    Route key of a subscription, matching what ROUTE_KEYS extracts from its messages.
+
+    Args:
+        subscription: Subscription object, e.g. {"type": "trades", "coin": "ETH"}
+
+    Returns:
+        (channel, coin or user)
+    """
+    channel = subscription["type"]
+    if channel in ("userFills", "orderUpdates"):
+        return channel, subscription["user"].lower()
+    return channel, subscription["coin"]
+
+
+@dataclass(eq=False)
+class PriceSink:
+    """One subscriber's price consumer on a trades or book route"""
+    slot: ConflatingPriceSlot
+    price_callback: Optional[Callable[[Decimal], Any]] = None
+    path_callback: Optional[Callable[[List[Decimal]], Any]] = None
+    source: PriceSource = PriceSource.LAST_TRADE
+    task: Optional[asyncio.Task] = None
+
+
+@dataclass(eq=False)
+class Route:
+    """One exchange subscription, shared by every subscriber that asked for it"""
+    subscription: Dict[str, Any]
+    handler: Callable[["Route", Any], Awaitable[None]]
+    refs: int = 0
+    sinks: List[PriceSink] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class FeedSubscription:
+    """Handle for what one subscribe_* call registered; pass it to unsubscribe() to release it"""
+    route_key: Optional[RouteKey] = None
+    price_sink: Optional[PriceSink] = None
+    fill_symbol: Optional[str] = None
+    fill_callback: Optional[Callable] = None
+    order_user: Optional[str] = None
+    order_callback: Optional[Callable] = None
 
 
 class HyperliquidSDKWebSocketClient:
-    """A WebSocket client that uses Hyperliquid SDK's Info class for subscriptions."""
-
-    def __init__(self, mainnet: bool = False, user_address: Optional[str] = None):
+    """A WebSocket client for Hyperliquid subscriptions running on the asyncio event loop."""
+
+    def __init__(
+        self,
+        mainnet: bool = False,
+        user_address: Optional[str] = None,
+        event_queue_size: int = 1000,
+        reconnect: bool = True,
+        reconnect_initial_delay: float = 0.5,
+        reconnect_max_delay: float = 30.0,
+        fill_index_size: int = 10_000,
+        ws_url: Optional[str] = None,
+        recorder: Optional[TapeRecorder] = None
+    ):
         """
-        Initializes the SDK-based WebSocket client.
+        Initializes the WebSocket client.
 
         Args:
             mainnet: Whether to use mainnet (True) or testnet (False) - matches SDK convention
             user_address: Optional wallet address for user-specific subscriptions.
+            event_queue_size: Fills and order updates buffered before the reader waits for the consumer
+            reconnect: Re-establish the connection when it drops instead of stopping the listener
+            reconnect_initial_delay: First backoff delay in seconds, doubled after every failed attempt
+            reconnect_max_delay: Upper bound for the backoff delay in seconds
+            fill_index_size: Fill ids remembered for de-duplication
+            ws_url: Endpoint override (e.g. a local relay); derived from the network if None
+            recorder: Records every raw frame with its receive time, for replay
         """
         self.mainnet = mainnet
         self.user_address = user_address
-        self.info: Optional[Info] = None
+        self.api_url = MAINNET_API_URL if mainnet else TESTNET_API_URL
+        self.ws_url = ws_url or "ws" + self.api_url[len("http"):] + "/ws"
+        self.ws: Optional[ClientConnection] = None
         self.is_connected = False
-        self.startup_time = datetime.now()  # Track when bot started to filter old fills
-
-        # Callbacks for processing different types of events
-        self.price_callbacks: Dict[str, Callable[[Decimal], Any]] = {}
-        self.fill_callbacks: Dict[str, Callable] = {}
-        self.order_update_callbacks: Dict[str, Callable] = {}
+        self._stopping = False
+
+        # Reconnect policy and recovery tracking
+        self.reconnect = reconnect
+        self.reconnect_initial_delay = reconnect_initial_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.stale_after_seconds = STALE_AFTER_SECONDS
+        self._last_frame_at = time.monotonic()
+        self._frame_received_ns = 0  # time.monotonic_ns() of the frame being dispatched
+        self.reconnect_callbacks: List[Callable[[], Any]] = []  # Called after resubscribe and backfill
+        self.last_fill_time_ms: Dict[str, int] = {}  # Per lower-cased user
+        self.reconnects = 0
+        self.backfilled_fills = 0
+        self.last_recovery_seconds: Optional[float] = None
+        self.startup_time = datetime.now()  # Backfill start if no fill has been seen yet
+        self.fill_index = FillDeduplicator(capacity=fill_index_size)
+        self.fill_history_seeded: Set[str] = set()  # Users whose first snapshot seeded the index
+        self.seeded_fills = 0
+        self.recorder = recorder
+
+        # Subscribers of fills (per symbol) and order updates (per lower-cased user)
+        self.fill_callbacks: Dict[str, List[Callable]] = {}
+        self.order_update_callbacks: Dict[str, List[Callable]] = {}
+        self.order_updates_user: Optional[str] = None  # The one user whose order updates this connection carries
+
+        # Dispatch table: route key -> shared exchange subscription and its subscribers
+        self.routes: Dict[RouteKey, Route] = {}
+
+        # Hand-off between the reader and the consumers: a conflated price slot per price subscriber,
+        # one lossless queue so fills and order updates are handled in arrival order
+        self.event_queue = LosslessQueue(maxsize=event_queue_size)
 
         # Task management
         self.listener_task: Optional[asyncio.Task] = None
+        self.ping_task: Optional[asyncio.Task] = None
+        self.consumer_tasks: List[asyncio.Task] = []
 
         # Track last price log time for periodic logging
         self._last_price_log: Dict[str, datetime] = {}
         self._last_heartbeat_log = datetime.now()
 
     async def connect(self) -> bool:
-        """Establishes the WebSocket connection using the SDK."""
+        """Establishes the WebSocket connection."""
         try:
-            logger.info("Connecting to Hyperliquid WebSocket via SDK...")
+            logger.info(f"Connecting to Hyperliquid WebSocket at {self.ws_url}...")
 
-            # Initialize Info with WebSocket support
-            # SDK expects True for mainnet, False for testnet
-            self.info = Info(self.mainnet, skip_ws=False)
+            self.ws = await ws_connect(self.ws_url)
             self.is_connected = True
+            self._start_consumer(self._consume_events())
+            if self.recorder:
+                self.recorder.start()
 
             logger.success("Successfully connected to Hyperliquid WebSocket")
             return True
@@ -60,102 +204,201 @@ class HyperliquidSDKWebSocketClient:
         """Disconnects the WebSocket connection."""
         logger.info("Disconnecting from Hyperliquid WebSocket...")
 
+        self._stopping = True
         self.is_connected = False
 
-        if self.listener_task:
-            self.listener_task.cancel()
-            try:
-                await self.listener_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self.ping_task, self.listener_task, *self.consumer_tasks):
+            if task and task is not asyncio.current_task():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        self.consumer_tasks.clear()
 
-        if self.info:
-            # SDK handles WebSocket disconnection internally
-            pass
+        if self.recorder:
+            await self.recorder.stop()
+
+        if self.ws:
+            await self.ws.close()
+            self.ws = None
 
         logger.info("Disconnected from Hyperliquid WebSocket")
 
-    async def subscribe_to_order_updates(self, user_address: str, order_callback: callable = None) -> bool:
+    async def _acquire(self, subscription: Dict[str, Any], handler: Callable[[Route, Any], Awaitable[None]]) -> Route:
+        """
+        Take a reference on the route for a subscription, subscribing on the exchange for the first one.
+
+        Args:
+            subscription: Subscription object, e.g. {"type": "trades", "coin": "ETH"}
+            handler: Coroutine function called with the route and each of its messages
+
+        Returns:
+            The shared route
+        """
+        key = route_key(subscription)
+        route = self.routes.get(key)
+        if route is None:
+            route = Route(subscription, handler)
+            self.routes[key] = route
+            await self.ws.send(json.dumps({"method": "subscribe", "subscription": subscription}))
+        route.refs += 1
+        return route
+
+    async def _release(self, key: RouteKey) -> None:
+        """Drop a reference on a route, unsubscribing on the exchange after the last one"""
+        route = self.routes.get(key)
+        if route is None:
+            return
+
+        route.refs -= 1
+        if route.refs > 0:
+            return
+
+        del self.routes[key]
+        if key == ("orderUpdates", self.order_updates_user):
+            self.order_updates_user = None
+        if self.is_connected and self.ws:
+            try:
+                await self.ws.send(json.dumps({"method": "unsubscribe", "subscription": route.subscription}))
+            except Exception as e:
+                # The route is gone either way; a reconnect will not resubscribe it
+                logger.warning(f"Failed to unsubscribe from {key}: {e}")
+
+    async def unsubscribe(self, subscription: FeedSubscription) -> None:
+        """
+        Release everything a subscribe_* call registered.
+
+        Args:
+            subscription: Handle returned by the subscribe_* call
+        """
+        if subscription.fill_callback:
+            callbacks = self.fill_callbacks.get(subscription.fill_symbol, [])
+            if subscription.fill_callback in callbacks:
+                callbacks.remove(subscription.fill_callback)
+            if not callbacks:
+                self.fill_callbacks.pop(subscription.fill_symbol, None)
+
+        if subscription.order_callback:
+            callbacks = self.order_update_callbacks.get(subscription.order_user, [])
+            if subscription.order_callback in callbacks:
+                callbacks.remove(subscription.order_callback)
+            if not callbacks:
+                self.order_update_callbacks.pop(subscription.order_user, None)
+
+        sink = subscription.price_sink
+        if sink:
+            route = self.routes.get(subscription.route_key)
+            if route and sink in route.sinks:
+                route.sinks.remove(sink)
+            if sink.task:
+                sink.task.cancel()
+                if sink.task in self.consumer_tasks:
+                    self.consumer_tasks.remove(sink.task)
+
+        if subscription.route_key:
+            await self._release(subscription.route_key)
+            subscription.route_key = None
+
+    def _enqueue(self, handler: Callable[[Any], Awaitable[None]]) -> Callable[[Route, Any], Awaitable[None]]:
+        """Wrap a handler so the reader only queues its messages for the event consumer"""
+        async def enqueue(route, data):
+            await self.event_queue.put((handler, data))
+        return enqueue
+
+    def add_reconnect_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Call a function after every recovered connection (after resubscribe and backfill).
+
+        Args:
+            callback: Function without arguments, e.g. a cache invalidation
+        """
+        self.reconnect_callbacks.append(callback)
+
+    def remove_reconnect_callback(self, callback: Callable[[], Any]) -> None:
+        """Stop calling a function registered with add_reconnect_callback()"""
+        if callback in self.reconnect_callbacks:
+            self.reconnect_callbacks.remove(callback)
+
+    async def subscribe_to_order_updates(self, user_address: str, order_callback: callable = None) -> Optional[FeedSubscription]:
         """
         Subscribe to order updates (placements, cancellations, status changes).
 
         Args:
             user_address: The wallet address to monitor for order updates.
             order_callback: Optional callback for order update events.
+
+        Returns:
+            Handle for unsubscribe(), or None if the subscription failed
         """
-        if not self.is_connected or not self.info:
+        if not self.is_connected or not self.ws:
             logger.error("WebSocket not connected. Call connect() first.")
-            return False
+            return None
+
+        # orderUpdates messages do not name the user, so one connection can only carry one user's
+        user = user_address.lower()
+        if self.order_updates_user not in (None, user):
+            logger.error(
+                f"Connection already carries order updates for {self.order_updates_user}; "
+                f"use a separate connection for {user_address}"
+            )
+            return None
 
         try:
+            route = await self._acquire(
+                {"type": "orderUpdates", "user": user_address},
+                self._enqueue(functools.partial(self._handle_order_updates, user))
+            )
+            self.order_updates_user = user
+
             # Store the callback
             if order_callback:
-                self.order_update_callbacks[user_address] = order_callback
+                self.order_update_callbacks.setdefault(user, []).append(order_callback)
 
-            # Subscribe to order updates using the SDK
-            subscription = {"type": "orderUpdates", "user": user_address}
-
-            def handle_order_updates(data):
-                """Handle incoming order update data"""
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.run_coroutine_threadsafe(self._handle_order_updates(data), loop)
-                    else:
-                        asyncio.run(self._handle_order_updates(data))
-                except RuntimeError:
-                    self._handle_order_updates_sync(data)
-
-            self.info.subscribe(subscription, handle_order_updates)
-            logger.info(f"Subscribed to order updates for address: {user_address}")
-            return True
+            logger.info(f"Subscribed to order updates for address: {user_address} ({route.refs} subscribers)")
+            return FeedSubscription(
+                route_key=route_key(route.subscription), order_user=user, order_callback=order_callback
+            )
 
         except Exception as e:
             logger.error(f"Failed to subscribe to order updates: {e}")
-            return False
+            return None
 
-    async def subscribe_to_user_fills(self, user_address: str) -> bool:
+    async def subscribe_to_user_fills(self, user_address: str) -> Optional[FeedSubscription]:
         """
         Subscribe to user fills (order executions).
 
         Args:
             user_address: The wallet address to monitor for fills.
+
+        Returns:
+            Handle for unsubscribe(), or None if the subscription failed
         """
-        if not self.is_connected or not self.info:
+        if not self.is_connected or not self.ws:
             logger.error("WebSocket not connected. Call connect() first.")
-            return False
+            return None
 
         try:
             # Store the address for potential resubscription
             self.user_address = user_address
 
-            # Subscribe to user fills using the SDK
-            subscription = {"type": "userFills", "user": user_address}
-
-            def handle_user_fills(data):
-                """Handle incoming user fill data"""
-                # SDK runs callbacks in a thread without event loop
-                # We need to schedule the coroutine in the main loop
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.run_coroutine_threadsafe(self._handle_user_fills(data), loop)
-                    else:
-                        # If no loop is running, call synchronously
-                        asyncio.run(self._handle_user_fills(data))
-                except RuntimeError:
-                    # No event loop in thread, process synchronously
-                    self._handle_user_fills_sync(data)
-
-            self.info.subscribe(subscription, handle_user_fills)
-            logger.info(f"Subscribed to user fills for address: {user_address}")
-            return True
+            route = await self._acquire({"type": "userFills", "user": user_address}, self._enqueue(self._handle_user_fills))
+            logger.info(f"Subscribed to user fills for address: {user_address} ({route.refs} subscribers)")
+            return FeedSubscription(route_key=route_key(route.subscription))
 
         except Exception as e:
             logger.error(f"Failed to subscribe to user fills: {e}")
-            return False
-
-    async def subscribe_to_trades(self, symbol: str, price_callback: callable = None, fill_callback: callable = None) -> bool:
+            return None
+
+    async def subscribe_to_trades(
+        self,
+        symbol: str,
+        price_callback: callable = None,
+        fill_callback: callable = None,
+        path_callback: callable = None,
+        price_bucket: Optional[Callable[[float], Any]] = None
+    ) -> Optional[FeedSubscription]:
         """
         Subscribes to the public trades channel for a given symbol.
 
@@ -163,126 +406,434 @@ class HyperliquidSDKWebSocketClient:
             symbol: The asset symbol (e.g., "ETH").
             price_callback: A function to call with the latest trade price.
             fill_callback: A function to handle order fills for this symbol.
+            path_callback: A function to call with the ordered price extremes since the last call
+                (ending with the latest price); used instead of price_callback when given.
+            price_bucket: Maps a float price to its bucket (e.g. unit) so the path keeps only bucket crossings.
+
+        Returns:
+            Handle for unsubscribe(), or None if the subscription failed
         """
-        if not self.is_connected or not self.info:
+        if not self.is_connected or not self.ws:
             logger.error("WebSocket not connected. Call connect() first.")
-            return False
+            return None
 
         try:
-            # Store callbacks
-            if price_callback:
-                self.price_callbacks[symbol] = price_callback
-
+            subscription = FeedSubscription()
             if fill_callback:
-                self.fill_callbacks[symbol] = fill_callback
+                self.fill_callbacks.setdefault(symbol, []).append(fill_callback)
+                subscription.fill_symbol, subscription.fill_callback = symbol, fill_callback
+
+            # Without a price consumer (e.g. prices come from the book) only the fill callback is needed
+            if not (price_callback or path_callback):
+                logger.info(f"Registered fill callback for {symbol}")
+                return subscription
+
+            route = await self._acquire({"type": "trades", "coin": symbol}, self._handle_trades)
+            subscription.route_key = route_key(route.subscription)
+            subscription.price_sink = self._add_price_sink(
+                route, PriceSource.LAST_TRADE, price_callback, path_callback, price_bucket
+            )
+            logger.info(f"Subscribed to trades for {symbol} ({route.refs} subscribers)")
+            return subscription
 
-            # Subscribe to trades using the SDK
-            subscription = {"type": "trades", "coin": symbol}
+        except Exception as e:
+            logger.error(f"Failed to subscribe to {symbol} trades: {e}")
+            return None
+
+    async def subscribe_to_book(
+        self,
+        symbol: str,
+        source: PriceSource = PriceSource.MID,
+        price_callback: callable = None,
+        path_callback: callable = None,
+        price_bucket: Optional[Callable[[float], Any]] = None,
+        channel: str = "bbo"
+    ) -> Optional[FeedSubscription]:
+        """
+        Subscribes to the top of the book for a given symbol and feeds the chosen side to the price callbacks.
 
-            def handle_trades(data):
-                """Handle incoming trade data"""
-                # SDK runs callbacks in a thread without event loop
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.run_coroutine_threadsafe(self._handle_trades(symbol, data), loop)
-                    else:
-                        asyncio.run(self._handle_trades(symbol, data))
-                except RuntimeError:
-                    # No event loop in thread, process synchronously
-                    self._handle_trades_sync(symbol, data)
-
-            self.info.subscribe(subscription, handle_trades)
-            logger.info(f"Subscribed to trades for {symbol}")
-            return True
+        Args:
+            symbol: The asset symbol (e.g., "ETH").
+            source: PriceSource.MID, BID or ASK.
+            price_callback: A function to call with the latest book price.
+            path_callback: A function to call with the ordered price extremes since the last call
+                (ending with the latest price); used instead of price_callback when given.
+            price_bucket: Maps a float price to its bucket (e.g. unit) so the path keeps only bucket crossings.
+            channel: "bbo" (best bid/offer only) or "l2Book" (full book snapshots).
+
+        Returns:
+            Handle for unsubscribe(), or None if the subscription failed
+        """
+        if not self.is_connected or not self.ws:
+            logger.error("WebSocket not connected. Call connect() first.")
+            return None
+
+        if source is PriceSource.LAST_TRADE or channel not in ("bbo", "l2Book"):
+            logger.error(f"Cannot drive prices from {channel} with source {source.value}")
+            return None
+
+        try:
+            route = await self._acquire({"type": channel, "coin": symbol}, self._handle_book)
+            sink = self._add_price_sink(route, source, price_callback, path_callback, price_bucket)
+            logger.info(f"Subscribed to {channel} for {symbol} ({source.value} price, {route.refs} subscribers)")
+            return FeedSubscription(route_key=route_key(route.subscription), price_sink=sink)
 
         except Exception as e:
-            logger.error(f"Failed to subscribe to {symbol} trades: {e}")
-            return False
+            logger.error(f"Failed to subscribe to {symbol} {channel}: {e}")
+            return None
+
+    def _add_price_sink(
+        self,
+        route: Route,
+        source: PriceSource,
+        price_callback: Optional[Callable],
+        path_callback: Optional[Callable],
+        price_bucket: Optional[Callable[[float], Any]]
+    ) -> PriceSink:
+        """Give a subscriber its own conflating slot and consumer on a price route"""
+        sink = PriceSink(ConflatingPriceSlot(bucket=price_bucket), price_callback, path_callback, source)
+        sink.task = self._start_consumer(self._consume_prices(route.subscription["coin"], sink))
+        route.sinks.append(sink)
+        return sink
 
     async def listen(self):
         """
-        Main listening loop. The SDK handles WebSocket messages internally via callbacks.
-        This method just keeps the connection alive.
+        Main listening loop. Reads frames from the connection and dispatches them to the
+        subscription handlers on this event loop. When the connection drops it is
+        re-established (if reconnect is enabled) until disconnect() is called.
         """
-        if not self.is_connected or not self.info:
+        if not self.is_connected or not self.ws:
             logger.error("WebSocket not connected.")
             return
 
-        logger.info("Starting WebSocket listener with Hyperliquid SDK...")
+        logger.info("Starting WebSocket listener...")
 
-        # Create keep-alive task
-        self.listener_task = asyncio.create_task(self._keep_alive_loop())
+        self.ping_task = asyncio.create_task(self._keep_alive_loop())
+        self.listener_task = asyncio.current_task()
 
         try:
-            # Keep the listener running
-            await self.listener_task
+            while True:
+                await self._read_frames()
+                if self._stopping or not self.reconnect:
+                    break
+                if not await self._reconnect():
+                    break
         except asyncio.CancelledError:
             logger.info("WebSocket listener cancelled")
-        except Exception as e:
-            logger.error(f"Error in WebSocket listener: {e}")
         finally:
+            self.is_connected = False
+            if self.ping_task:
+                self.ping_task.cancel()
             logger.warning("WebSocket listener stopped")
 
+    async def _read_frames(self) -> None:
+        """Dispatch frames until the connection closes or fails (the keep-alive loop closes a silent one)."""
+        self._last_frame_at = time.monotonic()
+        try:
+            recorder = self.recorder
+            async for message in self.ws:
+                self._last_frame_at = time.monotonic()
+                self._frame_received_ns = time.monotonic_ns()
+                if recorder:
+                    recorder.record(message)
+                await self._dispatch(message)
+        except ConnectionClosed as e:
+            if not self._stopping:
+                logger.error(f"WebSocket connection closed: {e}")
+        except Exception as e:
+            logger.error(f"Error in WebSocket listener: {e}")
+
+        self.is_connected = False
+        if self.ws and not self._stopping:
+            try:
+                await self.ws.close()
+            except Exception:
+                pass
+
+    async def _reconnect(self) -> bool:
+        """
+        Re-establish the connection with exponential backoff, resubscribe every channel
+        and backfill fills missed during the outage.
+
+        Returns:
+            True once recovered, False if disconnect() was called meanwhile
+        """
+        started = time.monotonic()
+        delay = self.reconnect_initial_delay
+        attempt = 0
+
+        while not self._stopping:
+            attempt += 1
+            try:
+                self.ws = await ws_connect(self.ws_url)
+                self.is_connected = True
+
+                # A connection that drops while resubscribing is retried like one that never opened
+                for route in list(self.routes.values()):
+                    await self.ws.send(json.dumps({"method": "subscribe", "subscription": route.subscription}))
+
+                await self._backfill_fills()
+                break
+            except Exception as e:
+                self.is_connected = False
+                if self.ws:
+                    try:
+                        await self.ws.close()
+                    except Exception:
+                        pass
+
+                # Full jitter keeps many clients from reconnecting in lockstep
+                wait = random.uniform(delay / 2, delay)
+                logger.warning(f"Reconnect attempt {attempt} failed: {e} - retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, self.reconnect_max_delay)
+        else:
+            return False
+
+        for callback in list(self.reconnect_callbacks):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in reconnect callback: {e}")
+
+        self.reconnects += 1
+        self.last_recovery_seconds = time.monotonic() - started
+        logger.success(
+            f"WebSocket recovered in {self.last_recovery_seconds:.2f}s after {attempt} attempt(s), "
+            f"{len(self.routes)} channels resubscribed"
+        )
+        return True
+
+    async def _backfill_fills(self) -> None:
+        """Fetch fills since the last one seen, for every subscribed user, and replay them through the fill handler."""
+        if not self.fill_callbacks:
+            return
+
+        users = [route.subscription["user"] for route in self.routes.values() if route.subscription["type"] == "userFills"]
+        for user in users:
+            # Inclusive of the last seen timestamp: fills already delivered are dropped by the index
+            start_ms = self.last_fill_time_ms.get(user.lower())
+            if start_ms is None:
+                start_ms = int(self.startup_time.timestamp() * 1000) - BACKFILL_MARGIN_MS
+
+            try:
+                fills = await self._fetch_fills_since(user, start_ms)
+            except Exception as e:
+                logger.error(f"Fill backfill for {user} failed: {e}")
+                continue
+
+            if fills:
+                logger.warning(f"Backfilling {len(fills)} fills missed while disconnected for {user}")
+                self.backfilled_fills += len(fills)
+                await self.event_queue.put((self._handle_user_fills, {
+                    "user": user, "fills": sorted(fills, key=lambda f: f.get("time", 0))
+                }))
+
+    async def _fetch_fills_since(self, user: str, start_ms: int) -> List[Dict[str, Any]]:
+        """
+        Get a user's fills from start_ms until now over REST.
+
+        Args:
+            user: Wallet address
+            start_ms: Start of the window in milliseconds since the epoch
+
+        Returns:
+            Fills in the same shape as the userFills channel
+        """
+        async with httpx.AsyncClient(base_url=self.api_url, timeout=10.0) as http:
+            response = await http.post("/info", json={
+                "type": "userFillsByTime",
+                "user": user,
+                "startTime": start_ms,
+                "endTime": int(time.time() * 1000),
+            })
+            response.raise_for_status()
+            return response.json() or []
+
+    async def _dispatch(self, message: str) -> None:
+        """
+        Decode one frame and hand it to the handler of its route.
+
+        Args:
+            message: Raw text frame
+        """
+        if message == "Websocket connection established.":
+            return
+
+        try:
+            ws_msg = loads(message)
+            channel = ws_msg.get("channel")
+        except Exception as e:
+            logger.error(f"Undecodable WebSocket message: {e}")
+            return
+
+        # pong, subscriptionResponse and anything we never subscribe to have no route
+        if channel not in ROUTE_KEYS:
+            if channel == "error":
+                logger.error(f"WebSocket error message: {ws_msg.get('data')}")
+            return
+
+        key_of = ROUTE_KEYS[channel]
+        if key_of is None:
+            key = (channel, self.order_updates_user or "")
+        else:
+            try:
+                key = (channel, key_of(ws_msg["data"]))
+            except (KeyError, IndexError, TypeError, AttributeError):
+                logger.debug(f"WebSocket {channel} message without a routing key")
+                return
+
+        route = self.routes.get(key)
+        if route is None:
+            logger.debug(f"WebSocket message from an unexpected subscription: {key}")
+            return
+
+        await route.handler(route, ws_msg)
+
     async def _keep_alive_loop(self):
-        """Keep the connection alive and let SDK handle events"""
-        while self.is_connected:
+        """
+        Send application-level pings so the server keeps the connection open, and close
+        a connection that has gone silent so the reader notices and reconnects.
+        """
+        last_ping = time.monotonic()
+        while not self._stopping:
             try:
-                # The SDK handles WebSocket messages internally via callbacks
-                # We just need to keep the loop running
-                await asyncio.sleep(30)  # Periodic check
+                await asyncio.sleep(HEALTH_CHECK_SECONDS)
+                if not self.is_connected:
+                    continue
+
+                now = time.monotonic()
+                if now - self._last_frame_at > self.stale_after_seconds:
+                    logger.error(f"No WebSocket frames for {now - self._last_frame_at:.0f}s - closing dead connection")
+                    await self.ws.close()
+                elif now - last_ping >= PING_INTERVAL_SECONDS:
+                    await self.ws.send(json.dumps({"method": "ping"}))
+                    last_ping = now
 
             except asyncio.CancelledError:
-                logger.warning("Keep-alive loop cancelled")
                 break
             except Exception as e:
-                logger.error(f"Error in keep-alive loop: {e}")
-                await asyncio.sleep(5)
+                # A dead connection is detected by the reader, which reconnects
+                logger.warning(f"Keep-alive ping failed: {e}")
 
-    async def _handle_trades(self, symbol: str, data):
-        """Handle incoming trade data"""
+    async def _handle_trades(self, route: Route, data):
+        """Handle incoming trade data: offer every print to each subscriber's conflating price slot"""
+        symbol = route.subscription["coin"]
         try:
-            # logger.info(f"RAW TRADE DATA ({symbol}): {data}")
             if not data:
                 return
 
-            # Extract trades from SDK response format {'channel': 'trades', 'data': [...]}
+            # Extract trades from the message envelope {'channel': 'trades', 'data': [...]}
             if isinstance(data, dict) and 'data' in data:
                 trades = data['data']
             else:
                 trades = data if isinstance(data, list) else [data]
-            # Process trades silently
-
-            # Process only the last trade to prevent rapid updates
-            if trades:
-                trade = trades[-1]
-
-                # Extract price from trade data
-                price_str = trade.get("px")
-                if price_str:
-                    price = Decimal(str(price_str))
-                    # Process price silently
-
-                    # Call price callback if registered
-                    if symbol in self.price_callbacks and self.price_callbacks[symbol]:
-                        callback = self.price_callbacks[symbol]
-                        # Call callback silently
-                        # Handle both sync and async callbacks
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(price)
-                        else:
-                            callback(price)
-                    else:
-                        logger.warning(f"⚠️ No price callback registered for {symbol}")
 
-                    # No periodic logging - only log on first connection
-                    if symbol not in self._last_price_log:
-                        self._last_price_log[symbol] = datetime.now()
-                        logger.info(f"{symbol} price feed connected")
+            # Every print goes in so the batch high/low covers the whole message;
+            # each consumer only wakes once for whatever has accumulated.
+            # Prices are decoded once for all subscribers and stay floats until they reach a callback.
+            prices = [float(trade["px"]) for trade in trades if trade.get("px")]
+            received_ns, exchange_ms = self._frame_received_ns, trades[0].get("time") if trades else None
+            for sink in route.sinks:
+                put = sink.slot.put
+                for price in prices:
+                    put(price, received_ns, exchange_ms)
+
+            # No periodic logging - only log on first connection
+            if symbol not in self._last_price_log:
+                self._last_price_log[symbol] = datetime.now()
+                logger.info(f"{symbol} price feed connected")
 
         except Exception as e:
             logger.error(f"Error handling trades for {symbol}: {e}")
 
+    async def _handle_book(self, route: Route, data):
+        """Handle incoming bbo/l2Book data: offer each subscriber's chosen top-of-book price to its price slot"""
+        symbol = route.subscription["coin"]
+        try:
+            if not data:
+                return
+
+            book = data.get("data", data) if isinstance(data, dict) else None
+            if not book:
+                return
+
+            bid, ask = top_of_book(book)
+            for sink in route.sinks:
+                price = book_price(bid, ask, sink.source)
+                if price is not None:
+                    sink.slot.put(price, self._frame_received_ns, book.get("time"))
+
+            if symbol not in self._last_price_log:
+                self._last_price_log[symbol] = datetime.now()
+                logger.info(f"{symbol} book price feed connected")
+
+        except Exception as e:
+            logger.error(f"Error handling book for {symbol}: {e}")
+
+    async def _consume_prices(self, symbol: str, sink: PriceSink):
+        """
+        Deliver conflated prices for one subscriber to its price callback, with a latency
+        trace for the batch bound in current_trace while the callback runs.
+        """
+        while True:
+            batch = await sink.slot.get()
+            if sink.path_callback:
+                callback, arg = sink.path_callback, [to_decimal(price) for price in batch.path]
+            else:
+                callback, arg = sink.price_callback, to_decimal(batch.last)
+            if not callback:
+                continue
+
+            received_ns = batch.received_ns or batch.decoded_ns
+            token = current_trace.set(LatencyTrace(
+                received_ns=received_ns,
+                decoded_ns=batch.decoded_ns,
+                exchange_ms=batch.exchange_ms,
+                received_wall_ns=time.time_ns() - (time.monotonic_ns() - received_ns),
+            ))
+            try:
+                # Handle both sync and async callbacks
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(arg)
+                else:
+                    callback(arg)
+            except Exception as e:
+                logger.error(f"Error in price callback for {symbol}: {e}")
+            finally:
+                current_trace.reset(token)
+
+    async def _consume_events(self):
+        """Process fills and order updates one at a time, in arrival order"""
+        while True:
+            handler, data = await self.event_queue.get()
+            await handler(data)
+
+    def _start_consumer(self, coro) -> asyncio.Task:
+        """Run a consumer task until disconnect() (or until its subscriber unsubscribes)"""
+        task = asyncio.create_task(coro)
+        self.consumer_tasks.append(task)
+        return task
+
+    def get_feed_stats(self) -> dict:
+        """Get hand-off queue statistics (depth, drops and conflation per price subscriber), routing and connection recovery stats"""
+        return {
+            "prices": {
+                f"{channel}:{coin}": [sink.slot.get_stats() for sink in route.sinks]
+                for (channel, coin), route in self.routes.items() if route.sinks
+            },
+            "events": self.event_queue.get_stats(),
+            "routes": {f"{channel}:{key}" if key else channel: route.refs for (channel, key), route in self.routes.items()},
+            "connection": {
+                "connected": self.is_connected,
+                "reconnects": self.reconnects,
+                "last_recovery_seconds": self.last_recovery_seconds,
+                "backfilled_fills": self.backfilled_fills,
+            },
+            "fills": {**self.fill_index.get_stats(), "seeded": self.seeded_fills},
+            "tape": self.recorder.get_stats() if self.recorder else None,
+        }
+
     async def _handle_user_fills(self, data):
         """Handle incoming user fill data"""
         try:
@@ -290,7 +841,22 @@ class HyperliquidSDKWebSocketClient:
             if not data:
                 return
 
-            # The SDK might return fills in different formats
+            # Unwrap the {"channel": "userFills", "data": {...}} envelope
+            if isinstance(data, dict) and "channel" in data:
+                data = data.get("data")
+
+            # Every (re)subscribe starts with a snapshot of recent fills; the
+            # de-duplication index lets through only the ones not delivered yet
+            is_snapshot = isinstance(data, dict) and bool(data.get("isSnapshot"))
+            user = data.get("user", "").lower() if isinstance(data, dict) else ""
+
+            # The first snapshot for a user is its fill history: it seeds the index instead of being
+            # delivered, except for fills made since this client started
+            seeding = is_snapshot and bool(user) and user not in self.fill_history_seeded
+            seed_before_ms = int(self.startup_time.timestamp() * 1000)
+            if seeding:
+                self.fill_history_seeded.add(user)
+
             fills = []
             if isinstance(data, dict):
                 # Check for fills array within dict
@@ -313,12 +879,16 @@ class HyperliquidSDKWebSocketClient:
                 oid = fill.get("oid")
                 time_ms = fill.get("time")
 
-                # Filter out old fills from before bot startup
-                if time_ms:
-                    fill_time = datetime.fromtimestamp(time_ms / 1000)
-                    if fill_time < self.startup_time:
-                        logger.info(f"Skipping old fill from {fill_time} (before startup {self.startup_time})")
-                        continue
+                # Remember where to backfill from after a disconnect
+                if time_ms and user and time_ms > self.last_fill_time_ms.get(user, 0):
+                    self.last_fill_time_ms[user] = time_ms
+
+                # Exactly once, whether it came live, in a snapshot or from a backfill
+                if not self.fill_index.add(fill):
+                    continue
+                if seeding and (time_ms or 0) < seed_before_ms:
+                    self.seeded_fills += 1
+                    continue
 
                 if coin and px and sz:
                     # Only process fills for symbols we're tracking
@@ -329,16 +899,16 @@ class HyperliquidSDKWebSocketClient:
                     size = abs(Decimal(str(sz)))
                     is_buy = side == "B" or float(sz) > 0
 
-                    logger.warning(
+                    # Fills still in a snapshot here were made while (re)subscribing
+                    log = logger.debug if is_snapshot else logger.warning
+                    log(
                         f"ORDER FILL: {coin} {'BUY' if is_buy else 'SELL'} "
                         f"{size} @ ${price:.2f} (Order ID: {oid})"
                     )
 
-                    # Call fill callback if registered
-                    if self.fill_callbacks[coin]:
-                        callback = self.fill_callbacks[coin]
-                        logger.info(f"Triggering fill callback for {coin}")
-                        logger.warning(f"📝 FILL CALLBACK: Passing order_id={oid} (type: {type(oid)})")
+                    # Every subscriber on the symbol gets the fill; each ignores orders it does not own
+                    for callback in list(self.fill_callbacks[coin]):
+                        log(f"📝 FILL CALLBACK: Passing order_id={oid} (type: {type(oid)})")
 
                         # Call with expected parameters
                         if asyncio.iscoroutinefunction(callback):
@@ -349,95 +919,8 @@ class HyperliquidSDKWebSocketClient:
         except Exception as e:
             logger.error(f"Error handling user fills: {e}")
 
-    def _handle_trades_sync(self, symbol: str, data):
-        """Synchronous version of _handle_trades for thread context"""
-        try:
-            # logger.info(f"RAW SYNC TRADE DATA ({symbol}): {data}")
-            if not data or not self.is_connected:
-                return
-
-            # Extract trades from SDK response format
-            if isinstance(data, dict) and 'data' in data:
-                trades = data['data']
-            else:
-                trades = data if isinstance(data, list) else [data]
-
-            if trades:
-                trade = trades[-1]
-                price_str = trade.get("px")
-                if price_str:
-                    price = Decimal(str(price_str))
-
-                    # Call price callback if registered (only if still connected)
-                    if self.is_connected and symbol in self.price_callbacks and self.price_callbacks[symbol]:
-                        try:
-                            self.price_callbacks[symbol](price)
-                        except Exception as e:
-                            if "no running event loop" not in str(e).lower():
-                                logger.error(f"Error calling price callback: {e}")
-
-                    # No periodic logging in sync handler either
-                    pass
-
-        except Exception as e:
-            logger.error(f"Error in sync trades handler for {symbol}: {e}")
-
-    def _handle_user_fills_sync(self, data):
-        """Synchronous version of _handle_user_fills for thread context"""
-        try:
-            # logger.info(f"RAW SYNC USER DATA: {data}")
-            if not data:
-                return
-
-            fills = []
-            if isinstance(data, dict):
-                if "fills" in data:
-                    fills = data["fills"]
-                else:
-                    fills = [data]
-            elif isinstance(data, list):
-                fills = data
-
-            for fill in fills:
-                if not isinstance(fill, dict):
-                    continue
-
-                coin = fill.get("coin")
-                px = fill.get("px")
-                sz = fill.get("sz")
-                side = fill.get("side")
-                oid = fill.get("oid")
-                time_ms = fill.get("time")
-
-                # Filter old fills
-                if time_ms:
-                    fill_time = datetime.fromtimestamp(time_ms / 1000)
-                    if fill_time < self.startup_time:
-                        continue
-
-                if coin and px and sz:
-                    if coin not in self.fill_callbacks:
-                        continue
-
-                    price = Decimal(str(px))
-                    size = abs(Decimal(str(sz)))
-                    is_buy = side == "B" or float(sz) > 0
-
-                    logger.warning(
-                        f"ORDER FILL: {coin} {'BUY' if is_buy else 'SELL'} "
-                        f"{size} @ ${price:.2f} (Order ID: {oid})"
-                    )
-
-                    if self.fill_callbacks[coin]:
-                        # Since we're in sync context, we can't await
-                        # The callback should be sync in this case
-                        self.fill_callbacks[coin](str(oid), price, size)
-
-        except Exception as e:
-            logger.error(f"Error in sync user fills handler: {e}")
-
-    async def _handle_order_updates(self, data):
-        """Handle incoming order update data"""
+    async def _handle_order_updates(self, user: str, data):
+        """Handle incoming order update data for one (lower-cased) user"""
         try:
             if not data:
                 return
@@ -476,55 +959,11 @@ class HyperliquidSDKWebSocketClient:
                         f"{sz}/{orig_sz} @ ${limit_px} | OID: {oid}"
                     )
 
-                    # Call callback if registered
-                    for user_address, callback in self.order_update_callbacks.items():
-                        if callback:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(order_data)
-                            else:
-                                callback(order_data)
-
-        except Exception as e:
-            logger.error(f"Error handling order updates: {e}")
-
-    def _handle_order_updates_sync(self, data):
-        """Synchronous version of _handle_order_updates for thread context"""
-        try:
-            if not data:
-                return
-
-            orders = []
-            if isinstance(data, dict) and "data" in data:
-                orders = data["data"]
-            elif isinstance(data, list):
-                orders = data
-            else:
-                orders = [data]
-
-            for order_data in orders:
-                if not isinstance(order_data, dict):
-                    continue
-
-                order = order_data.get("order", {})
-                status = order_data.get("status", "unknown")
-
-                coin = order.get("coin")
-                side = order.get("side")
-                limit_px = order.get("limitPx")
-                sz = order.get("sz")
-                oid = order.get("oid")
-                orig_sz = order.get("origSz")
-
-                if coin and limit_px and sz:
-                    logger.warning(
-                        f"[ORDER UPDATE] {status.upper()} | {coin} {side} "
-                        f"{sz}/{orig_sz} @ ${limit_px} | OID: {oid}"
-                    )
-
-                    # Call callback if registered (sync only)
-                    for user_address, callback in self.order_update_callbacks.items():
-                        if callback and not asyncio.iscoroutinefunction(callback):
+                    for callback in list(self.order_update_callbacks.get(user, [])):
+                        if asyncio.iscoroutinefunction(callback):
+                            await callback(order_data)
+                        else:
                             callback(order_data)
 
         except Exception as e:
-            logger.error(f"Error in sync order updates handler: {e}")
\ No newline at end of file
+            logger.error(f"Error handling order updates: {e}")
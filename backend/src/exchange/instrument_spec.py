@@ -0,0 +1,92 @@
+"""
+Instrument Spec
+Immutable per-symbol rounding rules built once from cached meta.
+
+Hyperliquid perp prices may have at most 5 significant figures and at most
+(6 - szDecimals) decimal places; integer prices are always accepted. Sizes are
+rounded to szDecimals decimal places. szDecimals is a SIZE precision - it is
+not a price tick, and deriving the price tick from it gets orders rejected.
+
+Quantization exponents are precomputed, so rounding a price is one
+Decimal.adjusted() and one quantize() with no float round trips.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, Tuple
+
+# Decimal places allowed in a perp price before subtracting szDecimals
+PERP_MAX_DECIMALS = 6
+PRICE_SIG_FIGS = 5
+
+# Quanta for exponents 0 down to -PERP_MAX_DECIMALS, indexed by -exponent
+_QUANTA: Tuple[Decimal, ...] = tuple(Decimal(1).scaleb(-e) for e in range(PERP_MAX_DECIMALS + 1))
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    """Rounding rules and identifiers for one perp market"""
+    symbol: str
+    asset_id: int
+    sz_decimals: int
+    max_leverage: int
+    price_decimals: int = field(init=False)
+    size_quantum: Decimal = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set once through object.__setattr__
+        object.__setattr__(self, "price_decimals", max(PERP_MAX_DECIMALS - self.sz_decimals, 0))
+        object.__setattr__(self, "size_quantum", _QUANTA[min(self.sz_decimals, PERP_MAX_DECIMALS)])
+
+    @classmethod
+    def from_meta(cls, asset_id: int, asset: Dict[str, Any]) -> "InstrumentSpec":
+        """
+        Build a spec from one entry of meta["universe"].
+
+        Args:
+            asset_id: Index of the asset in the universe
+            asset: Universe entry ({"name", "szDecimals", "maxLeverage", ...})
+
+        Returns:
+            InstrumentSpec for the asset
+        """
+        return cls(
+            symbol=asset["name"],
+            asset_id=asset_id,
+            sz_decimals=int(asset.get("szDecimals", 0)),
+            max_leverage=int(asset.get("maxLeverage", 1)),
+        )
+
+    def round_price(self, price: Decimal) -> Decimal:
+        """
+        Round a price to 5 significant figures and the market's decimal limit.
+
+        Args:
+            price: Price to round
+
+        Returns:
+            Price the exchange will accept
+        """
+        if not isinstance(price, Decimal):
+            price = Decimal(str(price))
+        if not price:
+            return price
+
+        # Exponent of the 5th significant digit, capped by the decimal limit,
+        # never coarser than 1 (integer prices are always valid)
+        exponent = min(max(price.adjusted() - (PRICE_SIG_FIGS - 1), -self.price_decimals), 0)
+        return price.quantize(_QUANTA[-exponent], rounding=ROUND_HALF_UP)
+
+    def round_size(self, size: Decimal) -> Decimal:
+        """
+        Round a size to szDecimals decimal places.
+
+        Args:
+            size: Size in base currency
+
+        Returns:
+            Size the exchange will accept
+        """
+        if not isinstance(size, Decimal):
+            size = Decimal(str(size))
+        return size.quantize(self.size_quantum, rounding=ROUND_HALF_UP)
@@ -0,0 +1,107 @@
+"""
+Market Data Decoding
+Fast path for decoding WebSocket frames.
+
+Frames are parsed with orjson (a project dependency); the standard json module
+is only a fallback for environments where it failed to install. Trade prices are carried as floats from the frame to the
+unit check: a Hyperliquid price has at most 6 decimals and few significant
+digits, so float(px) round-trips exactly through str() and scales exactly to
+integer ticks. Decimal is only built for prices that reach the strategy.
+
+Unit crossings can be driven by the last trade or by the top of the book
+(bbo or l2Book), which moves before the next print in thin markets.
+"""
+
+import json
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .instrument_spec import PERP_MAX_DECIMALS
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a dependency; this only guards a broken install
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON frame with the fastest available parser.
+
+    Args:
+        data: Raw text or binary frame
+
+    Returns:
+        Decoded message
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def to_decimal(price: float) -> Decimal:
+    """
+    Build the exact Decimal for a price that was parsed as a float.
+
+    Args:
+        price: Price parsed from an exchange price string
+
+    Returns:
+        Decimal equal to the original price string
+    """
+    return Decimal(repr(price))
+
+
+class PriceSource(Enum):
+    """Which market price drives unit-crossing detection"""
+    LAST_TRADE = "trade"
+    MID = "mid"
+    BID = "bid"  # Where resting sells get hit
+    ASK = "ask"  # Where resting buys get lifted
+
+
+def top_of_book(data: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Best bid and ask from a bbo or l2Book message payload.
+
+    Args:
+        data: {"coin", "time", "bbo": [bid, ask]} or {"coin", "time", "levels": [bids, asks]}
+
+    Returns:
+        (bid, ask) prices, None for an empty side
+    """
+    if "bbo" in data:
+        bid_level, ask_level = data["bbo"]
+    else:
+        bids, asks = data["levels"]
+        bid_level = bids[0] if bids else None
+        ask_level = asks[0] if asks else None
+
+    bid = float(bid_level["px"]) if bid_level else None
+    ask = float(ask_level["px"]) if ask_level else None
+    return bid, ask
+
+
+def book_price(bid: Optional[float], ask: Optional[float], source: PriceSource) -> Optional[float]:
+    """
+    Price for a book-based source.
+
+    Args:
+        bid: Best bid, or None
+        ask: Best ask, or None
+        source: MID, BID or ASK
+
+    Returns:
+        Price, or None if the side(s) it needs are empty
+    """
+    if source is PriceSource.BID:
+        return bid
+    if source is PriceSource.ASK:
+        return ask
+    if bid is None or ask is None:
+        return None
+    # A mid has at most one more decimal than the prices; rounding there keeps it exact through repr()
+    return round((bid + ask) / 2, PERP_MAX_DECIMALS + 1)
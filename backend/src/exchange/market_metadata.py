@@ -0,0 +1,230 @@
+"""
+Market Metadata Cache
+Per-symbol cache of Hyperliquid perp metadata (szDecimals, maxLeverage, asset id).
+Loaded once at startup and refreshed in the background so the order path never
+has to fetch meta from the exchange.
+
+The cache itself is transport-agnostic: the sync client hands it a fetch callable
+and lets it run a refresh thread, the async client fetches meta on its own loop
+and pushes the result in with update().
+"""
+
+import threading
+import time
+from typing import Optional, Dict, Any, Callable
+
+from loguru import logger
+
+from .instrument_spec import InstrumentSpec
+
+
+class MarketMetadataCache:
+    """
+    Symbol-keyed cache of the perp `universe` returned by `info.meta()`.
+    Thread-safe: the background refresh thread swaps the whole map atomically.
+    """
+
+    def __init__(self, fetch_meta: Optional[Callable[[], Dict[str, Any]]] = None, ttl_seconds: float = 300.0):
+        """
+        Initialize the metadata cache.
+
+        Args:
+            fetch_meta: Callable returning the raw meta response ({"universe": [...]}).
+                        Required for load(), get() reloads and the refresh thread.
+            ttl_seconds: Interval between background refreshes
+        """
+        self._fetch_meta = fetch_meta
+        self.ttl_seconds = ttl_seconds
+
+        self._markets: Dict[str, Dict[str, Any]] = {}
+        self._specs: Dict[str, InstrumentSpec] = {}
+        self._raw_meta: Optional[Dict[str, Any]] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+        # Background refresh
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def load(self) -> None:
+        """Fetch meta from the exchange and rebuild the symbol map."""
+        if self._fetch_meta is None:
+            raise RuntimeError("MarketMetadataCache has no fetch_meta; use update() instead")
+        self.update(self._fetch_meta())
+
+    def update(self, meta: Dict[str, Any]) -> None:
+        """
+        Rebuild the symbol map from a raw meta response.
+
+        Args:
+            meta: Raw meta response ({"universe": [...]})
+        """
+        markets = {}
+        specs = {}
+        for asset_id, asset in enumerate(meta.get("universe", [])):
+            name = asset.get("name")
+            if name:
+                # Keep the asset index alongside the exchange fields
+                markets[name] = {**asset, "assetId": asset_id}
+                specs[name] = InstrumentSpec.from_meta(asset_id, asset)
+
+        with self._lock:
+            self._markets = markets
+            self._specs = specs
+            self._raw_meta = meta
+            self._loaded_at = time.monotonic()
+            self.refreshes += 1
+
+        logger.debug(f"Market metadata loaded for {len(markets)} symbols")
+
+    @property
+    def raw_meta(self) -> Optional[Dict[str, Any]]:
+        """Last raw meta response, e.g. for seeding the SDK Exchange."""
+        return self._raw_meta
+
+    def lookup(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached market metadata for a symbol without ever fetching.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Market information, or None on a cache miss
+        """
+        market = self._markets.get(symbol)
+        if market is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return market
+
+    def get(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get cached market metadata for a symbol.
+        A miss triggers one synchronous reload (new listing or invalidated entry).
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Market information including szDecimals, maxLeverage and assetId
+
+        Raises:
+            ValueError if the symbol is not listed
+        """
+        market = self.lookup(symbol)
+        if market is not None:
+            return market
+
+        self.load()
+
+        market = self._markets.get(symbol)
+        if market is None:
+            raise ValueError(f"Market info not found for {symbol}")
+        return market
+
+    def lookup_spec(self, symbol: str) -> Optional[InstrumentSpec]:
+        """
+        Get the cached InstrumentSpec for a symbol without ever fetching.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            InstrumentSpec, or None on a cache miss
+        """
+        spec = self._specs.get(symbol)
+        if spec is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return spec
+
+    def get_spec(self, symbol: str) -> InstrumentSpec:
+        """
+        Get the cached InstrumentSpec for a symbol, reloading once on a miss.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            InstrumentSpec with precompiled price and size quantizers
+
+        Raises:
+            ValueError if the symbol is not listed
+        """
+        spec = self.lookup_spec(symbol)
+        if spec is not None:
+            return spec
+
+        self.load()
+
+        spec = self._specs.get(symbol)
+        if spec is None:
+            raise ValueError(f"Market info not found for {symbol}")
+        return spec
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+        Drop cached metadata so the next lookup reloads it.
+
+        Args:
+            symbol: Symbol to invalidate, or None to invalidate everything
+        """
+        with self._lock:
+            if symbol is None:
+                self._markets = {}
+                self._specs = {}
+                self._loaded_at = None
+            else:
+                markets = dict(self._markets)
+                markets.pop(symbol, None)
+                self._markets = markets
+                specs = dict(self._specs)
+                specs.pop(symbol, None)
+                self._specs = specs
+
+    def start_background_refresh(self) -> None:
+        """Start the daemon thread that reloads meta every ttl_seconds."""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            name="market-metadata-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_event.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout=1)
+            self._refresh_thread = None
+
+    def _refresh_loop(self) -> None:
+        """Reload meta on the TTL until stopped. Failures keep the previous map."""
+        while not self._stop_event.wait(self.ttl_seconds):
+            try:
+                self.load()
+            except Exception as e:
+                logger.warning(f"Market metadata refresh failed, keeping cached data: {e}")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        age = time.monotonic() - self._loaded_at if self._loaded_at is not None else None
+        return {
+            "symbols": len(self._markets),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "age_seconds": age,
+        }
@@ -0,0 +1,85 @@
+"""
+Streamed Price Provider
+Holds the latest price per symbol pushed in from the WebSocket trade feed, so the
+clients can size orders without an allMids REST round trip.
+
+A price older than max_age_seconds is treated as missing; callers then fall back
+to REST. Any object with a get_price(symbol) -> Optional[Decimal] method can be
+plugged into the clients in place of this one.
+"""
+
+import time
+from decimal import Decimal
+from typing import Dict, Optional, Protocol, Tuple
+
+
+class PriceProvider(Protocol):
+    """Anything the clients can ask for a local price before going to REST"""
+
+    def get_price(self, symbol: str) -> Optional[Decimal]:
+        ...
+
+
+class StreamedPriceProvider:
+    """
+    Latest streamed price per symbol with a staleness bound.
+    Updates are single tuple assignments, so the SDK's WebSocket thread can write
+    while the event loop reads.
+    """
+
+    def __init__(self, max_age_seconds: float = 2.0):
+        """
+        Initialize the provider.
+
+        Args:
+            max_age_seconds: Prices older than this are not served
+        """
+        self.max_age_seconds = max_age_seconds
+        self._prices: Dict[str, Tuple[Decimal, float]] = {}
+
+        # Counters
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+
+    def update(self, symbol: str, price: Decimal) -> None:
+        """
+        Record the latest price for a symbol.
+
+        Args:
+            symbol: Trading symbol
+            price: Latest traded price
+        """
+        self._prices[symbol] = (price, time.monotonic())
+
+    def get_price(self, symbol: str) -> Optional[Decimal]:
+        """
+        Get the latest price if it is fresh enough.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Latest price, or None if there is none or it is stale
+        """
+        entry = self._prices.get(symbol)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        price, received_at = entry
+        if time.monotonic() - received_at > self.max_age_seconds:
+            self.stale += 1
+            return None
+
+        self.hits += 1
+        return price
+
+    def get_stats(self) -> dict:
+        """Get provider statistics"""
+        return {
+            "symbols": len(self._prices),
+            "hits": self.hits,
+            "stale": self.stale,
+            "misses": self.misses,
+        }
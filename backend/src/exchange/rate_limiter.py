@@ -0,0 +1,226 @@
+"""
+Request Scheduler
+Weight-based token bucket with priority lanes in front of the exchange API.
+
+Hyperliquid limits REST traffic by request weight (1200 per minute per IP):
+an /exchange action weighs 1 + floor(batch_length / 40), a cheap /info read
+(allMids, clearinghouseState, l2Book, ...) weighs 2, and other /info reads
+weigh 20. When the bucket runs dry, waiting requests are released strictly
+by lane: cancels first, then risk-reducing orders, then new orders, then reads.
+Requests in the same lane are released in arrival order.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Deque, Dict, Optional
+
+from loguru import logger
+
+
+class Priority(IntEnum):
+    """Scheduling lanes, lowest value is served first"""
+    CANCEL = 0
+    REDUCE = 1
+    ORDER = 2
+    READ = 3
+
+
+# /info request types that weigh 2 instead of 20
+LIGHT_INFO_TYPES = frozenset({
+    "l2Book", "allMids", "clearinghouseState", "orderStatus", "spotClearinghouseState", "exchangeStatus",
+})
+
+
+def info_weight(payload: Dict[str, Any]) -> int:
+    """Rate-limit weight of an /info request"""
+    request_type = payload.get("type")
+    if request_type in LIGHT_INFO_TYPES:
+        return 2
+    if request_type == "userRole":
+        return 60
+    return 20
+
+
+def action_weight(action: Dict[str, Any]) -> int:
+    """Rate-limit weight of an /exchange action: 1 + floor(batch_length / 40)"""
+    batch = action.get("orders") or action.get("cancels") or action.get("modifies") or []
+    return 1 + len(batch) // 40
+
+
+def action_priority(action: Dict[str, Any]) -> Priority:
+    """
+    Lane for an /exchange action.
+    Cancels go first. Orders that only sell or only reduce a position come
+    next, because the strategy is long-biased and its sells are the exits.
+    Everything else is a new order.
+
+    Args:
+        action: Unsigned action dict
+
+    Returns:
+        Priority lane
+    """
+    action_type = action.get("type")
+    if action_type in ("cancel", "cancelByCloid"):
+        return Priority.CANCEL
+
+    if action_type == "order":
+        orders = action.get("orders", [])
+    elif action_type == "batchModify":
+        orders = [modify.get("order", {}) for modify in action.get("modifies", [])]
+    else:
+        return Priority.ORDER
+
+    if orders and all(order.get("r") or not order.get("b") for order in orders):
+        return Priority.REDUCE
+    return Priority.ORDER
+
+
+@dataclass
+class _Waiter:
+    """A queued request"""
+    weight: float
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class _WaitStats:
+    """Wait-time counters for one lane"""
+
+    def __init__(self):
+        self.count = 0
+        self.queued = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, wait: float) -> None:
+        self.count += 1
+        if wait > 0:
+            self.queued += 1
+        self.total += wait
+        if wait > self.max:
+            self.max = wait
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.count,
+            "queued": self.queued,
+            "mean_wait_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "max_wait_ms": self.max * 1000,
+        }
+
+
+class RequestScheduler:
+    """
+    Token bucket keyed on request weight, shared by every request a client makes.
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, capacity: float = 1200.0, refill_per_second: float = 20.0):
+        """
+        Initialize the scheduler.
+
+        Args:
+            capacity: Bucket size in weight units (burst allowance)
+            refill_per_second: Weight units restored per second (1200/min by default)
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lanes: Dict[Priority, Deque[_Waiter]] = {lane: deque() for lane in Priority}
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self._stats: Dict[Priority, _WaitStats] = {lane: _WaitStats() for lane in Priority}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    def _head(self) -> Optional[_Waiter]:
+        for lane in Priority:
+            if self._lanes[lane]:
+                return self._lanes[lane][0]
+        return None
+
+    async def acquire(self, weight: float, priority: Priority = Priority.READ) -> None:
+        """
+        Wait until the request may be sent and take its weight from the bucket.
+
+        Args:
+            weight: Rate-limit weight of the request
+            priority: Lane the request waits in
+        """
+        weight = min(weight, self.capacity)
+        self._refill()
+
+        if self._head() is None and self._tokens >= weight:
+            self._tokens -= weight
+            self._stats[priority].record(0.0)
+            return
+
+        waiter = _Waiter(weight, asyncio.get_running_loop().create_future(), time.monotonic())
+        self._lanes[priority].append(waiter)
+        self._schedule()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._lanes[priority]:
+                self._lanes[priority].remove(waiter)
+                self._schedule()
+            raise
+
+        self._stats[priority].record(time.monotonic() - waiter.enqueued_at)
+
+    def _dispatch(self) -> None:
+        """Release queued requests, in lane order, while the bucket covers them."""
+        self._wakeup = None
+        self._refill()
+
+        while True:
+            head = self._head()
+            if head is None or self._tokens < head.weight:
+                break
+            for lane in Priority:
+                if self._lanes[lane] and self._lanes[lane][0] is head:
+                    self._lanes[lane].popleft()
+                    break
+            self._tokens -= head.weight
+            if not head.future.done():
+                head.future.set_result(None)
+
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Arm a timer for when the bucket will cover the head of the queue."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        head = self._head()
+        if head is None:
+            return
+
+        delay = max(0.0, (head.weight - self._tokens) / self.refill_per_second)
+        if delay > 1.0:
+            logger.warning(f"Rate limit: next request waits {delay:.1f}s, queue depth {self.queue_depth()}")
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting"""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def get_stats(self) -> dict:
+        """Get queue-depth and wait-time statistics per lane"""
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 1),
+            "queue_depth": {lane.name.lower(): len(self._lanes[lane]) for lane in Priority},
+            "lanes": {lane.name.lower(): self._stats[lane].as_dict() for lane in Priority},
+        }
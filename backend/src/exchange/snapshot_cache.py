@@ -0,0 +1,214 @@
+"""
+Account Snapshot Cache
+Short-TTL, single-flight cache for per-account /info reads (clearinghouseState,
+openOrders). Balance, positions and open-order lookups made within the TTL share
+one parsed snapshot, and readers that arrive while a fetch is in flight wait for
+that fetch instead of issuing their own.
+
+Our own order actions and fills change the account, so the clients invalidate
+the cache after every exchange action and the strategy invalidates it when a
+fill or order update arrives. A fetch that was already in flight when the cache
+was invalidated still answers the readers already waiting on it but is not
+stored, and later readers start a fresh fetch instead of joining it: it may
+have been sent before our own action.
+
+SnapshotCache is for the thread-based sync client, AsyncSnapshotCache for the
+asyncio client.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class _Entry:
+    """A cached snapshot and when it was fetched"""
+    value: Any
+    fetched_at: float
+
+
+@dataclass
+class _Flight:
+    """A fetch in progress that other readers can wait on"""
+    generation: int
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class _SnapshotCacheBase:
+    """TTL bookkeeping and counters shared by the sync and async caches"""
+
+    def __init__(self, ttl_seconds: float = 1.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a snapshot is served before it is refetched
+        """
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: Dict[str, _Entry] = {}
+        self._generation = 0
+
+        # Counters
+        self.hits = 0
+        self.fetches = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def _fresh(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.ttl_seconds:
+            return entry
+        return None
+
+    def _store(self, key: str, value: Any, generation: int) -> None:
+        # Drop results that raced with an invalidation; they may predate our own action
+        if generation == self._generation:
+            self._entries[key] = _Entry(value, time.monotonic())
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached snapshots so the next read refetches.
+
+        Args:
+            key: Snapshot to invalidate, or None to invalidate everything
+        """
+        self._generation += 1
+        self.invalidations += 1
+        if key is None:
+            self._entries = {}
+        else:
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+        }
+
+
+class SnapshotCache(_SnapshotCacheBase):
+    """
+    Thread-safe snapshot cache. Concurrent callers for the same key share one fetch.
+    """
+
+    def __init__(self, ttl_seconds: float = 1.0):
+        super().__init__(ttl_seconds)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, _Flight] = {}
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a snapshot, fetching it at most once per TTL.
+
+        Args:
+            key: Snapshot name (e.g. "clearinghouseState")
+            fetch: Callable returning a fresh snapshot
+
+        Returns:
+            The cached or freshly fetched snapshot
+        """
+        with self._lock:
+            entry = self._fresh(key)
+            if entry is not None:
+                self.hits += 1
+                return entry.value
+
+            # A fetch started before the last invalidation may predate our own action
+            flight = self._inflight.get(key)
+            leader = flight is None or flight.generation != self._generation
+            if leader:
+                flight = _Flight(self._generation)
+                self._inflight[key] = flight
+                self.fetches += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            with self._lock:
+                self._store(key, flight.value, flight.generation)
+            return flight.value
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            super().invalidate(key)
+        logger.debug(f"Account snapshot invalidated: {key or 'all'}")
+
+
+class AsyncSnapshotCache(_SnapshotCacheBase):
+    """
+    Snapshot cache for a single event loop. Concurrent awaiters for the same key
+    share one fetch task.
+    """
+
+    def __init__(self, ttl_seconds: float = 1.0):
+        super().__init__(ttl_seconds)
+        self._inflight: Dict[str, Tuple[int, asyncio.Future]] = {}  # Per key: generation and fetch
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a snapshot, fetching it at most once per TTL.
+
+        Args:
+            key: Snapshot name (e.g. "clearinghouseState")
+            fetch: Coroutine function returning a fresh snapshot
+
+        Returns:
+            The cached or freshly fetched snapshot
+        """
+        entry = self._fresh(key)
+        if entry is not None:
+            self.hits += 1
+            return entry.value
+
+        # A fetch started before the last invalidation may predate our own action
+        flight = self._inflight.get(key)
+        if flight is not None and flight[0] == self._generation:
+            self.coalesced += 1
+            # Shield so one cancelled reader does not cancel the shared fetch
+            return await asyncio.shield(flight[1])
+
+        self.fetches += 1
+        flight = (self._generation, asyncio.ensure_future(self._fetch(key, fetch, self._generation)))
+        self._inflight[key] = flight
+        return await asyncio.shield(flight[1])
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        try:
+            value = await fetch()
+            self._store(key, value, generation)
+            return value
+        finally:
+            flight = self._inflight.get(key)
+            if flight is not None and flight[0] == generation:
+                del self._inflight[key]
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        super().invalidate(key)
+        logger.debug(f"Account snapshot invalidated: {key or 'all'}")
@@ -0,0 +1,178 @@
+"""
+Market Data Tape
+Append-only recording of every raw WebSocket frame, for replaying a session.
+
+The reader loop only appends (receive time, frame) to an in-memory buffer; a
+background task swaps the buffer out and compresses and writes it in a worker
+thread, so recording costs the hot path one deque append. Each batch is written
+as its own gzip member, so a file is readable up to the last complete batch
+even if the process dies. Files rotate once they reach a size limit.
+
+Line format (after decompression): "<receive time, ns since epoch>\\t<frame>\\n".
+"""
+
+import asyncio
+import gzip
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Iterator, Optional, Tuple, Union
+from loguru import logger
+
+TAPE_SUFFIX = ".tape.gz"
+
+
+class TapeRecorder:
+    """
+    Batched, rotating, compressed recorder of raw frames. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        prefix: str = "tape",
+        max_file_bytes: int = 64 * 1024 * 1024,
+        flush_interval: float = 1.0,
+        max_pending: int = 200_000
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            directory: Where tape files are written
+            prefix: File name prefix, e.g. the network or symbol
+            max_file_bytes: Compressed size after which a new file is started
+            flush_interval: Seconds between batch writes
+            max_pending: Frames buffered before the oldest are dropped (only if the disk falls behind)
+        """
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.max_file_bytes = max_file_bytes
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: Deque[Tuple[int, Union[str, bytes]]] = deque(maxlen=max_pending)
+        self._writer_task: Optional[asyncio.Task] = None
+        self._path: Optional[Path] = None
+        self._sequence = 0
+
+        # Counters
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.files = 0
+
+    def record(self, frame: Union[str, bytes]) -> None:
+        """
+        Buffer a frame with its receive time. Never blocks.
+
+        Args:
+            frame: Raw frame as received
+        """
+        if len(self._pending) == self.max_pending:
+            self.dropped += 1  # the deque evicts the oldest frame
+        self._pending.append((time.time_ns(), frame))
+        self.recorded += 1
+
+    def start(self) -> None:
+        """Start the background writer"""
+        if self._writer_task is None or self._writer_task.done():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        """Stop the background writer and write whatever is still buffered"""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write the buffered frames now (in a worker thread)"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, deque(maxlen=self.max_pending)
+        await asyncio.to_thread(self._write_batch, batch)
+
+    async def _write_loop(self) -> None:
+        """Write a batch every flush_interval"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Tape write failed: {e}")
+
+    def _write_batch(self, batch: Deque[Tuple[int, Union[str, bytes]]]) -> None:
+        """Compress and append a batch as one gzip member, rotating the file first if it is full"""
+        if self._path is None or self._path.stat().st_size >= self.max_file_bytes:
+            self._path = self._next_path()
+            self.files += 1
+
+        lines = []
+        for received_ns, frame in batch:
+            if isinstance(frame, bytes):
+                frame = frame.decode()
+            lines.append(f"{received_ns}\t{frame}\n")
+
+        with open(self._path, "ab") as f:
+            f.write(gzip.compress("".join(lines).encode(), compresslevel=6))
+
+        self.written += len(batch)
+        self.batches += 1
+
+    def _next_path(self) -> Path:
+        """Name of the next file: prefix, start time and a sequence number so names sort in order"""
+        self._sequence += 1
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.directory / f"{self.prefix}-{stamp}-{self._sequence:04d}{TAPE_SUFFIX}"
+        path.touch()
+        return path
+
+    def get_stats(self) -> dict:
+        """Get recording statistics"""
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "files": self.files,
+            "current_file": str(self._path) if self._path else None,
+        }
+
+
+def read_tape(path: Union[str, Path], prefix: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+    """
+    Stream recorded frames back in order.
+
+    Args:
+        path: A tape file, or a directory of them (read in name order)
+        prefix: Only read files with this prefix when path is a directory
+
+    Returns:
+        Iterator of (receive time in ns since epoch, raw frame)
+    """
+    path = Path(path)
+    if path.is_dir():
+        pattern = f"{prefix}-*{TAPE_SUFFIX}" if prefix else f"*{TAPE_SUFFIX}"
+        files = sorted(path.glob(pattern))
+    else:
+        files = [path]
+
+    for file in files:
+        with gzip.open(file, "rt") as f:
+            try:
+                for line in f:
+                    received_ns, frame = line.rstrip("\n").split("\t", 1)
+                    yield int(received_ns), frame
+            except (EOFError, gzip.BadGzipFile):
+                # A batch cut short by a crash; everything before it was returned
+                logger.warning(f"Tape {os.path.basename(file)} ends with an incomplete batch")
@@ -0,0 +1,103 @@
+"""
+WebSocket Multiplexer
+Shares one Hyperliquid WebSocket connection per network between any number of
+strategies.
+
+The first strategy to acquire a network connects its client and starts the
+listener; later ones get the same client and subscribe through it, so N grid
+strategies cost one socket and one reader. Channels requested by several
+strategies are subscribed once (the client reference-counts its routes), and
+the connection is closed when the last strategy releases it. Order updates do
+not name the wallet they belong to, so the strategies sharing a connection must
+trade from the same wallet.
+"""
+
+import asyncio
+from typing import Dict, Optional
+from loguru import logger
+
+from .hyperliquid_sdk_websocket import HyperliquidSDKWebSocketClient
+
+
+class WebSocketMultiplexer:
+    """
+    Owner of one shared WebSocket client per network.
+    """
+
+    def __init__(self, **client_options):
+        """
+        Initialize the multiplexer.
+
+        Args:
+            client_options: Keyword arguments for every HyperliquidSDKWebSocketClient it creates
+        """
+        self.client_options = client_options
+        self.clients: Dict[bool, HyperliquidSDKWebSocketClient] = {}
+        self.listeners: Dict[bool, asyncio.Task] = {}
+        self.users: Dict[bool, int] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, mainnet: bool) -> Optional[HyperliquidSDKWebSocketClient]:
+        """
+        Get the shared client for a network, connecting it for the first user.
+
+        Args:
+            mainnet: Whether to use mainnet (True) or testnet (False)
+
+        Returns:
+            Connected client with a running listener, or None if the connection failed
+        """
+        async with self._lock:
+            client = self.clients.get(mainnet)
+            if client is None:
+                client = HyperliquidSDKWebSocketClient(mainnet=mainnet, **self.client_options)
+                if not await client.connect():
+                    return None
+                self.clients[mainnet] = client
+                self.listeners[mainnet] = asyncio.create_task(client.listen())
+                self.users[mainnet] = 0
+
+            self.users[mainnet] += 1
+            logger.info(f"Shared {'mainnet' if mainnet else 'testnet'} WebSocket: {self.users[mainnet]} users")
+            return client
+
+    async def release(self, mainnet: bool) -> None:
+        """
+        Give back a client from acquire(), disconnecting it after the last user.
+
+        Args:
+            mainnet: Network the client was acquired for
+        """
+        async with self._lock:
+            if mainnet not in self.clients:
+                return
+
+            self.users[mainnet] -= 1
+            if self.users[mainnet] > 0:
+                return
+
+            client = self.clients.pop(mainnet)
+            listener = self.listeners.pop(mainnet)
+            del self.users[mainnet]
+
+            await client.disconnect()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+
+    async def close(self) -> None:
+        """Disconnect every client regardless of remaining users"""
+        for mainnet in list(self.clients):
+            self.users[mainnet] = 1
+            await self.release(mainnet)
+
+    def get_stats(self) -> dict:
+        """Get users and feed statistics per network"""
+        return {
+            "mainnet" if mainnet else "testnet": {
+                "users": self.users[mainnet],
+                **client.get_feed_stats(),
+            }
+            for mainnet, client in self.clients.items()
+        }
@@ -5,6 +5,7 @@ Main entry point with CLI interface.
 
 import asyncio
 import argparse
+import signal
 from decimal import Decimal
 from pathlib import Path
 import sys
@@ -14,8 +15,10 @@ from loguru import logger
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.exchange.wallet_config import WalletConfig
-from src.exchange.hyperliquid_sdk import HyperliquidClient
-from src.exchange.hyperliquid_sdk_websocket import HyperliquidSDKWebSocketClient
+from src.exchange.hyperliquid_async import AsyncHyperliquidClient
+from src.exchange.ws_multiplexer import WebSocketMultiplexer
+from src.exchange.tape_recorder import TapeRecorder
+from src.exchange.market_data import PriceSource
 from src.strategy.grid_strategy import GridTradingStrategy
 from src.strategy.data_models import StrategyConfig
 
@@ -52,13 +55,19 @@ def parse_arguments():
         help="Trading symbol (e.g., ETH, BTC, SOL)"
     )
 
-    parser.add_argument(
+    unit_size = parser.add_mutually_exclusive_group(required=True)
+    unit_size.add_argument(
         "--unit-size-usd",
         type=float,
-        required=True,
         dest="unit_size_usd",
         help="USD amount per unit (e.g., 1.0 for $1 moves on SOL, 100 for $100 moves on BTC)"
     )
+    unit_size.add_argument(
+        "--unit-size-pct",
+        type=float,
+        dest="unit_size_pct",
+        help="Percent per unit instead, for a geometric grid (e.g., 0.5 for 0.5%% moves at any price)"
+    )
 
     parser.add_argument(
         "--position-value-usd",
@@ -84,6 +93,48 @@ def parse_arguments():
         help="Strategy type (currently only 'long' is implemented)"
     )
 
+    parser.add_argument(
+        "--price-source",
+        type=str,
+        default=PriceSource.LAST_TRADE.value,
+        choices=[source.value for source in PriceSource],
+        dest="price_source",
+        help="Price that drives unit crossings: last trade, book mid, best bid or best ask"
+    )
+
+    parser.add_argument(
+        "--unit-hysteresis",
+        type=float,
+        default=None,
+        dest="unit_hysteresis",
+        help="Confirm a unit crossing only this fraction of a unit past the boundary, e.g. 0.2 (off if not given)"
+    )
+
+    parser.add_argument(
+        "--unit-dwell",
+        type=float,
+        default=None,
+        dest="unit_dwell_seconds",
+        help="Also confirm a unit crossing once price has stayed past the boundary this many seconds"
+    )
+
+    parser.add_argument(
+        "--compare-unit-sizes",
+        type=float,
+        nargs="+",
+        default=[],
+        dest="compare_unit_sizes",
+        help="Extra unit sizes (same units as the grid's) to track live on the same feed, without placing orders"
+    )
+
+    parser.add_argument(
+        "--record-tape",
+        type=str,
+        default=None,
+        dest="record_tape",
+        help="Directory to record every raw market-data frame to, for replay (off if not given)"
+    )
+
     parser.add_argument(
         "--testnet",
         action="store_true",
@@ -112,7 +163,7 @@ async def main():
     logger.info("HyperTrader - Long-Biased Grid Trading Bot")
     logger.info("=" * 60)
     logger.info(f"Symbol: {args.symbol}")
-    logger.info(f"Unit Size: ${args.unit_size_usd}")
+    logger.info(f"Unit Size: {f'{args.unit_size_pct}%' if args.unit_size_pct else f'${args.unit_size_usd}'}")
     logger.info(f"Position Value: ${args.position_value_usd}")
     logger.info(f"Leverage: {args.leverage}x")
     logger.info(f"Margin Required: ${args.position_value_usd / args.leverage}")
@@ -125,28 +176,24 @@ async def main():
         config = WalletConfig.from_env()
         logger.info("Wallet configuration loaded successfully")
 
-        # Initialize exchange client
+        # Initialize exchange client (async, so order calls never block the event loop)
         # Convert testnet flag to mainnet (SDK convention: mainnet=True, testnet=False)
-        client = HyperliquidClient(
+        client = AsyncHyperliquidClient(
             config=config,
             wallet_type="main",  # For now, 'long' strategy always uses 'main' wallet
             mainnet=not args.testnet
         )
-
-        # Initialize WebSocket client
-        websocket = HyperliquidSDKWebSocketClient(
-            mainnet=not args.testnet,
-            user_address=client.get_user_address()
-        )
-
-        # Connect WebSocket
-        if not await websocket.connect():
+        await client.start()
+
+        # Connect the shared WebSocket and start its listener BEFORE initializing the strategy.
+        # This ensures price updates and fills are captured from the start; further
+        # strategies on the same network would reuse this connection.
+        recorder = TapeRecorder(args.record_tape, prefix=args.symbol) if args.record_tape else None
+        feeds = WebSocketMultiplexer(user_address=client.get_user_address(), recorder=recorder)
+        websocket = await feeds.acquire(mainnet=not args.testnet)
+        if websocket is None:
             logger.error("Failed to connect to WebSocket")
             return
-
-        # Start WebSocket listener BEFORE initializing strategy
-        # This ensures price updates and fills are captured from the start
-        websocket_task = asyncio.create_task(websocket.listen())
         logger.info("WebSocket listener started")
 
         # Create strategy configuration
@@ -154,9 +201,14 @@ async def main():
             symbol=args.symbol,
             leverage=args.leverage,
             position_value_usd=Decimal(str(args.position_value_usd)),
-            unit_size_usd=Decimal(str(args.unit_size_usd)),
+            unit_size_usd=Decimal(str(args.unit_size_usd)) if args.unit_size_usd else None,
+            unit_size_pct=Decimal(str(args.unit_size_pct)) if args.unit_size_pct else None,
+            unit_hysteresis=Decimal(str(args.unit_hysteresis)) if args.unit_hysteresis is not None else None,
+            unit_dwell_seconds=args.unit_dwell_seconds,
+            compare_unit_sizes=tuple(Decimal(str(size)) for size in args.compare_unit_sizes),
             mainnet=not args.testnet,
-            strategy=args.strategy
+            strategy=args.strategy,
+            price_source=args.price_source
         )
 
         # Initialize strategy
@@ -169,29 +221,24 @@ async def main():
         # Initialize the strategy (establish position and grid)
         if not await strategy.initialize():
             logger.error("Failed to initialize strategy")
-            websocket_task.cancel()
-            try:
-                await websocket_task
-            except asyncio.CancelledError:
-                pass
-            await websocket.disconnect()
+            await feeds.release(mainnet=not args.testnet)
+            await client.close()
             return
 
+        # `kill -USR1 <pid>` dumps the tick-to-trade latency histograms without stopping the bot
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGUSR1, strategy.dump_latency, f"latency-{args.symbol}.json"
+        )
+
         # Run the strategy
         strategy_task = asyncio.create_task(strategy.run())
 
         # Wait for strategy completion
         await strategy_task
 
-        # Cancel websocket task
-        websocket_task.cancel()
-        try:
-            await websocket_task
-        except asyncio.CancelledError:
-            pass
-
-        # Disconnect websocket
-        await websocket.disconnect()
+        # Disconnect websocket (the last user closes the shared connection)
+        await feeds.release(mainnet=not args.testnet)
+        await client.close()
 
     except KeyboardInterrupt:
         logger.warning("Received interrupt signal, shutting down...")
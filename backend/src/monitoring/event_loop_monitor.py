@@ -0,0 +1,95 @@
+"""
+Event Loop Lag Monitor
+Measures how late the asyncio event loop wakes a sleeping coroutine.
+Any blocking call made on the loop (e.g. a synchronous HTTP request) shows up
+directly as lag, so this is the metric for "is anything blocking the loop".
+"""
+
+import asyncio
+from collections import deque
+from typing import Optional, Deque
+from loguru import logger
+
+
+class EventLoopLagMonitor:
+    """
+    Periodically sleeps for a fixed interval and records the overshoot.
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 1000, warn_threshold: float = 0.25):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between probes
+            window: Number of recent samples kept for percentiles
+            warn_threshold: Lag in seconds above which a warning is logged
+        """
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+        # Lifetime counters
+        self.sample_count = 0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    def start(self) -> None:
+        """Start probing on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._probe_loop())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _probe_loop(self) -> None:
+        """Sleep for the interval and record how late we were woken up."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - expected))
+
+    def record(self, lag: float) -> None:
+        """
+        Record one lag sample.
+
+        Args:
+            lag: Seconds the loop was late
+        """
+        self._samples.append(lag)
+        self.sample_count += 1
+        self.total_lag += lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+        if lag >= self.warn_threshold:
+            logger.warning(f"Event loop blocked for {lag * 1000:.0f}ms")
+
+    def _percentile(self, pct: float) -> float:
+        """Percentile over the recent sample window"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def get_stats(self) -> dict:
+        """Get lag statistics in milliseconds"""
+        mean = self.total_lag / self.sample_count if self.sample_count else 0.0
+        return {
+            "samples": self.sample_count,
+            "mean_ms": mean * 1000,
+            "p50_ms": self._percentile(50) * 1000,
+            "p99_ms": self._percentile(99) * 1000,
+            "max_ms": self.max_lag * 1000,
+        }
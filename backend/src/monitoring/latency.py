@@ -0,0 +1,217 @@
+"""
+Tick-to-Trade Latency
+Stage-by-stage timing from a market-data frame arriving to the order it
+triggered being acknowledged by the exchange.
+
+A LatencyTrace is started for every price batch handed to the strategy and
+travels in a context variable: the strategy copies it onto each UnitChangeEvent
+and re-binds it in the task that handles the event, where the exchange client
+stamps signing and sending. When an order call returns, the strategy records
+the stage durations into log-linear (HDR-style) histograms:
+
+    receive   exchange timestamp -> frame read off the socket (wall clock, includes clock offset)
+    decode    frame read -> prices handed to the consumer slot
+    detect    handed off -> unit crossing detected (conflation wait and unit math)
+    schedule  detected -> unit change handler running
+    sign      order action built -> signed
+    send      signed -> HTTP response received
+    ack       response received -> result back in the strategy
+    tick_to_trade  frame read -> result back in the strategy
+
+All timestamps are time.monotonic_ns() unless noted.
+"""
+
+import json
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+from loguru import logger
+
+# 2^7 sub-buckets per power of two: values are kept to within 1/64 (~1.6%)
+SUB_BUCKET_BITS = 7
+_HALF_SUB_BUCKETS = 1 << (SUB_BUCKET_BITS - 1)
+
+STAGES = ("receive", "decode", "detect", "schedule", "sign", "send", "ack", "tick_to_trade")
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of nanosecond durations with bounded relative error.
+    Memory grows with the number of distinct magnitudes, not with the sample count.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @staticmethod
+    def _bucket(value: int) -> int:
+        """Index of the bucket holding a value: exact below 2^7, then 64 buckets per power of two"""
+        if value < (1 << SUB_BUCKET_BITS):
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> int:
+        """Highest value that falls in a bucket"""
+        if bucket < (1 << SUB_BUCKET_BITS):
+            return bucket
+        shift = bucket // _HALF_SUB_BUCKETS - 1
+        mantissa = bucket - shift * _HALF_SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value_ns: int) -> None:
+        """
+        Record one duration.
+
+        Args:
+            value_ns: Duration in nanoseconds (negative values count as 0)
+        """
+        value_ns = max(0, value_ns)
+        bucket = self._bucket(value_ns)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+
+        if not self.count or value_ns < self.min:
+            self.min = value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        self.count += 1
+        self.total += value_ns
+
+    def percentile(self, pct: float) -> int:
+        """
+        Duration at a percentile.
+
+        Args:
+            pct: Percentile, 0-100
+
+        Returns:
+            Upper bound of the bucket holding that rank, in nanoseconds (exact for min and max)
+        """
+        if not self.count:
+            return 0
+        rank = max(1, round(pct / 100 * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(max(self._bucket_value(bucket), self.min), self.max)
+        return self.max
+
+    def get_stats(self) -> dict:
+        """Get latency statistics in milliseconds"""
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "samples": self.count,
+            "mean_ms": mean / 1e6,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p90_ms": self.percentile(90) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "p999_ms": self.percentile(99.9) / 1e6,
+            "max_ms": self.max / 1e6,
+        }
+
+
+@dataclass
+class LatencyTrace:
+    """Timestamps of one price batch on its way to an order acknowledgement"""
+    received_ns: int  # Oldest frame in the batch read off the socket
+    decoded_ns: int  # Its prices handed to the consumer slot
+    exchange_ms: Optional[int] = None  # Exchange timestamp of that frame (wall clock, ms)
+    received_wall_ns: Optional[int] = None  # received_ns on the wall clock
+    detected_ns: Optional[int] = None
+    scheduled_ns: Optional[int] = None
+    sign_started_ns: Optional[int] = None
+    signed_ns: Optional[int] = None
+    responded_ns: Optional[int] = None
+    acked_ns: Optional[int] = None
+
+
+# Trace of the price batch / unit change being handled in the current task
+current_trace: ContextVar[Optional[LatencyTrace]] = ContextVar("current_trace", default=None)
+
+
+def _between(start: Optional[int], end: Optional[int]) -> Optional[int]:
+    """Duration between two marks, or None if either is missing"""
+    if start is None or end is None:
+        return None
+    return end - start
+
+
+class LatencyTracer:
+    """
+    One histogram per stage of the tick-to-trade path.
+    """
+
+    def __init__(self):
+        """Initialize empty histograms for every stage."""
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+
+    def record(self, stage: str, value_ns: int) -> None:
+        """
+        Record one duration for a stage.
+
+        Args:
+            stage: One of STAGES
+            value_ns: Duration in nanoseconds
+        """
+        self.histograms[stage].record(value_ns)
+
+    def record_trace(self, trace: LatencyTrace) -> None:
+        """
+        Record every stage a completed trace has both marks for.
+
+        Args:
+            trace: Trace whose acked_ns has been stamped
+        """
+        receive = None
+        if trace.exchange_ms is not None and trace.received_wall_ns is not None:
+            receive = trace.received_wall_ns - trace.exchange_ms * 1_000_000
+
+        durations = (
+            ("receive", receive),
+            ("decode", _between(trace.received_ns, trace.decoded_ns)),
+            ("detect", _between(trace.decoded_ns, trace.detected_ns)),
+            ("schedule", _between(trace.detected_ns, trace.scheduled_ns)),
+            ("sign", _between(trace.sign_started_ns, trace.signed_ns)),
+            ("send", _between(trace.signed_ns, trace.responded_ns)),
+            ("ack", _between(trace.responded_ns, trace.acked_ns)),
+            ("tick_to_trade", _between(trace.received_ns, trace.acked_ns)),
+        )
+        for stage, value in durations:
+            if value is not None:
+                self.histograms[stage].record(value)
+
+    def get_stats(self) -> dict:
+        """Get per-stage latency statistics in milliseconds"""
+        return {stage: histogram.get_stats() for stage, histogram in self.histograms.items()}
+
+    def dump(self, path: Optional[Union[str, Path]] = None) -> dict:
+        """
+        Log the per-stage statistics, and optionally write them as JSON.
+
+        Args:
+            path: File to write the statistics to
+
+        Returns:
+            Per-stage statistics
+        """
+        stats = self.get_stats()
+        for stage, stage_stats in stats.items():
+            if stage_stats["samples"]:
+                logger.info(
+                    f"Latency {stage:>13}: n={stage_stats['samples']} p50={stage_stats['p50_ms']:.3f}ms "
+                    f"p99={stage_stats['p99_ms']:.3f}ms max={stage_stats['max_ms']:.3f}ms"
+                )
+
+        if path is not None:
+            Path(path).write_text(json.dumps({"dumped_at": time.time(), "stages": stats}, indent=2))
+            logger.info(f"Latency histograms written to {path}")
+        return stats
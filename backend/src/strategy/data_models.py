@@ -4,7 +4,7 @@ Shared data models and configuration for the grid trading strategy.
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Tuple
 from enum import Enum
 
 
@@ -25,11 +25,16 @@ class StrategyConfig:
     symbol: str
     leverage: int
     position_value_usd: Decimal  # Total position value in USD (what user specifies)
-    unit_size_usd: Decimal  # USD per unit movement
+    unit_size_usd: Optional[Decimal]  # USD per unit movement (linear units)
 
     # Strategy settings
     mainnet: bool = False  # Default to testnet
     strategy: str = "long"  # Strategy type (long/short)
+    price_source: str = "trade"  # Price driving unit crossings: trade, mid, bid or ask
+    unit_size_pct: Optional[Decimal] = None  # Percent per unit (geometric units), instead of unit_size_usd
+    unit_hysteresis: Optional[Decimal] = None  # Fraction of a unit past a boundary that confirms a crossing
+    unit_dwell_seconds: Optional[float] = None  # Time past a boundary that confirms a crossing
+    compare_unit_sizes: Tuple[Decimal, ...] = ()  # Extra unit sizes (USD, or percent) tracked on the same feed, without orders
     # Note: wallet selection is handled at the exchange level, not strategy config
 
     def __post_init__(self):
@@ -4,31 +4,55 @@ Main strategy implementation with event-driven grid management.
 """
 
 import asyncio
+import inspect
+import time
+from dataclasses import replace
 from decimal import Decimal
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Union, Any
 from datetime import datetime
 from loguru import logger
 
-from ..exchange.hyperliquid_sdk import HyperliquidClient, OrderResult
+from ..exchange.hyperliquid_sdk import HyperliquidClient, OrderResult, OrderSpec
+from ..exchange.hyperliquid_async import AsyncHyperliquidClient
 from ..exchange.hyperliquid_sdk_websocket import HyperliquidSDKWebSocketClient
-from .unit_tracker import UnitTracker, UnitChangeEvent, Direction
+from ..exchange.price_provider import StreamedPriceProvider
+from ..exchange.client_order_id import ClientOrderIdGenerator
+from ..exchange.market_data import PriceSource
+from ..exchange.instrument_spec import InstrumentSpec
+from ..monitoring.event_loop_monitor import EventLoopLagMonitor
+from ..monitoring.latency import LatencyTracer, current_trace
+from .unit_tracker import UnitTracker, UnitTrackerGroup, UnitChangeEvent, Direction
 from .position_map import PositionMap
+from .unit_spacing import UnitSpacing, make_spacing
 from .data_models import StrategyConfig, StrategyMetrics, StrategyState
 
 
+async def _maybe_await(value: Any) -> Any:
+    """Resolve a client call result for both the sync and the async client."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
 class GridTradingStrategy:
     """
     Long-biased grid trading strategy with whipsaw resistance.
     Maintains 4 active orders trailing the current price.
     """
 
-    def __init__(self, config: StrategyConfig, client: HyperliquidClient, websocket: HyperliquidSDKWebSocketClient):
+    def __init__(
+        self,
+        config: StrategyConfig,
+        client: Union[HyperliquidClient, AsyncHyperliquidClient],
+        websocket: HyperliquidSDKWebSocketClient
+    ):
         """
         Initialize the grid trading strategy.
 
         Args:
             config: Strategy configuration
-            client: HyperliquidClient for order execution
+            client: HyperliquidClient or AsyncHyperliquidClient for order execution.
+                    The async client never blocks the event loop.
             websocket: WebSocket client for real-time data
         """
         self.config = config
@@ -42,8 +66,13 @@ class GridTradingStrategy:
 
         # Core components (will be initialized after initial position)
         self.unit_tracker: Optional[UnitTracker] = None
+        self.unit_trackers: Optional[UnitTrackerGroup] = None  # The grid's tracker plus any compared unit sizes
         self.position_map: Optional[PositionMap] = None
         self.main_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.instrument: Optional[InstrumentSpec] = None  # Exchange rounding rules, for fill completeness
+        self._unit_change_tasks: Set[asyncio.Task] = set()  # Strong refs until each handler finishes
+        self._window_lock = asyncio.Lock()  # Unit changes and fills move the order windows one at a time, in order
+        self._feed_subscriptions: List[Any] = []  # Handles released at shutdown (the connection may be shared)
 
         # Active order tracking. These lists operate as queues:
         # - FILLED orders are LIFO (last one in is closest to price, so first one out).
@@ -61,8 +90,23 @@ class GridTradingStrategy:
         self.whipsaw_range_min: int = 0     # Min unit when whipsaw detected
         self.whipsaw_range_max: int = 0     # Max unit when whipsaw detected
 
+        # Event loop health - blocking client calls show up as lag here
+        self.loop_monitor = EventLoopLagMonitor()
+
+        # Tick-to-trade stage timings for orders placed in reaction to unit changes
+        self.latency = LatencyTracer()
+
+        # Every order carries a deterministic cloid so timed-out placements can be retried safely.
+        # The session start time keeps cloids unique across restarts.
+        self.cloids = ClientOrderIdGenerator(config.symbol, namespace=str(int(time.time() * 1000)))
+
+        # Streamed trade prices let the client size orders without a REST price fetch
+        self.price_feed = StreamedPriceProvider()
+        self.client.set_price_provider(self.price_feed)
+
         logger.info(f"Grid Trading Strategy initialized for {config.symbol}")
-        logger.info(f"Configuration: Leverage={config.leverage}x, Unit Size=${config.unit_size_usd}, "
+        unit_size = f"{config.unit_size_pct}%" if config.unit_size_pct else f"${config.unit_size_usd}"
+        logger.info(f"Configuration: Leverage={config.leverage}x, Unit Size={unit_size}, "
                    f"Position=${config.position_value_usd}, Margin=${config.margin_required}")
 
     async def initialize(self) -> bool:
@@ -79,28 +123,30 @@ class GridTradingStrategy:
             self.main_loop = asyncio.get_running_loop()
 
             # Set leverage
-            if not self.client.set_leverage(self.config.symbol, self.config.leverage):
+            if not await _maybe_await(self.client.set_leverage(self.config.symbol, self.config.leverage)):
                 logger.error("Failed to set leverage")
                 return False
 
+            self.instrument = await _maybe_await(self.client.get_instrument_spec(self.config.symbol))
+
             # Cancel any existing orders
-            cancelled = self.client.cancel_all_orders(self.config.symbol)
+            cancelled = await _maybe_await(self.client.cancel_all_orders(self.config.symbol))
             if cancelled > 0:
                 logger.info(f"Cancelled {cancelled} existing orders")
 
             # Get current price
-            current_price = self.client.get_current_price(self.config.symbol)
+            current_price = await _maybe_await(self.client.get_current_price(self.config.symbol))
             logger.info(f"Current {self.config.symbol} price: ${current_price:.2f}")
 
             # Open initial position
             logger.info(f"Opening initial position: ${self.config.position_value_usd} @ {self.config.leverage}x (margin: ${self.config.margin_required})")
-            result = self.client.open_position(
+            result = await _maybe_await(self.client.open_position(
                 symbol=self.config.symbol,
                 usd_amount=self.config.position_value_usd,
                 is_long=True,
                 leverage=self.config.leverage,
                 slippage=0.01
-            )
+            ))
 
             if not result.success:
                 logger.error(f"Failed to open initial position: {result.error_message}")
@@ -116,17 +162,27 @@ class GridTradingStrategy:
 
             logger.success(f"Initial position established: {result.filled_size} {self.config.symbol} @ ${anchor_price:.2f} | Fragments: 4/4")
 
+            # One unit ladder, anchored at the entry price, shared by the tracker and the map
+            spacing = self._make_spacing(anchor_price, self.config.unit_size_pct or self.config.unit_size_usd)
+
             # Initialize unit tracker with anchor price
             self.unit_tracker = UnitTracker(
-                unit_size_usd=self.config.unit_size_usd,
-                anchor_price=anchor_price
+                spacing=spacing,
+                hysteresis=self.config.unit_hysteresis,
+                dwell_seconds=self.config.unit_dwell_seconds
             )
 
+            # Unit sizes to compare live are tracked on the same prices, but only counted
+            self.unit_trackers = UnitTrackerGroup({"grid": self.unit_tracker})
+            for unit_size in self.config.compare_unit_sizes:
+                self.unit_trackers.add(f"compare:{unit_size}", UnitTracker(
+                    spacing=self._make_spacing(anchor_price, unit_size),
+                    hysteresis=self.config.unit_hysteresis,
+                    dwell_seconds=self.config.unit_dwell_seconds
+                ))
+
             # Initialize position map
-            self.position_map = PositionMap(
-                unit_size_usd=self.config.unit_size_usd,
-                anchor_price=anchor_price
-            )
+            self.position_map = PositionMap(spacing=spacing)
 
             # Register unit change callback
             self.unit_tracker.on_unit_change = self._on_unit_change
@@ -139,6 +195,9 @@ class GridTradingStrategy:
             # Subscribe to websocket feeds
             await self._setup_websocket_subscriptions()
 
+            # Started last, so a failed initialization leaves no probe running (shutdown() stops it)
+            self.loop_monitor.start()
+
             self.state = StrategyState.RUNNING
             logger.success(f"Strategy initialization complete for {self.config.symbol}")
             return True
@@ -148,6 +207,21 @@ class GridTradingStrategy:
             self.state = StrategyState.STOPPED
             return False
 
+    def _make_spacing(self, anchor_price: Decimal, unit_size: Decimal) -> UnitSpacing:
+        """
+        Unit ladder at the anchor for a unit size in the configured units.
+
+        Args:
+            anchor_price: Price at unit 0
+            unit_size: USD per unit, or percent per unit when the grid is geometric
+
+        Returns:
+            Linear or geometric spacing
+        """
+        if self.config.unit_size_pct:
+            return make_spacing(anchor_price, grid_spacing=unit_size / 100)
+        return make_spacing(anchor_price, unit_size_usd=unit_size)
+
     async def _place_initial_grid(self) -> bool:
         """
         Place the initial 4 sell orders below current price.
@@ -157,32 +231,40 @@ class GridTradingStrategy:
         """
         logger.info("Placing initial grid orders...")
 
-        # Place 4 sell orders at units -1, -2, -3, -4
+        # Place 4 sell orders at units -1, -2, -3, -4 in a single batch
         initial_units = [-1, -2, -3, -4]
-        for unit in initial_units:
-            price = self.unit_tracker.get_unit_price(unit)
 
-            # Calculate sell fragment (1/4 of position)
-            fragment_size = self.metrics.current_position_size / 4
+        # Calculate sell fragment (1/4 of position)
+        fragment_size = self.metrics.current_position_size / 4
 
+        specs = []
+        for unit in initial_units:
+            price = self.unit_tracker.get_unit_price(unit)
             logger.info(f"Placing sell order at unit {unit} (${price:.2f}), size: {fragment_size:.4f} {self.config.symbol}")
-
-            result = self.client.place_limit_order(
+            specs.append(OrderSpec(
                 symbol=self.config.symbol,
                 is_buy=False,
                 price=price,
                 size=fragment_size,
-                reduce_only=False
-            )
+                reduce_only=False,
+                cloid=self.cloids.next(unit)
+            ))
+
+        results = await _maybe_await(self.client.place_orders_bulk(specs))
 
+        all_placed = True
+        for unit, spec, result in zip(initial_units, specs, results):
             if result.success:
                 # Track the order
                 self.trailing_stop.append(unit)
-                self.position_map.add_order(unit, result.order_id, "sell", fragment_size)
+                self.position_map.add_order(unit, result.order_id, "sell", fragment_size, cloid=spec.cloid)
                 logger.info(f"Sell order placed at unit {unit}: {result.order_id}")
             else:
                 logger.error(f"Failed to place sell order at unit {unit}: {result.error_message}")
-                return False  # Abort on first failure
+                all_placed = False
+
+        if not all_placed:
+            return False
         
         # The list is currently [-1, -2, -3, -4]. We reverse it to [-4, -3, -2, -1]
         # so the oldest/furthest order (-4) is at the front of the queue (index 0)
@@ -197,21 +279,50 @@ class GridTradingStrategy:
         async def fill_handler(order_id: str, price: Decimal, size: Decimal):
             """Handle fill confirmations from WebSocket"""
             logger.info(f"Fill handler triggered for order {order_id}")
+            self.client.invalidate_account_cache()
             await self.process_fill_confirmation(order_id, price, size)
 
-        # Subscribe to price updates AND register fill callback
-        await self.websocket.subscribe_to_trades(
-            symbol=self.config.symbol,
+        def order_update_handler(order_data: dict):
+            """Order status changed on the exchange, cached account state is stale"""
+            self.client.invalidate_account_cache()
+
+        # Prices arrive as the ordered unit extremes of each batch (split at the
+        # hysteresis band when one is set), so swings through several units and
+        # crossings confirmed inside one burst still reach the unit tracker
+        price_consumer = dict(
             price_callback=self._on_price_update,
-            fill_callback=fill_handler
+            path_callback=self._on_price_path,
+            price_bucket=self.unit_trackers.tick_bucket_of
         )
+        price_source = PriceSource(self.config.price_source)
+
+        subscriptions = []
+        if price_source is PriceSource.LAST_TRADE:
+            # Subscribe to price updates AND register fill callback
+            subscriptions.append(await self.websocket.subscribe_to_trades(
+                symbol=self.config.symbol,
+                fill_callback=fill_handler,
+                **price_consumer
+            ))
+        else:
+            # Top of book moves before the next print; trades are only needed for the fill callback
+            subscriptions.append(await self.websocket.subscribe_to_trades(symbol=self.config.symbol, fill_callback=fill_handler))
+            subscriptions.append(await self.websocket.subscribe_to_book(
+                symbol=self.config.symbol,
+                source=price_source,
+                **price_consumer
+            ))
 
         # Subscribe to user fills (this triggers the fill_callback registered above)
         wallet_address = self.client.get_user_address()
-        await self.websocket.subscribe_to_user_fills(wallet_address)
+        subscriptions.append(await self.websocket.subscribe_to_user_fills(wallet_address))
 
         # Subscribe to order updates for real-time order tracking
-        await self.websocket.subscribe_to_order_updates(wallet_address)
+        subscriptions.append(await self.websocket.subscribe_to_order_updates(wallet_address, order_callback=order_update_handler))
+        self._feed_subscriptions = [subscription for subscription in subscriptions if subscription]
+
+        # Order updates missed during a reconnect gap leave cached account state stale
+        self.websocket.add_reconnect_callback(self.client.invalidate_account_cache)
 
         logger.info(f"Subscribed to {self.config.symbol} price feed, order fills, and order updates")
 
@@ -222,9 +333,23 @@ class GridTradingStrategy:
         Args:
             price: Current market price
         """
-        if self.unit_tracker:
-            # Update unit tracker which will trigger unit change events if needed
-            self.unit_tracker.update_price(price)
+        self.price_feed.update(self.config.symbol, price)
+
+        if self.unit_trackers:
+            # Update unit trackers which will trigger unit change events if needed
+            self.unit_trackers.update_price(price)
+
+    def _on_price_path(self, prices: List[Decimal]) -> None:
+        """
+        Handle a batch of trades reduced to its ordered unit extremes.
+
+        Args:
+            prices: Unit-crossing extremes in order, ending with the latest price
+        """
+        self.price_feed.update(self.config.symbol, prices[-1])
+
+        if self.unit_trackers:
+            self.unit_trackers.update_path(prices)
 
     def _on_unit_change(self, event: UnitChangeEvent) -> None:
         """
@@ -237,9 +362,16 @@ class GridTradingStrategy:
         if self.is_shutting_down:
             return
 
-        # Schedule the async handler in the main event loop
+        # Each event gets its own copy of the price batch's latency trace
+        trace = current_trace.get()
+        if trace is not None:
+            event.trace = replace(trace, detected_ns=event.detected_ns)
+
+        # Price updates arrive on the main loop, so the handler is scheduled directly
         if self.main_loop and self.main_loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(self._handle_unit_change(event), self.main_loop)
+            task = self.main_loop.create_task(self._handle_unit_change(event))
+            self._unit_change_tasks.add(task)
+            task.add_done_callback(self._unit_change_tasks.discard)
         else:
             if not self.is_shutting_down:
                 logger.error("Main event loop not available or not running!")
@@ -247,11 +379,27 @@ class GridTradingStrategy:
     async def _handle_unit_change(self, event: UnitChangeEvent) -> None:
         """
         Async handler for unit change events.
-        Processes unit changes one by one to handle gaps and ensure correct order placement.
+        Handlers await exchange calls, so each waits for the previous one (or a fill
+        being handled) to finish: two of them interleaving would both move the same oldest order.
+
+        Args:
+            event: UnitChangeEvent containing unit transition details
+        """
+        async with self._window_lock:
+            await self._process_unit_change(event)
+
+    async def _process_unit_change(self, event: UnitChangeEvent) -> None:
+        """
+        Process one unit change: unit by unit, to handle gaps and ensure correct order placement.
 
         Args:
             event: UnitChangeEvent containing unit transition details
         """
+        # Orders placed below are attributed to this event's trace (the task has its own context)
+        if event.trace is not None:
+            event.trace.scheduled_ns = time.monotonic_ns()
+        current_trace.set(event.trace)
+
         current = event.current_unit
         previous = event.previous_unit
 
@@ -326,22 +474,37 @@ class GridTradingStrategy:
             logger.warning(f"🌀 Whipsaw - placing sells at {[current_unit-5, current_unit-4, current_unit-3, current_unit-2]}")
             target_units = [current_unit - 5, current_unit - 4, current_unit - 3, current_unit - 2]
 
-            for unit in target_units:
-                if unit not in self.trailing_stop:
-                    result = await self._place_sell_order_at_unit(unit)
-                    if result:
-                        self.trailing_stop.append(unit)
+            missing_units = [unit for unit in target_units if unit not in self.trailing_stop]
+            placed = await self._place_sell_orders_at_units(missing_units)
+            for unit in missing_units:
+                if placed.get(unit):
+                    self.trailing_stop.append(unit)
 
-            # Maintain 4 sells - cancel oldest if needed
+            # Maintain 4 sells - cancel oldest in one batch if needed
+            excess_units = []
             while len(self.trailing_stop) > 4:
-                oldest_unit = self.trailing_stop.pop(0)
-                await self._cancel_orders_at_unit(oldest_unit)
+                excess_units.append(self.trailing_stop.pop(0))
+            await self._cancel_orders_at_units(excess_units)
         else:
             # Normal operation: place sell at current-1
             new_sell_unit = current_unit - 1
 
             # Check if we already have this unit in our tracking list
             if new_sell_unit not in self.trailing_stop:
+                # Full window sliding by one unit: move the oldest sell up in a single modify
+                if len(self.trailing_stop) >= 4:
+                    spec = OrderSpec(
+                        symbol=self.config.symbol,
+                        is_buy=False,
+                        price=self.unit_tracker.get_unit_price(new_sell_unit),
+                        size=self.metrics.current_position_size / 4,
+                        reduce_only=False,
+                        cloid=self.cloids.next(new_sell_unit)
+                    )
+                    if await self._slide_window(self.trailing_stop, new_sell_unit, spec, "sell"):
+                        logger.success(f"✅ SELL moved to {new_sell_unit}. Sells: {self.trailing_stop}")
+                        return
+
                 result = await self._place_sell_order_at_unit(new_sell_unit)
                 if result:
                     self.trailing_stop.append(new_sell_unit)
@@ -376,6 +539,25 @@ class GridTradingStrategy:
         # Normal operation: place buy at current+1
         new_buy_unit = current_unit + 1
 
+        # Full window sliding by one unit: move the highest buy down in a single modify
+        if len(self.trailing_buy) >= 4 and new_buy_unit not in self.trailing_buy:
+            price = self.unit_tracker.get_unit_price(new_buy_unit)
+            fragment_size = await _maybe_await(
+                self.client.calculate_position_size(self.config.symbol, self.metrics.new_buy_fragment)
+            )
+            spec = OrderSpec(
+                symbol=self.config.symbol,
+                is_buy=True,
+                price=price,
+                size=fragment_size,
+                reduce_only=False,
+                trigger_price=price,
+                cloid=self.cloids.next(new_buy_unit)
+            )
+            if await self._slide_window(self.trailing_buy, new_buy_unit, spec, "buy"):
+                logger.success(f"✅ BUY moved to {new_buy_unit}. Buys: {self.trailing_buy}")
+                return
+
         # If we already have 4 buys, cancel highest BEFORE placing new one
         if len(self.trailing_buy) >= 4:
             highest_unit = self.trailing_buy.pop(0)
@@ -403,17 +585,18 @@ class GridTradingStrategy:
         # Target: 4 sells at [current-1, current-2, current-3, current-4]
         target_units = [current_unit - 1, current_unit - 2, current_unit - 3, current_unit - 4]
 
-        # Place any missing sells
-        for unit in target_units:
-            if unit not in self.trailing_stop:
-                result = await self._place_sell_order_at_unit(unit)
-                if result:
-                    self.trailing_stop.append(unit)
+        # Place any missing sells in one batch
+        missing_units = [unit for unit in target_units if unit not in self.trailing_stop]
+        placed = await self._place_sell_orders_at_units(missing_units)
+        for unit in missing_units:
+            if placed.get(unit):
+                self.trailing_stop.append(unit)
 
-        # Maintain exactly 4 sells - cancel oldest if needed
+        # Maintain exactly 4 sells - cancel oldest in one batch if needed
+        excess_units = []
         while len(self.trailing_stop) > 4:
-            oldest_unit = self.trailing_stop.pop(0)
-            await self._cancel_orders_at_unit(oldest_unit)
+            excess_units.append(self.trailing_stop.pop(0))
+        await self._cancel_orders_at_units(excess_units)
 
         logger.success(f"✅ Catch-up complete. Sells: {self.trailing_stop}")
 
@@ -433,22 +616,65 @@ class GridTradingStrategy:
         num_active_sells = len(self.trailing_stop) if self.trailing_stop else 1
         divisor = min(num_active_sells, 4)  # Cap at 4
         fragment_size = self.metrics.current_position_size / divisor
+        cloid = self.cloids.next(unit)
 
-        result = self.client.place_limit_order(
+        result = await self._order_call(self.client.place_limit_order(
             symbol=self.config.symbol,
             is_buy=False,
             price=price,
             size=fragment_size,
-            reduce_only=False
-        )
+            reduce_only=False,
+            cloid=cloid
+        ))
 
         if result.success:
-            self.position_map.add_order(unit, result.order_id, "sell", fragment_size)
+            self.position_map.add_order(unit, result.order_id, "sell", fragment_size, cloid=cloid)
             return result.order_id
         else:
             logger.error(f"Failed to place sell order at {unit}: {result.error_message}")
             return None
 
+    async def _place_sell_orders_at_units(self, units: List[int]) -> Dict[int, Optional[str]]:
+        """
+        Place sell orders at several units with a single batch request.
+        Fragment sizes match placing them one at a time and appending each to trailing_stop.
+
+        Args:
+            units: Unit levels for the orders, in placement order
+
+        Returns:
+            Mapping of unit to order ID (None where placement failed)
+        """
+        if not units:
+            return {}
+        if len(units) == 1:
+            return {units[0]: await self._place_sell_order_at_unit(units[0])}
+
+        specs = []
+        for i, unit in enumerate(units):
+            num_active_sells = (len(self.trailing_stop) + i) or 1
+            fragment_size = self.metrics.current_position_size / min(num_active_sells, 4)
+            specs.append(OrderSpec(
+                symbol=self.config.symbol,
+                is_buy=False,
+                price=self.unit_tracker.get_unit_price(unit),
+                size=fragment_size,
+                reduce_only=False,
+                cloid=self.cloids.next(unit)
+            ))
+
+        results = await self._order_call(self.client.place_orders_bulk(specs))
+
+        placed: Dict[int, Optional[str]] = {}
+        for unit, spec, result in zip(units, specs, results):
+            if result.success:
+                self.position_map.add_order(unit, result.order_id, "sell", spec.size, cloid=spec.cloid)
+                placed[unit] = result.order_id
+            else:
+                logger.error(f"Failed to place sell order at {unit}: {result.error_message}")
+                placed[unit] = None
+        return placed
+
     async def _place_buy_order_at_unit(self, unit: int) -> Optional[str]:
         """
         Place a buy order at a specific unit.
@@ -463,23 +689,102 @@ class GridTradingStrategy:
 
         # Use compounded fragment size for buys
         fragment_usd = self.metrics.new_buy_fragment
-        fragment_size = self.client.calculate_position_size(self.config.symbol, fragment_usd)
+        fragment_size = await _maybe_await(self.client.calculate_position_size(self.config.symbol, fragment_usd))
 
-        result = self.client.place_stop_buy(
+        cloid = self.cloids.next(unit)
+        result = await self._order_call(self.client.place_stop_buy(
             symbol=self.config.symbol,
             size=fragment_size,
             trigger_price=price,
             limit_price=price,
-            reduce_only=False
-        )
+            reduce_only=False,
+            cloid=cloid
+        ))
 
         if result.success:
-            self.position_map.add_order(unit, result.order_id, "buy", fragment_size)
+            self.position_map.add_order(unit, result.order_id, "buy", fragment_size, cloid=cloid)
             return result.order_id
         else:
             logger.error(f"Failed to place buy order at {unit}: {result.error_message}")
             return None
 
+    async def _order_call(self, call: Any) -> Any:
+        """
+        Await an order placement and, if it was made in reaction to a unit change,
+        record the tick-to-trade stage timings of its trace.
+
+        Args:
+            call: Result of a client order method (a coroutine for the async client)
+
+        Returns:
+            The client's result
+        """
+        result = await _maybe_await(call)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.acked_ns = time.monotonic_ns()
+            self.latency.record_trace(trace)
+        return result
+
+    def dump_latency(self, path: Optional[str] = None) -> dict:
+        """
+        Log (and optionally write as JSON) the tick-to-trade latency histograms.
+
+        Args:
+            path: File to write the statistics to
+
+        Returns:
+            Per-stage latency statistics in milliseconds
+        """
+        return self.latency.dump(path)
+
+    async def _slide_window(self, window: List[int], new_unit: int, spec: OrderSpec, order_type: str) -> bool:
+        """
+        Slide a trailing window by one unit by modifying its oldest order in place.
+        Replaces the place-new-then-cancel-oldest pair with one exchange action,
+        so the window never holds five live orders.
+
+        Args:
+            window: trailing_stop or trailing_buy (oldest unit first), updated in place
+            new_unit: Unit the oldest order moves to
+            spec: Order specification at the new unit
+            order_type: "buy" or "sell"
+
+        Returns:
+            True if the order was moved, False if the caller should place and cancel instead
+        """
+        oldest_unit = window[0]
+        active_orders = self.position_map.get_active_orders_at_unit(oldest_unit)
+        if len(active_orders) != 1:
+            return False
+
+        old_order_id = active_orders[0].order_id
+
+        # Slide before awaiting the exchange, so nothing sees the old window meanwhile
+        window.pop(0)
+        window.append(new_unit)
+        try:
+            result = await self._order_call(self.client.replace_order(old_order_id, spec))
+        except Exception:
+            self._unslide_window(window, oldest_unit)
+            raise
+
+        if not result.success:
+            logger.warning(f"Failed to move {order_type} {old_order_id} from {oldest_unit} to {new_unit}: "
+                           f"{result.error_message}")
+            self._unslide_window(window, oldest_unit)
+            return False
+
+        self.position_map.update_order_status(old_order_id, "replaced")
+        self.position_map.add_order(new_unit, result.order_id, order_type, spec.size, cloid=spec.cloid)
+        return True
+
+    @staticmethod
+    def _unslide_window(window: List[int], oldest_unit: int) -> None:
+        """Undo a slide whose modify did not go through"""
+        window.pop()
+        window.insert(0, oldest_unit)
+
     async def _cancel_orders_at_unit(self, unit: int) -> None:
         """
         Cancel all active orders at a specific unit.
@@ -487,29 +792,55 @@ class GridTradingStrategy:
         Args:
             unit: Unit level to cancel orders at
         """
-        active_orders = self.position_map.get_active_orders_at_unit(unit)
+        await self._cancel_orders_at_units([unit])
+
+    async def _cancel_orders_at_units(self, units: List[int]) -> None:
+        """
+        Cancel all active orders at several units with a single batched cancel.
+
+        Args:
+            units: Unit levels to cancel orders at
+        """
+        order_ids = [
+            order.order_id
+            for unit in units
+            for order in self.position_map.get_active_orders_at_unit(unit)
+        ]
 
-        if not active_orders:
+        if not order_ids:
             return
 
-        for order in active_orders:
-            success = self.client.cancel_order(self.config.symbol, order.order_id)
+        results = await _maybe_await(self.client.cancel_orders_bulk(self.config.symbol, order_ids))
 
-            if success:
-                self.position_map.update_order_status(order.order_id, "cancelled")
+        for order_id in order_ids:
+            if results.get(order_id):
+                self.position_map.update_order_status(order_id, "cancelled")
             else:
-                logger.warning(f"Failed to cancel order {order.order_id}")
-
+                logger.warning(f"Failed to cancel order {order_id}")
 
     async def process_fill_confirmation(self, order_id: str, price: Decimal, size: Decimal) -> None:
         """
         Process confirmed order fills from WebSocket.
         This is the ONLY place that should handle order replacement after fills.
+        Waits for a unit change in progress: a fill of the order it is moving must
+        see the window as the modify left it, not halfway through the slide.
         
         Args:
             order_id: The filled order ID
             price: Fill price
-            size: Fill size
+            size: Fill size (may be a partial fill)
+        """
+        async with self._window_lock:
+            await self._process_fill(order_id, price, size)
+
+    async def _process_fill(self, order_id: str, price: Decimal, size: Decimal) -> None:
+        """
+        Process one fill: book it and replace a completely filled order on the other side.
+
+        Args:
+            order_id: The filled order ID
+            price: Fill price
+            size: Fill size (may be a partial fill)
         """
         # Find the order in position map
         order_info = self.position_map.get_order_by_id(order_id)
@@ -519,8 +850,15 @@ class GridTradingStrategy:
         unit, order_record = order_info
         order_type = order_record.order_type
 
-        # Update order status to filled
-        self.position_map.update_order_status(order_id, "filled", price)
+        # An order can fill in several pieces; only the last one completes it
+        filled_size, price = self.position_map.record_fill(order_id, price, size)
+        target_size = self.instrument.round_size(order_record.size) if self.instrument else order_record.size
+        if filled_size < target_size:
+            logger.info(f"Partial fill at {unit}: {order_type.upper()} {filled_size}/{target_size} @ ${price:.2f}")
+            return
+
+        # Mark the order filled and book the whole order (summed size, volume-weighted price) in the metrics
+        self._on_order_fill(order_id, price, filled_size)
 
         logger.warning(f"🎯 FILL at {unit}: {order_type.upper()} @ ${price:.2f}")
 
@@ -573,24 +911,19 @@ class GridTradingStrategy:
                         oldest = self.trailing_stop.pop(0)
                         await self._cancel_orders_at_unit(oldest)
 
-        # Call the existing fill handler for metrics
-        self._on_order_fill(order_id, price, size)
-
     def _on_order_fill(self, order_id: str, price: Decimal, size: Decimal) -> None:
         """
         Handle order fill notifications for metrics.
 
         Args:
             order_id: Filled order ID
-            price: Fill price
-            size: Fill size
+            price: Fill price (volume-weighted over partial fills)
+            size: Filled size (summed over partial fills)
         """
 
-        # Update position map
-        self.position_map.update_order_status(order_id, "filled", price)
-
-        # Find order details
+        # Find order details while the order is still active, then mark it filled
         order_info = self.position_map.get_order_by_id(order_id)
+        self.position_map.update_order_status(order_id, "filled", price)
         if order_info:
             unit, order_record = order_info
 
@@ -652,6 +985,11 @@ class GridTradingStrategy:
                 current_time = asyncio.get_event_loop().time()
                 if current_time - last_history_log >= 60:
                     await self._log_order_history()
+                    logger.info(f"Event loop lag: {self.loop_monitor.get_stats()}")
+                    if isinstance(self.client, AsyncHyperliquidClient):
+                        logger.info(f"Request scheduler: {self.client.scheduler.get_stats()}")
+                    if isinstance(self.websocket, HyperliquidSDKWebSocketClient):
+                        logger.info(f"Feed queues: {self.websocket.get_feed_stats()}")
                     last_history_log = current_time
 
         except KeyboardInterrupt:
@@ -664,7 +1002,7 @@ class GridTradingStrategy:
     async def _log_order_history(self) -> None:
         """Log order history from Hyperliquid for comparison with app logs."""
         try:
-            fills = self.client.get_order_history(self.config.symbol, limit=20)
+            fills = await _maybe_await(self.client.get_order_history(self.config.symbol, limit=20))
 
             if fills:
                 logger.info("=" * 80)
@@ -716,7 +1054,9 @@ class GridTradingStrategy:
                 "current_price": float(self.unit_tracker.current_price),
                 "anchor_price": float(self.unit_tracker.anchor_price),
                 "current_direction": self.unit_tracker.current_direction.value,
-                "whipsaw_paused": self.whipsaw_paused,
+                "suppressed_unit_flips": self.unit_tracker.suppressed_flips,
+                "unit_trackers": self.unit_trackers.get_stats() if self.unit_trackers else None,
+                "whipsaw_active": self.whipsaw_active,
             })
         else:
             status["unit_tracker"] = "NOT_INITIALIZED"
@@ -727,6 +1067,9 @@ class GridTradingStrategy:
             "total_orders": len(self.trailing_stop) + len(self.trailing_buy),
             "position_size": float(self.metrics.current_position_size) if self.metrics else 0,
             "realized_pnl": float(self.metrics.realized_pnl) if self.metrics else 0,
+            "event_loop_lag": self.loop_monitor.get_stats(),
+            "price_feed": self.price_feed.get_stats(),
+            "latency": self.latency.get_stats(),
         })
 
         return status
@@ -739,7 +1082,7 @@ class GridTradingStrategy:
 
         try:
             # Cancel all orders
-            cancelled = self.client.cancel_all_orders(self.config.symbol)
+            cancelled = await _maybe_await(self.client.cancel_all_orders(self.config.symbol))
             logger.info(f"Cancelled {cancelled} orders")
 
             # Log final metrics
@@ -754,6 +1097,16 @@ class GridTradingStrategy:
                 stats = self.position_map.get_stats()
                 logger.info(f"  Position Map Stats: {stats}")
 
+            logger.info(f"  Event Loop Lag: {self.loop_monitor.get_stats()}")
+            await self.loop_monitor.stop()
+            self.dump_latency()
+
+            # Leave the connection to any other strategies sharing it
+            for subscription in self._feed_subscriptions:
+                await _maybe_await(self.websocket.unsubscribe(subscription))
+            self._feed_subscriptions.clear()
+            self.websocket.remove_reconnect_callback(self.client.invalidate_account_cache)
+
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
 
@@ -9,18 +9,23 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from loguru import logger
 
+from .unit_spacing import UnitSpacing, make_spacing
+
 
 @dataclass
 class OrderRecord:
     """Record of a single order at a unit level"""
     order_id: str
     order_type: str  # "buy" or "sell"
-    status: str  # "active", "filled", "cancelled", "assumed_filled"
+    status: str  # "active", "filled", "cancelled", "replaced", "assumed_filled"
     size: Decimal
     price: Decimal
     timestamp: datetime
     fill_price: Optional[Decimal] = None
     fill_timestamp: Optional[datetime] = None
+    cloid: Optional[str] = None  # Client order id the order was placed with
+    filled_size: Decimal = Decimal("0")  # Sum of the partial fills received so far
+    fill_notional: Decimal = Decimal("0")  # Sum of price * size over those fills
 
 
 @dataclass
@@ -30,7 +35,7 @@ class UnitLevel:
     price: Decimal
     orders: List[OrderRecord] = field(default_factory=list)
 
-    def add_order(self, order_id: str, order_type: str, size: Decimal) -> None:
+    def add_order(self, order_id: str, order_type: str, size: Decimal, cloid: Optional[str] = None) -> None:
         """Add a new order to this unit level"""
         self.orders.append(OrderRecord(
             order_id=order_id,
@@ -38,7 +43,8 @@ class UnitLevel:
             status="active",
             size=size,
             price=self.price,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            cloid=cloid
         ))
 
     def update_order_status(self, order_id: str, status: str, fill_price: Optional[Decimal] = None) -> bool:
@@ -81,16 +87,27 @@ class PositionMap:
     Dictionary where each key is a unit and value contains price and order history.
     """
 
-    def __init__(self, unit_size_usd: Decimal, anchor_price: Decimal):
+    def __init__(
+        self,
+        unit_size_usd: Optional[Decimal] = None,
+        anchor_price: Optional[Decimal] = None,
+        grid_spacing: Optional[Decimal] = None,
+        spacing: Optional[UnitSpacing] = None
+    ):
         """
         Initialize the position map with a buffer of units.
 
         Args:
             unit_size_usd: Dollar amount per unit
             anchor_price: Price at unit 0 (anchor is always at unit 0)
+            grid_spacing: Relative size of one unit instead (e.g., 0.01 for 1% units)
+            spacing: Ready-made spacing (shared with the UnitTracker) instead of the above
         """
-        self.unit_size_usd = unit_size_usd
-        self.anchor_price = anchor_price
+        if spacing is None:
+            spacing = make_spacing(anchor_price, unit_size_usd=unit_size_usd, grid_spacing=grid_spacing)
+        self.spacing = spacing
+        self.unit_size_usd = spacing.unit_size_usd
+        self.anchor_price = spacing.anchor_price
         self.map: Dict[int, UnitLevel] = {}
 
         # Order ID Map for fast lookups of active/cancellable orders
@@ -106,7 +123,7 @@ class PositionMap:
 
     def _calculate_unit_price(self, unit: int) -> Decimal:
         """Calculate the price for a specific unit"""
-        return self.anchor_price + (Decimal(unit) * self.unit_size_usd)
+        return self.spacing.unit_price(unit)
 
     def _ensure_unit_exists(self, unit: int) -> None:
         """Ensure a unit exists in the map, expanding if necessary"""
@@ -115,7 +132,14 @@ class PositionMap:
             self.map[unit] = UnitLevel(unit=unit, price=price)
             logger.info(f"Expanded PositionMap to include unit {unit}")
 
-    def add_order(self, unit: int, order_id: str, order_type: str, size: Decimal) -> None:
+    def add_order(
+        self,
+        unit: int,
+        order_id: str,
+        order_type: str,
+        size: Decimal,
+        cloid: Optional[str] = None
+    ) -> None:
         """
         Add a new order to the position map.
 
@@ -124,11 +148,12 @@ class PositionMap:
             order_id: Unique order identifier
             order_type: "buy" or "sell"
             size: Order size in base currency
+            cloid: Client order id the order was placed with, if any
         """
         self._ensure_unit_exists(unit)
 
         # Add to unit level
-        self.map[unit].add_order(order_id, order_type, size)
+        self.map[unit].add_order(order_id, order_type, size, cloid)
 
         # Add to order ID map for fast lookup
         self.order_id_map[order_id] = unit
@@ -141,7 +166,7 @@ class PositionMap:
 
         Args:
             order_id: Order identifier
-            status: New status ("filled", "cancelled", etc.)
+            status: New status ("filled", "cancelled", "replaced", etc.)
             fill_price: Execution price if filled
 
         Returns:
@@ -165,7 +190,7 @@ class PositionMap:
         if success:
             logger.info(f"Updated order {order_id} at unit {unit} to status: {status}")
             # If an order is officially confirmed as inactive, remove it from the fast-lookup map.
-            if status in ["filled", "cancelled"]:
+            if status in ["filled", "cancelled", "replaced"]:
                 if order_id in self.order_id_map:
                     del self.order_id_map[order_id]
         else:
@@ -229,6 +254,27 @@ class PositionMap:
                 return (unit, order)
         return None
 
+    def record_fill(self, order_id: str, price: Decimal, size: Decimal) -> Optional[tuple[Decimal, Decimal]]:
+        """
+        Accumulate a (possibly partial) fill on an active order.
+
+        Args:
+            order_id: Order identifier
+            price: Price of this fill
+            size: Size of this fill
+
+        Returns:
+            (total filled size, volume-weighted average fill price), or None if the order is not active
+        """
+        order_info = self.get_order_by_id(order_id)
+        if not order_info:
+            return None
+
+        _, order = order_info
+        order.filled_size += size
+        order.fill_notional += price * size
+        return order.filled_size, order.fill_notional / order.filled_size
+
     def get_stats(self) -> dict:
         """Get statistics about the position map"""
         total_orders = sum(len(level.orders) for level in self.map.values())
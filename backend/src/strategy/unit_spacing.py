@@ -0,0 +1,228 @@
+"""
+Unit Spacing: where the unit boundaries of the grid lie.
+
+LinearSpacing puts a boundary every unit_size_usd dollars from the anchor.
+GeometricSpacing puts one every grid_spacing percent (unit n starts at
+anchor * (1 + grid_spacing)^n), so one ladder keeps the same relative step
+while the price moves 10x. Its unit index is found in closed form from the
+logarithm of the price and then checked against the exact Decimal boundaries,
+which are cached, so the cost per lookup does not depend on how far the price
+has moved.
+
+Both also work on integer ticks (price * 10^decimals): a boundary in ticks is
+the smallest tick at or above it, so comparing ticks gives the same unit as
+comparing the Decimal price for any price on the tick grid.
+"""
+
+import math
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+_LN_10 = math.log(10)
+
+
+class UnitSpacing:
+    """
+    Mapping between prices and unit numbers, with unit 0 starting at the anchor.
+    """
+
+    unit_size_usd: Optional[Decimal] = None  # Set by linear spacing
+    grid_spacing: Optional[Decimal] = None  # Set by geometric spacing
+    decimals = 0  # Decimals a tick grid needs to hold every boundary exactly (0: not possible)
+
+    def __init__(self, anchor_price: Decimal):
+        """
+        Initialize the spacing.
+
+        Args:
+            anchor_price: Price where unit 0 starts
+        """
+        self.anchor_price = anchor_price
+
+    def unit_price(self, unit: int) -> Decimal:
+        """Price where a unit starts"""
+        raise NotImplementedError
+
+    def price_at(self, position: Decimal) -> Decimal:
+        """Price at a (possibly fractional) position on the ladder"""
+        raise NotImplementedError
+
+    def position(self, price: Decimal) -> Decimal:
+        """Position of a price on the ladder in fractional units; unit_of is its floor"""
+        raise NotImplementedError
+
+    def unit_of(self, price: Decimal) -> int:
+        """Unit a price falls in"""
+        raise NotImplementedError
+
+    def boundary_ticks(self, unit: int, decimals: int) -> int:
+        """Smallest tick at or above the price where a unit starts"""
+        return math.ceil(self.unit_price(unit).scaleb(decimals))
+
+    def unit_of_ticks(self, ticks: int, decimals: int) -> int:
+        """Unit a price given in ticks falls in"""
+        raise NotImplementedError
+
+    def units_of_ticks(self, ticks: np.ndarray, decimals: int) -> np.ndarray:
+        """Units of an int64 array of prices given in ticks"""
+        raise NotImplementedError
+
+
+class LinearSpacing(UnitSpacing):
+    """
+    A boundary every unit_size_usd dollars.
+    """
+
+    def __init__(self, anchor_price: Decimal, unit_size_usd: Decimal):
+        """
+        Initialize the spacing.
+
+        Args:
+            anchor_price: Price where unit 0 starts
+            unit_size_usd: Dollars per unit
+        """
+        super().__init__(anchor_price)
+        self.unit_size_usd = unit_size_usd
+        self.decimals = max(0, -anchor_price.as_tuple().exponent, -unit_size_usd.as_tuple().exponent)
+        self._tick_grids: Dict[int, Tuple[int, int]] = {}
+
+    def __str__(self) -> str:
+        return f"${self.unit_size_usd}"
+
+    def unit_price(self, unit: int) -> Decimal:
+        return self.anchor_price + (Decimal(unit) * self.unit_size_usd)
+
+    def price_at(self, position: Decimal) -> Decimal:
+        return self.anchor_price + position * self.unit_size_usd
+
+    def position(self, price: Decimal) -> Decimal:
+        return (price - self.anchor_price) / self.unit_size_usd
+
+    def unit_of(self, price: Decimal) -> int:
+        return math.floor((price - self.anchor_price) / self.unit_size_usd)
+
+    def _tick_grid(self, decimals: int) -> Tuple[int, int]:
+        """Anchor and unit size in ticks (exact when decimals >= self.decimals)"""
+        grid = self._tick_grids.get(decimals)
+        if grid is None:
+            grid = (int(self.anchor_price.scaleb(decimals)), int(self.unit_size_usd.scaleb(decimals)))
+            self._tick_grids[decimals] = grid
+        return grid
+
+    def unit_of_ticks(self, ticks: int, decimals: int) -> int:
+        anchor_ticks, unit_ticks = self._tick_grid(decimals)
+        return (ticks - anchor_ticks) // unit_ticks
+
+    def units_of_ticks(self, ticks: np.ndarray, decimals: int) -> np.ndarray:
+        anchor_ticks, unit_ticks = self._tick_grid(decimals)
+        return (ticks - anchor_ticks) // unit_ticks
+
+
+class GeometricSpacing(UnitSpacing):
+    """
+    A boundary every grid_spacing percent: unit n starts at anchor * (1 + grid_spacing)^n.
+    """
+
+    def __init__(self, anchor_price: Decimal, grid_spacing: Decimal):
+        """
+        Initialize the spacing.
+
+        Args:
+            anchor_price: Price where unit 0 starts
+            grid_spacing: Relative size of a unit, e.g. 0.01 for 1%
+        """
+        super().__init__(anchor_price)
+        self.grid_spacing = grid_spacing
+        self.ratio = 1 + grid_spacing
+
+        # Closed-form estimate of the unit, in float
+        self._log_anchor = math.log(anchor_price)
+        self._log_ratio = math.log1p(grid_spacing)
+
+        # Exact boundaries, computed once per unit
+        self._prices: Dict[int, Decimal] = {}
+        self._ticks: Dict[Tuple[int, int], int] = {}
+
+    def __str__(self) -> str:
+        return f"{(self.grid_spacing * 100).normalize()}%"
+
+    def unit_price(self, unit: int) -> Decimal:
+        price = self._prices.get(unit)
+        if price is None:
+            price = self.anchor_price * self.ratio ** unit
+            self._prices[unit] = price
+        return price
+
+    def price_at(self, position: Decimal) -> Decimal:
+        if position == position.to_integral_value():
+            return self.unit_price(int(position))
+        return self.anchor_price * self.ratio ** position
+
+    def position(self, price: Decimal) -> Decimal:
+        return (price / self.anchor_price).ln() / self.ratio.ln()
+
+    def unit_of(self, price: Decimal) -> int:
+        unit = math.floor((math.log(price) - self._log_anchor) / self._log_ratio)
+
+        # The float estimate can be one off right at a boundary
+        while price < self.unit_price(unit):
+            unit -= 1
+        while price >= self.unit_price(unit + 1):
+            unit += 1
+        return unit
+
+    def boundary_ticks(self, unit: int, decimals: int) -> int:
+        ticks = self._ticks.get((unit, decimals))
+        if ticks is None:
+            ticks = math.ceil(self.unit_price(unit).scaleb(decimals))
+            self._ticks[(unit, decimals)] = ticks
+        return ticks
+
+    def _estimate(self, ticks, decimals: int):
+        """Float unit estimate from the log of a price in ticks (scalar or array)"""
+        return (np.log(ticks) - decimals * _LN_10 - self._log_anchor) / self._log_ratio
+
+    def unit_of_ticks(self, ticks: int, decimals: int) -> int:
+        unit = math.floor((math.log(ticks) - decimals * _LN_10 - self._log_anchor) / self._log_ratio)
+
+        while ticks < self.boundary_ticks(unit, decimals):
+            unit -= 1
+        while ticks >= self.boundary_ticks(unit + 1, decimals):
+            unit += 1
+        return unit
+
+    def units_of_ticks(self, ticks: np.ndarray, decimals: int) -> np.ndarray:
+        estimates = np.floor(self._estimate(ticks.astype(np.float64), decimals))
+        low, high = int(estimates.min()) - 1, int(estimates.max()) + 2
+
+        # Exact boundaries over the range the prices span, then a binary search per price
+        boundaries = np.array([self.boundary_ticks(unit, decimals) for unit in range(low, high + 1)], dtype=np.int64)
+        return low + np.searchsorted(boundaries, ticks, side="right") - 1
+
+
+def make_spacing(
+    anchor_price: Decimal,
+    unit_size_usd: Optional[Decimal] = None,
+    grid_spacing: Optional[Decimal] = None
+) -> UnitSpacing:
+    """
+    Build the spacing for a configuration: linear in USD or geometric in percent.
+
+    Args:
+        anchor_price: Price where unit 0 starts
+        unit_size_usd: Dollars per unit, for linear spacing
+        grid_spacing: Relative size of a unit (0.01 = 1%), for geometric spacing
+
+    Returns:
+        LinearSpacing or GeometricSpacing
+
+    Raises:
+        ValueError: Unless exactly one of unit_size_usd and grid_spacing is given
+    """
+    if (unit_size_usd is None) == (grid_spacing is None):
+        raise ValueError("Give exactly one of unit_size_usd (linear) and grid_spacing (geometric)")
+    if grid_spacing is not None:
+        return GeometricSpacing(anchor_price, grid_spacing)
+    return LinearSpacing(anchor_price, unit_size_usd)
@@ -1,15 +1,53 @@
 """
 Unit Tracker: Pure price interpreter that translates price feed to unit movements.
 Emits UnitChangeEvent whenever the price crosses a unit boundary.
+
+The prices where the current unit ends are cached (as Decimals and as integer
+ticks), so a tick that stays inside the unit - nearly all of them - costs two
+comparisons; the unit is only recomputed when one of them is breached.
+
+For research on historical data, process_array runs the same unit logic over a
+whole NumPy array at once and returns the crossings as a structured array.
+
+Where the boundaries lie is up to the UnitSpacing: fixed dollar units or
+geometric (percentage) units.
+
+Optionally a crossing is only confirmed once the price is a set fraction of a
+unit past the boundary (hysteresis) or has stayed past it for a set time
+(dwell). Until then the tracker stays in its unit, so a price flapping a few
+ticks around a boundary does not emit an event - and trigger orders - on every
+flip; the flips it absorbs are counted. tick_bucket_of splits each unit at those
+confirmation thresholds, so a conflated price feed keeps every confirming price.
+
+A UnitTrackerGroup runs several trackers (unit sizes, anchors) off one price
+stream, checking all of them against a single pair of thresholds.
 """
 
 import math
+import time
 from decimal import Decimal
-from dataclasses import dataclass
-from typing import Optional, Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Callable, Sequence, Tuple
+import numpy as np
 from loguru import logger
 from enum import Enum
 
+from ..exchange.instrument_spec import PERP_MAX_DECIMALS
+from ..monitoring.latency import LatencyTrace
+from .unit_spacing import UnitSpacing, make_spacing
+
+# Beyond this many decimals, float prices no longer scale exactly to integer ticks
+MAX_TICK_DECIMALS = 8
+
+# One row per unit crossing found by UnitTracker.process_array
+UNIT_EVENT_DTYPE = np.dtype([
+    ("index", np.int64),  # Position of the crossing price in the input array
+    ("timestamp", np.int64),  # Its timestamp (0 when none were given)
+    ("previous_unit", np.int64),
+    ("current_unit", np.int64),
+    ("direction", np.int8),  # 1 up, -1 down
+])
+
 
 class Direction(Enum):
     UP = "up"
@@ -25,6 +63,8 @@ class UnitChangeEvent:
     price: Decimal
     previous_direction: Direction
     current_direction: Direction
+    detected_ns: int = field(default_factory=time.monotonic_ns)  # When the crossing was detected
+    trace: Optional[LatencyTrace] = None  # Tick-to-trade marks, attached by the consumer of the event
 
 class UnitTracker:
     """
@@ -32,18 +72,64 @@ class UnitTracker:
     Has no knowledge of orders or positions.
     """
 
-    def __init__(self, unit_size_usd: Decimal, anchor_price: Decimal):
+    def __init__(
+        self,
+        unit_size_usd: Optional[Decimal] = None,
+        anchor_price: Optional[Decimal] = None,
+        grid_spacing: Optional[Decimal] = None,
+        spacing: Optional[UnitSpacing] = None,
+        hysteresis: Optional[Decimal] = None,
+        dwell_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """
         Initialize the unit tracker.
 
         Args:
             unit_size_usd: Fixed dollar amount that defines one unit (e.g., $100 for BTC)
             anchor_price: The anchor price at unit 0 (initial position entry price)
+            grid_spacing: Relative size of one unit instead (e.g., 0.01 for 1% units)
+            spacing: Ready-made spacing (shared with the PositionMap) instead of the above
+            hysteresis: Fraction of the new unit the price must be past a boundary to confirm a crossing
+            dwell_seconds: Time past a boundary that also confirms a crossing (checked on the next price)
+            clock: Time source for dwell_seconds
         """
-        self.unit_size_usd = unit_size_usd
+        if spacing is None:
+            spacing = make_spacing(anchor_price, unit_size_usd=unit_size_usd, grid_spacing=grid_spacing)
+        self.spacing = spacing
+        self.unit_size_usd = spacing.unit_size_usd
+        self.grid_spacing = spacing.grid_spacing
 
         # Anchor is always at unit 0
-        self.anchor_price = anchor_price
+        self.anchor_price = spacing.anchor_price
+
+        # Integer-tick grid for float prices from the market-data fast path:
+        # fine enough for any perp price or book mid, and for linear boundaries
+        tick_decimals = max(PERP_MAX_DECIMALS + 1, spacing.decimals)
+        if tick_decimals <= MAX_TICK_DECIMALS:
+            self._tick_decimals = tick_decimals
+            self._tick_scale: Optional[int] = 10 ** tick_decimals
+        else:
+            self._tick_scale = None
+
+        # Crossing confirmation: both None means every crossing is confirmed at once
+        self.hysteresis = hysteresis
+        self.dwell_seconds = dwell_seconds
+        self._clock = clock
+        self._banded = hysteresis is not None or dwell_seconds is not None
+        self._pending_unit: Optional[int] = None  # Unit the price is in but not yet confirmed
+        self._pending_since = 0.0
+        self._band_bounds: Dict[int, Tuple[Any, Any]] = {}  # Per unit: where crossings into it confirm
+
+        # Counters
+        self.suppressed_flips = 0  # Excursions past a boundary that came back unconfirmed
+        self.hysteresis_confirmations = 0
+        self.dwell_confirmations = 0
+
+        # Group the tracker is a member of, told when its thresholds move
+        self._group: Optional["UnitTrackerGroup"] = None
+
+        # Setting current_unit caches the thresholds of the unit
         self.current_unit = 0
         self.previous_unit = 0
 
@@ -55,9 +141,40 @@ class UnitTracker:
         self.on_unit_change: Optional[Callable[[UnitChangeEvent], None]] = None
 
         # Price tracking - will be updated via WebSocket
-        self.current_price = anchor_price
+        self.current_price = self.anchor_price
+
+        logger.info(f"UnitTracker initialized - Anchor: ${self.anchor_price:.2f} at unit 0, Unit Size: {spacing}")
+
+    @property
+    def current_unit(self) -> int:
+        """Unit the price is currently in"""
+        return self._current_unit
+
+    @current_unit.setter
+    def current_unit(self, unit: int) -> None:
+        self._current_unit = unit
+        self._pending_unit = None
+        if self._group is not None:
+            self._group._stale = True
+
+        # Prices (and ticks) where this unit ends: [lower, upper)
+        self._lower = self.spacing.unit_price(unit)
+        self._upper = self.spacing.unit_price(unit + 1)
+        if self._tick_scale is not None:
+            self._lower_ticks = self.spacing.boundary_ticks(unit, self._tick_decimals)
+            self._upper_ticks = self.spacing.boundary_ticks(unit + 1, self._tick_decimals)
 
-        logger.info(f"UnitTracker initialized - Anchor: ${anchor_price:.2f} at unit 0, Unit Size: ${unit_size_usd}")
+    @property
+    def current_price(self) -> Decimal:
+        """Latest price, whether it was given as a Decimal or as integer ticks"""
+        if self._price_ticks is not None:
+            return Decimal(self._price_ticks).scaleb(-self._tick_decimals)
+        return self._price
+
+    @current_price.setter
+    def current_price(self, price: Decimal) -> None:
+        self._price = price
+        self._price_ticks = None
 
     def update_price(self, price: Decimal) -> Optional[UnitChangeEvent]:
         """
@@ -69,19 +186,114 @@ class UnitTracker:
         Returns:
             UnitChangeEvent if a unit boundary was crossed, None otherwise
         """
-        self.current_price = price
+        self._price = price
+        self._price_ticks = None
+
+        # Common case: still inside the current unit
+        if self._lower <= price < self._upper:
+            if self._pending_unit is not None:
+                self._abandon_pending()
+            return None
 
-        # Calculate the new unit based on price
-        price_diff = price - self.anchor_price
-        new_unit = math.floor(price_diff / self.unit_size_usd)
+        if self._banded:
+            return self._confirm(self.unit_of(price), price)
+        return self._cross(self.unit_of(price), price)
 
+    def update_ticks(self, ticks: int) -> Optional[UnitChangeEvent]:
+        """
+        Update the current price given as integer ticks (see to_ticks) and check for
+        unit boundary crossings. Same result as update_price, without any Decimal
+        arithmetic unless a boundary is crossed.
+
+        Args:
+            ticks: New market price in ticks
+
+        Returns:
+            UnitChangeEvent if a unit boundary was crossed, None otherwise
+        """
+        self._price_ticks = ticks
+
+        # Common case: still inside the current unit
+        if self._lower_ticks <= ticks < self._upper_ticks:
+            if self._pending_unit is not None:
+                self._abandon_pending()
+            return None
+
+        if self._banded:
+            return self._confirm(self.spacing.unit_of_ticks(ticks, self._tick_decimals), self.current_price)
+        return self._cross(self.spacing.unit_of_ticks(ticks, self._tick_decimals), self.current_price)
+
+    def to_ticks(self, price: float) -> int:
+        """
+        Convert a float exchange price (or book mid) to integer ticks for update_ticks.
+
+        Args:
+            price: Market price parsed as a float
+
+        Returns:
+            Price in ticks
+
+        Raises:
+            ValueError: If linear boundaries are too fine for an exact tick grid
+        """
+        if self._tick_scale is None:
+            raise ValueError(f"No integer tick grid finer than {MAX_TICK_DECIMALS} decimals")
+        return round(price * self._tick_scale)
+
+    def _abandon_pending(self) -> None:
+        """The price came back into the current unit before the crossing was confirmed"""
+        self._pending_unit = None
+        self.suppressed_flips += 1
+        logger.debug(f"Suppressed unit flip at unit {self.current_unit} ({self.suppressed_flips} so far)")
+
+    def _confirm(self, new_unit: int, price: Decimal) -> Optional[UnitChangeEvent]:
+        """
+        Apply the hysteresis band and dwell time to a price outside the current unit.
+
+        Args:
+            new_unit: Unit the price is in
+            price: The price
+
+        Returns:
+            UnitChangeEvent if the crossing is confirmed, None while it is pending
+        """
+        # Furthest unit the price is past the band of: on a jump over several units,
+        # the ones fully cleared are confirmed even if the last one is not
+        up = new_unit > self.current_unit
+        confirmed = self.current_unit
+        if self.hysteresis is not None:
+            lower, upper = self.spacing.unit_price(new_unit), self.spacing.unit_price(new_unit + 1)
+            band = self.hysteresis * (upper - lower)
+            if up:
+                confirmed = new_unit if price >= lower + band else new_unit - 1
+            else:
+                confirmed = new_unit if price <= upper - band else new_unit + 1
+
+        if confirmed != self.current_unit:
+            self.hysteresis_confirmations += 1
+            return self._cross(confirmed, price)
+
+        # Inside the band: start timing the dwell, or keep timing it while the price stays on this side
+        now = self._clock() if self.dwell_seconds is not None else 0.0
+        if self._pending_unit is None or (self._pending_unit > self.current_unit) != up:
+            if self._pending_unit is not None:
+                self.suppressed_flips += 1  # jumped to the other side of the unit
+            self._pending_since = now
+        elif self.dwell_seconds is not None and now - self._pending_since >= self.dwell_seconds:
+            self.dwell_confirmations += 1
+            return self._cross(new_unit, price)
+        self._pending_unit = new_unit
+        return None
+
+    def _cross(self, new_unit: int, price: Decimal) -> Optional[UnitChangeEvent]:
+        """Move to a new unit and emit its UnitChangeEvent"""
         # Check if we've crossed a unit boundary
         if new_unit != self.current_unit:
             # Store previous state
             self.previous_unit = self.current_unit
             self.previous_direction = self.current_direction
 
-            # Update current state
+            # Update current state (and the cached thresholds)
             self.current_unit = new_unit
 
             # Determine new direction
@@ -112,6 +324,149 @@ class UnitTracker:
 
         return None
 
+    def update_path(self, prices: Sequence[Decimal]) -> List[UnitChangeEvent]:
+        """
+        Ingest a compressed price path: the ordered unit extremes of a batch of
+        trades, ending with the latest price. Reversals inside the batch produce
+        their own events, so whipsaws are not hidden by conflation.
+
+        Args:
+            prices: Ordered path prices (e.g. PriceBatch.path)
+
+        Returns:
+            UnitChangeEvents emitted along the path, in order
+        """
+        events = []
+        for price in prices:
+            event = self.update_price(price)
+            if event:
+                events.append(event)
+        return events
+
+    def process_array(self, prices: np.ndarray, timestamps: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Run a whole array of prices through the tracker in bulk. Finds the same
+        crossings, and leaves the tracker in the same state, as calling
+        update_price on each price in turn, but creates no UnitChangeEvent,
+        logs nothing and does not call on_unit_change.
+
+        Float prices are placed on the integer tick grid (exact for exchange
+        prices and book mids, as with tick_unit_of); arrays of Decimals, or any
+        prices when there is no tick grid, use the Decimal unit math per price.
+
+        Args:
+            prices: Prices in time order (floats, or Decimals in an object array)
+            timestamps: Timestamp of each price, e.g. exchange time in ms
+
+        Returns:
+            Structured array of UNIT_EVENT_DTYPE, one row per crossing, in order
+
+        Raises:
+            ValueError: If timestamps and prices differ in length, or crossings need confirming
+        """
+        prices = np.asarray(prices)
+        if timestamps is not None and len(timestamps) != len(prices):
+            raise ValueError(f"{len(timestamps)} timestamps for {len(prices)} prices")
+        if self._banded:
+            raise ValueError("process_array does not apply hysteresis or dwell time; use update_price")
+        if not len(prices):
+            return np.empty(0, dtype=UNIT_EVENT_DTYPE)
+
+        ticks = None
+        if prices.dtype == object or self._tick_scale is None:
+            units = np.fromiter(
+                (self.unit_of(p if isinstance(p, Decimal) else Decimal(repr(float(p)))) for p in prices),
+                dtype=np.int64,
+                count=len(prices)
+            )
+        else:
+            ticks = np.rint(prices.astype(np.float64) * self._tick_scale).astype(np.int64)
+            units = self.spacing.units_of_ticks(ticks, self._tick_decimals)
+
+        # Unit before each price: the tracker's unit, then the unit of the previous price
+        path = np.concatenate(([self.current_unit], units))
+        index = np.flatnonzero(np.diff(path))
+
+        events = np.empty(len(index), dtype=UNIT_EVENT_DTYPE)
+        events["index"] = index
+        events["timestamp"] = np.asarray(timestamps)[index] if timestamps is not None else 0
+        events["previous_unit"] = path[index]
+        events["current_unit"] = path[index + 1]
+        events["direction"] = np.sign(events["current_unit"] - events["previous_unit"])
+
+        # Leave the tracker where the scalar path would have
+        if len(events):
+            directions = [Direction.UP if d > 0 else Direction.DOWN for d in events["direction"][-2:]]
+            self.previous_direction = directions[0] if len(directions) == 2 else self.current_direction
+            self.current_direction = directions[-1]
+            self.previous_unit = int(events["previous_unit"][-1])
+            self.current_unit = int(events["current_unit"][-1])
+
+        if ticks is not None:
+            self._price_ticks = int(ticks[-1])
+        else:
+            last = prices[-1]
+            self.current_price = last if isinstance(last, Decimal) else Decimal(repr(float(last)))
+
+        return events
+
+    def unit_of(self, price: Decimal) -> int:
+        """
+        Unit that a price falls in.
+
+        Args:
+            price: Market price
+
+        Returns:
+            Unit number (0 is the anchor unit)
+        """
+        return self.spacing.unit_of(price)
+
+    def tick_unit_of(self, price: float) -> int:
+        """
+        Unit that a float price falls in, computed on integer ticks without Decimal.
+        Exact for exchange prices and book mids (at most PERP_MAX_DECIMALS + 1 decimals).
+
+        Args:
+            price: Market price parsed as a float
+
+        Returns:
+            Unit number, same as unit_of(Decimal(str(price)))
+        """
+        if self._tick_scale is None:
+            return self.unit_of(Decimal(repr(price)))
+        return self.spacing.unit_of_ticks(round(price * self._tick_scale), self._tick_decimals)
+
+    def tick_bucket_of(self, price: float) -> Any:
+        """
+        Conflation bucket of a float price: its unit, and with a hysteresis band also which
+        side of the unit's confirmation thresholds it is on. A price that would confirm a
+        crossing is then never in the same bucket as one that would not, so conflating a
+        burst down to its bucket extremes keeps every confirmation.
+
+        Args:
+            price: Market price parsed as a float
+
+        Returns:
+            The unit, or (unit, zone) with zone 0-2 ordered like the price when hysteresis is set
+        """
+        unit = self.tick_unit_of(price)
+        if self.hysteresis is None:
+            return unit
+
+        bounds = self._band_bounds.get(unit)
+        if bounds is None:
+            lower, upper = self.spacing.unit_price(unit), self.spacing.unit_price(unit + 1)
+            band = self.hysteresis * (upper - lower)
+            up, down = lower + band, upper - band  # Confirms up at or above up, down at or below down
+            if self._tick_scale is not None:
+                up, down = math.ceil(up.scaleb(self._tick_decimals)), math.floor(down.scaleb(self._tick_decimals))
+            bounds = self._band_bounds[unit] = (up, down)
+
+        up, down = bounds
+        value = Decimal(repr(price)) if self._tick_scale is None else round(price * self._tick_scale)
+        return unit, (value >= up) + (value > down)
+
     def get_unit_price(self, unit: int) -> Decimal:
         """
         Calculate the price for a specific unit.
@@ -125,7 +480,31 @@ class UnitTracker:
         Returns:
             Price at the unit boundary
         """
-        return self.anchor_price + (Decimal(unit) * self.unit_size_usd)
+        return self.spacing.unit_price(unit)
+
+    def price_to_unit(self, price: Decimal) -> Decimal:
+        """
+        Position of a price on the ladder, in fractional units (unit_of is its floor).
+
+        Args:
+            price: Market price
+
+        Returns:
+            Units from the anchor, e.g. Decimal("2.5") halfway through unit 2
+        """
+        return self.spacing.position(price)
+
+    def unit_to_price(self, unit) -> Decimal:
+        """
+        Price at a (possibly fractional) position on the ladder; inverse of price_to_unit.
+
+        Args:
+            unit: Units from the anchor, int or Decimal
+
+        Returns:
+            Price at that position
+        """
+        return self.spacing.price_at(Decimal(unit))
 
     def get_state(self) -> dict:
         """
@@ -141,5 +520,191 @@ class UnitTracker:
             "previous_direction": self.previous_direction.value,
             "current_price": float(self.current_price),
             "anchor_price": float(self.anchor_price),
-            "unit_size_usd": float(self.unit_size_usd)
-        }
\ No newline at end of file
+            "unit_size_usd": float(self.unit_size_usd) if self.unit_size_usd is not None else None,
+            "grid_spacing": float(self.grid_spacing) if self.grid_spacing is not None else None,
+            "pending_unit": self._pending_unit,
+            "suppressed_flips": self.suppressed_flips,
+            "hysteresis_confirmations": self.hysteresis_confirmations,
+            "dwell_confirmations": self.dwell_confirmations
+        }
+
+
+class UnitTrackerGroup:
+    """
+    Several UnitTrackers (different unit sizes or anchors) updated from one price
+    stream in a single pass.
+
+    The group caches the intersection of its members' current units as one
+    threshold pair, so a price inside it is settled for every member with two
+    comparisons; members are only evaluated (each against its own cached
+    thresholds) when that band is breached. Each member still dispatches its own
+    events through its own on_unit_change. Members built on one shared spacing
+    also share its boundary cache. Members should only be fed through the group.
+    """
+
+    def __init__(self, trackers: Optional[Dict[str, UnitTracker]] = None):
+        """
+        Initialize the group.
+
+        Args:
+            trackers: Members by name, e.g. {"grid": tracker, "coarse": other}
+        """
+        self.trackers: Dict[str, UnitTracker] = {}
+        self._members: List[Tuple[str, UnitTracker]] = []
+        self._member_trackers: List[UnitTracker] = []
+        self._lower: Optional[Decimal] = None
+        self._upper: Optional[Decimal] = None
+        self._stale = True  # The band must be rebuilt before the next fast-path check
+
+        # Counters
+        self.fast_path_ticks = 0  # Ticks settled by the shared band alone
+        self.evaluated_ticks = 0  # Ticks that had to be checked member by member
+        self.events: Dict[str, int] = {}
+
+        for name, tracker in (trackers or {}).items():
+            self.add(name, tracker)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __getitem__(self, name: str) -> UnitTracker:
+        return self.trackers[name]
+
+    def add(self, name: str, tracker: UnitTracker) -> None:
+        """
+        Add a member.
+
+        Args:
+            name: Name its events are reported under
+            tracker: Tracker to update from the group's stream
+
+        Raises:
+            ValueError: If the name or the tracker is already in a group
+        """
+        if name in self.trackers or tracker._group is not None:
+            raise ValueError(f"Tracker {name} is already in a group")
+        tracker._group = self
+        tracker._price_ticks = None  # the group keeps only the Decimal price up to date
+        self.trackers[name] = tracker
+        self._members.append((name, tracker))
+        self._member_trackers.append(tracker)
+        self.events[name] = 0
+        self._stale = True
+
+    def remove(self, name: str) -> UnitTracker:
+        """
+        Remove a member.
+
+        Args:
+            name: Member name
+
+        Returns:
+            The removed tracker
+        """
+        tracker = self.trackers.pop(name)
+        tracker._group = None
+        self._members = [(n, t) for n, t in self._members if n != name]
+        self._member_trackers.remove(tracker)
+        self._stale = True
+        return tracker
+
+    def _refresh(self) -> None:
+        """Rebuild the shared band; none while a member has a crossing pending"""
+        self._stale = False
+        if not self._members or any(tracker._pending_unit is not None for _, tracker in self._members):
+            self._lower = self._upper = None
+            return
+        self._lower = max(tracker._lower for _, tracker in self._members)
+        self._upper = min(tracker._upper for _, tracker in self._members)
+
+    def update_price(self, price: Decimal) -> List[Tuple[str, UnitChangeEvent]]:
+        """
+        Update every member with a new price.
+
+        Args:
+            price: New market price
+
+        Returns:
+            (member name, UnitChangeEvent) for every member that crossed a boundary
+        """
+        if self._stale:
+            self._refresh()
+
+        # Common case: inside the current unit of every member
+        lower = self._lower
+        if lower is not None and lower <= price < self._upper:
+            self.fast_path_ticks += 1
+            for tracker in self._member_trackers:
+                tracker._price = price
+            return []
+
+        self.evaluated_ticks += 1
+        events = []
+        for name, tracker in self._members:
+            event = tracker.update_price(price)
+            if event:
+                self.events[name] += 1
+                events.append((name, event))
+        self._refresh()
+        return events
+
+    def update_path(self, prices: Sequence[Decimal]) -> List[Tuple[str, UnitChangeEvent]]:
+        """
+        Ingest a compressed price path (see UnitTracker.update_path) for every member.
+
+        Args:
+            prices: Ordered path prices
+
+        Returns:
+            (member name, UnitChangeEvent) in the order they happened along the path
+        """
+        events = []
+        for price in prices:
+            events.extend(self.update_price(price))
+        return events
+
+    def tick_unit_of(self, price: float) -> Any:
+        """
+        Units of a float price: changes whenever the unit of any member does.
+
+        Args:
+            price: Market price parsed as a float
+
+        Returns:
+            The unit of the only member, or a tuple of every member's unit
+        """
+        if len(self._members) == 1:
+            return self._members[0][1].tick_unit_of(price)
+        return tuple(tracker.tick_unit_of(price) for _, tracker in self._members)
+
+    def tick_bucket_of(self, price: float) -> Any:
+        """
+        Bucket of a float price for feed conflation (see UnitTracker.tick_bucket_of):
+        changes whenever the bucket of any member does.
+
+        Args:
+            price: Market price parsed as a float
+
+        Returns:
+            The bucket of the only member, or a tuple of every member's bucket
+        """
+        if len(self._members) == 1:
+            return self._members[0][1].tick_bucket_of(price)
+        return tuple(tracker.tick_bucket_of(price) for _, tracker in self._members)
+
+    def get_stats(self) -> dict:
+        """Get per-member units and event counts, and how often the shared band settled a tick"""
+        return {
+            "ticks": self.fast_path_ticks + self.evaluated_ticks,
+            "fast_path_ticks": self.fast_path_ticks,
+            "members": {
+                name: {
+                    "unit_size": str(tracker.spacing),
+                    "anchor_price": float(tracker.anchor_price),
+                    "current_unit": tracker.current_unit,
+                    "events": self.events[name],
+                    "suppressed_flips": tracker.suppressed_flips,
+                }
+                for name, tracker in self._members
+            },
+        }
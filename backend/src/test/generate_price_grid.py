@@ -29,8 +29,8 @@ def generate_and_print_grid():
     print(f"Target Units: {TARGET_UNITS}")
     print("-" * 40)
 
-    # Initialize the UnitTracker
-    unit_tracker = UnitTracker(grid_spacing=GRID_SPACING, target_units=TARGET_UNITS)
+    # Initialize the UnitTracker on a geometric ladder anchored at the starting price
+    unit_tracker = UnitTracker(grid_spacing=GRID_SPACING, anchor_price=STARTING_PRICE)
     unit_tracker.current_price = STARTING_PRICE
     
     # Calculate the current unit index based on the starting price
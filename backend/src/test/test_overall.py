@@ -28,7 +28,7 @@ def test_unit_to_price_from_table(current_price, unit_index, expected_price):
     Tests the unit_to_price calculation against a predefined table of examples.
     This is the pytest equivalent of the visual table from the video.
     """
-    tracker = UnitTracker(grid_spacing=Decimal("0.01"), target_units=100)
+    tracker = UnitTracker(grid_spacing=Decimal("0.01"), anchor_price=current_price)
     tracker.current_price = current_price
     # Set the center of the grid for calculation purposes
     tracker.units_held = tracker.price_to_unit(current_price) 
@@ -44,10 +44,10 @@ def test_unit_to_price_from_table(current_price, unit_index, expected_price):
 def unit_tracker_and_price(draw):
     """A Hypothesis strategy to generate a UnitTracker and a random price."""
     grid_spacing = draw(st.decimals(min_value=Decimal("0.001"), max_value=Decimal("0.1"), places=4))
-    target_units = draw(st.integers(min_value=10, max_value=200))
+    anchor_price = draw(st.decimals(min_value=Decimal("10"), max_value=Decimal("10000"), places=4))
     current_price = draw(st.decimals(min_value=Decimal("10"), max_value=Decimal("10000"), places=4))
     
-    tracker = UnitTracker(grid_spacing=grid_spacing, target_units=target_units)
+    tracker = UnitTracker(grid_spacing=grid_spacing, anchor_price=anchor_price)
     tracker.current_price = current_price
     return tracker, current_price
 
@@ -66,7 +66,7 @@ def test_property_price_to_unit_is_inverse_of_unit_to_price(data):
 
 @given(tracker=st.builds(UnitTracker,
                         grid_spacing=st.decimals(min_value=Decimal("0.001"), max_value=Decimal("0.1"), places=4),
-                        target_units=st.integers(min_value=10, max_value=200)),
+                        anchor_price=st.decimals(min_value=Decimal("10"), max_value=Decimal("10000"), places=4)),
        unit=st.integers(min_value=-50, max_value=50))
 def test_property_unit_to_price_is_monotonic(tracker, unit):
     """
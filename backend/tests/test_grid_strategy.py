@@ -11,13 +11,17 @@ from datetime import datetime
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from strategy.grid_strategy import GridTradingStrategy
-from strategy.data_models import StrategyConfig, StrategyState
-from strategy.unit_tracker import UnitTracker, UnitChangeEvent, Direction
-from strategy.position_map import PositionMap
-from exchange.hyperliquid_sdk import OrderResult
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.strategy.grid_strategy import GridTradingStrategy
+from src.strategy.data_models import StrategyConfig, StrategyState
+from src.strategy.unit_tracker import UnitTracker, UnitTrackerGroup, UnitChangeEvent, Direction
+from src.strategy.position_map import PositionMap
+from src.exchange.hyperliquid_sdk import OrderResult
+from src.exchange.market_data import PriceSource
+from src.monitoring.latency import LatencyTrace, current_trace
 
 
 @pytest.fixture
@@ -38,7 +42,7 @@ def mock_client():
     )
     
     # Mock successful order placements
-    def mock_place_limit(symbol, is_buy, price, size, reduce_only=False, post_only=True):
+    def mock_place_limit(symbol, is_buy, price, size, reduce_only=False, post_only=True, cloid=None):
         return OrderResult(
             success=True,
             order_id=f"order_{int(price)}",
@@ -46,7 +50,7 @@ def mock_client():
             average_price=price
         )
     
-    def mock_place_stop_buy(symbol, size, trigger_price, limit_price, reduce_only=False):
+    def mock_place_stop_buy(symbol, size, trigger_price, limit_price, reduce_only=False, cloid=None):
         return OrderResult(
             success=True,
             order_id=f"buy_order_{int(trigger_price)}",
@@ -54,9 +58,28 @@ def mock_client():
             average_price=trigger_price
         )
     
+    def mock_place_orders_bulk(specs):
+        return [
+            OrderResult(
+                success=True,
+                order_id=f"order_{int(spec.price)}",
+                filled_size=Decimal("0"),
+                average_price=spec.price
+            )
+            for spec in specs
+        ]
+
     client.place_limit_order = Mock(side_effect=mock_place_limit)
     client.place_stop_buy = Mock(side_effect=mock_place_stop_buy)
+    client.place_orders_bulk = Mock(side_effect=mock_place_orders_bulk)
     client.cancel_order.return_value = True
+    client.cancel_orders_bulk = Mock(side_effect=lambda symbol, order_ids: {oid: True for oid in order_ids})
+    client.replace_order = Mock(side_effect=lambda order_id, order: OrderResult(
+        success=True,
+        order_id=f"moved_{int(order.price)}",
+        filled_size=Decimal("0"),
+        average_price=order.price
+    ))
     client.calculate_position_size.return_value = Decimal("1.25")
     client.get_open_orders.return_value = []
     
@@ -69,6 +92,7 @@ def mock_websocket():
     ws = Mock()
     ws.connect = AsyncMock(return_value=True)
     ws.subscribe_to_trades = AsyncMock(return_value=True)
+    ws.subscribe_to_book = AsyncMock(return_value=True)
     ws.subscribe_to_user_fills = AsyncMock(return_value=True)
     ws.subscribe_to_order_updates = AsyncMock(return_value=True)
     ws.disconnect = AsyncMock()
@@ -98,6 +122,7 @@ async def initialized_strategy(strategy_config, mock_client, mock_websocket):
         unit_size_usd=strategy_config.unit_size_usd,
         anchor_price=Decimal("2000")
     )
+    strategy.unit_trackers = UnitTrackerGroup({"grid": strategy.unit_tracker})
     strategy.position_map = PositionMap(
         unit_size_usd=strategy_config.unit_size_usd,
         anchor_price=Decimal("2000")
@@ -130,19 +155,312 @@ class TestInitialization:
         assert len(initialized_strategy.trailing_buy) == 0
         assert initialized_strategy.fragments_invested == 4
 
+    @pytest.mark.asyncio
+    async def test_failed_initialization_leaves_no_loop_monitor_running(self, strategy_config, mock_client, mock_websocket):
+        """The event loop lag probe only starts once initialization succeeds"""
+        mock_client.set_leverage.return_value = False
+        strategy = GridTradingStrategy(strategy_config, mock_client, mock_websocket)
+
+        assert not await strategy.initialize()
+        assert strategy.loop_monitor._task is None
+
+
+class TestBulkPlacement:
+    """Test that multi-order placements go out as one batch"""
+
+    @pytest.mark.asyncio
+    async def test_initial_grid_is_one_bulk_request(self, initialized_strategy, mock_client):
+        """Test that the initial grid is placed with a single bulk call"""
+        initialized_strategy.trailing_stop = []
+
+        assert await initialized_strategy._place_initial_grid()
+
+        assert mock_client.place_orders_bulk.call_count == 1
+        assert mock_client.place_limit_order.call_count == 0
+        specs = mock_client.place_orders_bulk.call_args[0][0]
+        assert [spec.price for spec in specs] == [Decimal("1999"), Decimal("1998"), Decimal("1997"), Decimal("1996")]
+        assert initialized_strategy.trailing_stop == [-4, -3, -2, -1]
+
+    @pytest.mark.asyncio
+    async def test_initial_grid_orders_carry_unique_cloids(self, initialized_strategy, mock_client):
+        """Test that every order is sent and recorded with its own cloid"""
+        initialized_strategy.trailing_stop = []
+
+        assert await initialized_strategy._place_initial_grid()
+
+        specs = mock_client.place_orders_bulk.call_args[0][0]
+        cloids = [spec.cloid for spec in specs]
+        assert len(set(cloids)) == 4 and None not in cloids
+        unit, order = initialized_strategy.position_map.get_order_by_id("order_1999")
+        assert unit == -1 and order.cloid == cloids[0]
+
+    @pytest.mark.asyncio
+    async def test_initial_grid_fails_if_any_order_fails(self, initialized_strategy, mock_client):
+        """Test that a partially rejected batch aborts initialization"""
+        initialized_strategy.trailing_stop = []
+        mock_client.place_orders_bulk.side_effect = lambda specs: [
+            OrderResult(success=True, order_id="ok_1"),
+            OrderResult(success=False, error_message="Insufficient margin"),
+            OrderResult(success=True, order_id="ok_3"),
+            OrderResult(success=True, order_id="ok_4"),
+        ]
+
+        assert not await initialized_strategy._place_initial_grid()
+
+    @pytest.mark.asyncio
+    async def test_whipsaw_catchup_is_one_bulk_request(self, initialized_strategy, mock_client):
+        """Test that catch-up sells after a whipsaw are batched"""
+        initialized_strategy.trailing_stop = [-5, -4, -3, -2]
+
+        await initialized_strategy._catchup_sells_after_whipsaw(2)
+
+        assert mock_client.place_orders_bulk.call_count == 1
+        assert sorted(initialized_strategy.trailing_stop) == [-2, -1, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_excess_sells_cancelled_in_one_request(self, initialized_strategy, mock_client):
+        """Test that trimming several sells issues a single bulk cancel"""
+        initialized_strategy.trailing_stop = [-5, -4, -3, -2]
+        initialized_strategy.position_map.add_order(-5, "sell_-5", "sell", Decimal("1"))
+        initialized_strategy.position_map.add_order(-4, "sell_-4", "sell", Decimal("1"))
+
+        await initialized_strategy._catchup_sells_after_whipsaw(2)
+
+        assert mock_client.cancel_orders_bulk.call_count == 1
+        assert mock_client.cancel_order.call_count == 0
+        _, order_ids = mock_client.cancel_orders_bulk.call_args[0]
+        assert {"sell_-4", "sell_-5"} <= set(order_ids)
+        assert not initialized_strategy.position_map.has_active_order_at_unit(-5)
+
+
+class TestWindowSlide:
+    """Test that one-unit window slides modify the oldest order in place"""
+
+    @pytest.mark.asyncio
+    async def test_unit_up_moves_oldest_sell(self, initialized_strategy, mock_client):
+        """Test that a unit up is one modify instead of a place and a cancel"""
+        await initialized_strategy._process_unit_up(1)
+
+        assert mock_client.replace_order.call_count == 1
+        assert mock_client.place_limit_order.call_count == 0
+        assert mock_client.cancel_orders_bulk.call_count == 0
+        order_id, spec = mock_client.replace_order.call_args[0]
+        assert order_id == "sell_order_-4"
+        assert spec.price == Decimal("2000")
+        assert initialized_strategy.trailing_stop == [-3, -2, -1, 0]
+        assert not initialized_strategy.position_map.has_active_order_at_unit(-4)
+        assert initialized_strategy.position_map.get_active_orders_at_unit(0)[0].order_id == "moved_2000"
+
+    @pytest.mark.asyncio
+    async def test_unit_down_moves_highest_buy(self, initialized_strategy, mock_client):
+        """Test that a full buy window slides down with one modify"""
+        initialized_strategy.trailing_buy = [4, 3, 2, 1]
+        for unit in initialized_strategy.trailing_buy:
+            initialized_strategy.position_map.add_order(unit, f"buy_order_{unit}", "buy", Decimal("1.25"))
+
+        await initialized_strategy._process_unit_down(-1)
+
+        assert mock_client.replace_order.call_count == 1
+        assert mock_client.place_stop_buy.call_count == 0
+        _, spec = mock_client.replace_order.call_args[0]
+        assert spec.is_buy and spec.trigger_price == Decimal("2000")
+        assert initialized_strategy.trailing_buy == [3, 2, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_failed_modify_falls_back_to_place_and_cancel(self, initialized_strategy, mock_client):
+        """Test that a rejected modify keeps the old place-then-cancel path"""
+        mock_client.replace_order.side_effect = lambda order_id, order: OrderResult(
+            success=False, error_message="Cannot modify canceled or filled order"
+        )
+
+        await initialized_strategy._process_unit_up(1)
+
+        assert mock_client.place_limit_order.call_count == 1
+        assert mock_client.cancel_orders_bulk.call_count == 1
+        assert initialized_strategy.trailing_stop == [-3, -2, -1, 0]
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_unit_changes_move_different_orders(self, initialized_strategy, mock_client):
+        """Test that a second unit change waits for the first one's modify instead of racing it"""
+        in_flight = []
+
+        async def slow_replace(order_id, order):
+            in_flight.append(order_id)
+            assert len(in_flight) == 1, f"modifies overlapped: {in_flight}"
+            await asyncio.sleep(0.01)
+            in_flight.remove(order_id)
+            return OrderResult(success=True, order_id=f"moved_{int(order.price)}",
+                               filled_size=Decimal("0"), average_price=order.price)
+        mock_client.replace_order = Mock(side_effect=slow_replace)
+
+        for previous, current in ((0, 1), (1, 2)):
+            initialized_strategy._on_unit_change(UnitChangeEvent(
+                previous_unit=previous, current_unit=current, price=Decimal(2000 + current),
+                previous_direction=Direction.UP, current_direction=Direction.UP
+            ))
+        await asyncio.gather(*initialized_strategy._unit_change_tasks)
+
+        moved = [call.args[0] for call in mock_client.replace_order.call_args_list]
+        assert moved == ["sell_order_-4", "sell_order_-3"]
+        assert initialized_strategy.trailing_stop == [-2, -1, 0, 1]
+        assert not initialized_strategy.position_map.has_active_order_at_unit(-3)
+
+    @pytest.mark.asyncio
+    async def test_fill_during_modify_waits_for_the_slide(self, initialized_strategy, mock_client):
+        """Test that a fill of the order being moved is handled after the modify, against the settled window"""
+        in_flight = []
+        fill_tasks = []
+
+        async def replace_while_filling(order_id, order):
+            in_flight.append(order_id)
+            fill_tasks.append(asyncio.create_task(initialized_strategy.process_fill_confirmation(
+                order_id, Decimal("1996"), Decimal("1.25")
+            )))
+            await asyncio.sleep(0.01)
+            in_flight.remove(order_id)
+            return OrderResult(success=False, error_message="Cannot modify canceled or filled order")
+        mock_client.replace_order = Mock(side_effect=replace_while_filling)
+        mock_client.cancel_orders_bulk = Mock(side_effect=lambda symbol, order_ids: {oid: False for oid in order_ids})
+
+        def place_stop_buy(*args, **kwargs):
+            assert not in_flight, "fill handled while the window was mid-slide"
+            return OrderResult(success=True, order_id="replacement_buy", filled_size=Decimal("0"),
+                               average_price=kwargs["trigger_price"])
+        mock_client.place_stop_buy = Mock(side_effect=place_stop_buy)
+
+        initialized_strategy._on_unit_change(UnitChangeEvent(
+            previous_unit=0, current_unit=1, price=Decimal("2001"),
+            previous_direction=Direction.UP, current_direction=Direction.UP
+        ))
+        await asyncio.gather(*initialized_strategy._unit_change_tasks)
+        await asyncio.gather(*fill_tasks)
+
+        # Four live sells, the filled one replaced by a buy
+        assert initialized_strategy.trailing_stop == [-3, -2, -1, 0]
+        assert all(initialized_strategy.position_map.has_active_order_at_unit(unit)
+                   for unit in initialized_strategy.trailing_stop)
+        assert initialized_strategy.trailing_buy == [1]
+        assert initialized_strategy.fragments_invested == 3
+
+    @pytest.mark.asyncio
+    async def test_slide_rolls_back_when_modify_raises(self, initialized_strategy, mock_client):
+        """Test that the window is restored if the modify call fails outright"""
+        mock_client.replace_order = Mock(side_effect=ConnectionError("socket closed"))
+
+        with pytest.raises(ConnectionError):
+            await initialized_strategy._process_unit_up(1)
+
+        assert initialized_strategy.trailing_stop == [-4, -3, -2, -1]
+
+
+class TestPriceFeed:
+    """Test that streamed prices are shared with the client"""
+
+    @pytest.mark.asyncio
+    async def test_price_updates_feed_client_provider(self, initialized_strategy, mock_client):
+        mock_client.set_price_provider.assert_called_once_with(initialized_strategy.price_feed)
+
+        initialized_strategy._on_price_update(Decimal("2000.5"))
+
+        assert initialized_strategy.price_feed.get_price("ETH") == Decimal("2000.5")
+
+    @pytest.mark.asyncio
+    async def test_book_price_source_subscribes_to_bbo(self, initialized_strategy, mock_websocket):
+        initialized_strategy.config.price_source = "bid"
+
+        await initialized_strategy._setup_websocket_subscriptions()
+
+        assert mock_websocket.subscribe_to_book.call_args.kwargs["source"] is PriceSource.BID
+        assert "path_callback" not in mock_websocket.subscribe_to_trades.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_price_path_drives_unit_tracker(self, initialized_strategy):
+        events = []
+        initialized_strategy.unit_tracker.on_unit_change = events.append
+
+        initialized_strategy._on_price_path([Decimal("2002.5"), Decimal("2000.5")])
+
+        assert [(e.previous_unit, e.current_unit) for e in events] == [(0, 2), (2, 0)]
+        assert initialized_strategy.price_feed.get_price("ETH") == Decimal("2000.5")
+
+    @pytest.mark.asyncio
+    async def test_diagnostic_status_reports_unit_trackers(self, initialized_strategy):
+        initialized_strategy._on_price_update(Decimal("2001.5"))
+
+        status = initialized_strategy.get_diagnostic_status()
+
+        assert status["current_unit"] == 1
+        assert status["suppressed_unit_flips"] == 0
+        assert status["unit_trackers"]["members"]["grid"]["current_unit"] == 1
+        assert status["whipsaw_active"] is False
+
+    @pytest.mark.asyncio
+    async def test_compared_unit_size_is_tracked_without_orders(self, initialized_strategy, mock_client):
+        events = []
+        initialized_strategy.unit_tracker.on_unit_change = events.append
+        initialized_strategy.unit_trackers.add("compare:0.25", UnitTracker(
+            unit_size_usd=Decimal("0.25"), anchor_price=Decimal("2000")
+        ))
+
+        initialized_strategy._on_price_update(Decimal("2000.6"))
+
+        stats = initialized_strategy.unit_trackers.get_stats()["members"]
+        assert events == []  # still unit 0 of the $1 grid
+        assert stats["compare:0.25"]["current_unit"] == 2
+        assert stats["compare:0.25"]["events"] == 1
+        mock_client.place_limit_order.assert_not_called()
+
+
+class TestLatencyTracing:
+    """Test that unit-change orders carry the price batch's latency trace"""
+
+    @pytest.mark.asyncio
+    async def test_unit_change_order_records_tick_to_trade(self, initialized_strategy):
+        initialized_strategy.unit_tracker.on_unit_change = initialized_strategy._on_unit_change
+        trace = LatencyTrace(received_ns=1, decoded_ns=2)
+        token = current_trace.set(trace)
+        try:
+            initialized_strategy._on_price_update(Decimal("1998.5"))  # unit 0 -> -2
+        finally:
+            current_trace.reset(token)
+        await asyncio.gather(*initialized_strategy._unit_change_tasks)
+
+        stats = initialized_strategy.latency.get_stats()
+        assert stats["tick_to_trade"]["samples"] >= 1
+        assert stats["schedule"]["samples"] >= 1
+        assert trace.detected_ns is None  # every event traces a copy
+
+    @pytest.mark.asyncio
+    async def test_untraced_orders_record_nothing(self, initialized_strategy):
+        await initialized_strategy._place_buy_order_at_unit(1)
+
+        assert initialized_strategy.latency.get_stats()["tick_to_trade"]["samples"] == 0
+
 
 class TestUnitUpMovement:
     """Test price moving up (trending up)"""
     
     @pytest.mark.asyncio
-    async def test_single_unit_up_places_new_sell(self, initialized_strategy):
-        """Test that moving up 1 unit places a new sell order"""
+    async def test_single_unit_up_places_new_sell(self, initialized_strategy, mock_client):
+        """Test that moving up 1 unit moves the oldest sell to the new unit with one modify"""
+        window_sizes = []
+        replace = mock_client.replace_order.side_effect
+
+        def recording_replace(order_id, order):
+            window_sizes.append(len(initialized_strategy.trailing_stop))
+            return replace(order_id, order)
+        mock_client.replace_order.side_effect = recording_replace
+
         # Move from unit 0 to unit 1
         await initialized_strategy._process_unit_up(1)
         
-        # Should have placed sell at unit 0
+        # Should have moved the sell at unit -4 to unit 0, never holding 5
+        mock_client.replace_order.assert_called_once()
+        assert mock_client.replace_order.call_args[0][0] == "sell_order_-4"
+        assert window_sizes == [4]
+        assert [o.status for o in initialized_strategy.position_map.map[-4].orders] == ["replaced"]
         assert 0 in initialized_strategy.trailing_stop
-        assert len(initialized_strategy.trailing_stop) == 5  # Temporarily 5 before cancel
+        assert len(initialized_strategy.trailing_stop) == 4
     
     @pytest.mark.asyncio
     async def test_unit_up_cancels_oldest_when_over_4(self, initialized_strategy):
@@ -156,15 +474,19 @@ class TestUnitUpMovement:
         assert initialized_strategy.trailing_stop == [-3, -2, -1, 0]
     
     @pytest.mark.asyncio
-    async def test_multiple_units_up(self, initialized_strategy):
+    async def test_multiple_units_up(self, initialized_strategy, mock_client):
         """Test moving up multiple units in sequence"""
         # Simulate price moving from 0 to 3
         for unit in [1, 2, 3]:
             await initialized_strategy._process_unit_up(unit)
         
-        # Should have sells at [0, 1, 2] (oldest ones cancelled)
-        assert initialized_strategy.trailing_stop == [0, 1, 2]
-        assert len(initialized_strategy.trailing_stop) == 4
+        # Each step moved the oldest sell up (nothing placed or cancelled)
+        moved = [call.args[0] for call in mock_client.replace_order.call_args_list]
+        assert moved == ["sell_order_-4", "sell_order_-3", "sell_order_-2"]
+        assert mock_client.cancel_orders_bulk.call_count == 0
+        for unit in (-4, -3, -2):
+            assert [o.status for o in initialized_strategy.position_map.map[unit].orders] == ["replaced"]
+        assert initialized_strategy.trailing_stop == [-1, 0, 1, 2]
     
     @pytest.mark.asyncio
     async def test_unit_up_skips_existing_unit(self, initialized_strategy):
@@ -393,6 +715,34 @@ class TestEdgeCases:
         # Should not change anything
         assert initialized_strategy.fragments_invested == fragments_after_first
 
+    @pytest.mark.asyncio
+    async def test_partial_fills_replace_once_at_average_price(self, initialized_strategy, mock_client):
+        """Test that an order filled in pieces is replaced only when complete"""
+        await initialized_strategy.process_fill_confirmation(
+            "sell_order_-1", Decimal("1999"), Decimal("0.625")
+        )
+
+        # Half filled: still working, nothing replaced
+        assert initialized_strategy.fragments_invested == 4
+        assert -1 in initialized_strategy.trailing_stop
+        mock_client.place_stop_buy.assert_not_called()
+
+        await initialized_strategy.process_fill_confirmation(
+            "sell_order_-1", Decimal("1998"), Decimal("0.625")
+        )
+
+        _, order = initialized_strategy.position_map.get_last_filled_order()
+        assert order.order_id == "sell_order_-1"
+        assert order.fill_price == Decimal("1998.5")
+        assert initialized_strategy.fragments_invested == 3
+        assert initialized_strategy.trailing_buy == [1]
+
+        # Metrics book the whole order once, at the average price
+        metrics = initialized_strategy.metrics
+        assert metrics.current_position_size == Decimal("3.75")
+        assert metrics.realized_pnl == (Decimal("1998.5") - Decimal("2000")) * Decimal("1.25")
+        assert metrics.total_trades == 1
+
 
 class TestIntegrationScenarios:
     """Test complete trading scenarios"""
@@ -406,9 +756,11 @@ class TestIntegrationScenarios:
         for unit in range(1, 4):
             await initialized_strategy._process_unit_up(unit)
         
-        # Should have moved grid up
-        assert initialized_strategy.trailing_stop == [0, 1, 2]
-        assert len(initialized_strategy.trailing_stop) == 4
+        # Should have moved grid up, one modify per unit
+        assert initialized_strategy.trailing_stop == [-1, 0, 1, 2]
+        assert all(initialized_strategy.position_map.has_active_order_at_unit(unit)
+                   for unit in initialized_strategy.trailing_stop)
+        assert initialized_strategy.position_map.get_stats()["active_orders_managed"] == 4
     
     @pytest.mark.asyncio
     async def test_trending_down_then_up_scenario(self, initialized_strategy):
@@ -0,0 +1,278 @@
+"""
+Tests for AsyncHyperliquidClient using an in-memory httpx transport.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+import httpx
+from decimal import Decimal
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.exchange.wallet_config import WalletConfig
+from src.exchange.hyperliquid_async import AsyncHyperliquidClient
+from src.exchange.hyperliquid_sdk import OrderSpec
+from src.exchange.snapshot_cache import AsyncSnapshotCache
+from src.exchange.rate_limiter import RequestScheduler, Priority, action_priority, action_weight, info_weight
+from src.monitoring.event_loop_monitor import EventLoopLagMonitor
+from src.monitoring.latency import LatencyTrace, current_trace
+
+
+META = {
+    "universe": [
+        {"name": "BTC", "szDecimals": 5, "maxLeverage": 40},
+        {"name": "SOL", "szDecimals": 2, "maxLeverage": 20},
+    ]
+}
+
+
+class FakeExchange:
+    """Records requests and answers /info and /exchange like Hyperliquid"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append((request.url.path, body))
+
+        if request.url.path == "/info":
+            if body["type"] == "meta":
+                return httpx.Response(200, json=META)
+            if body["type"] == "allMids":
+                return httpx.Response(200, json={"SOL": "200.0"})
+            if body["type"] == "clearinghouseState":
+                return httpx.Response(200, json={"marginSummary": {"accountValue": "100", "totalMarginUsed": "10"}, "assetPositions": []})
+            if body["type"] == "openOrders":
+                return httpx.Response(200, json=[{"coin": "SOL", "oid": 1}, {"coin": "BTC", "oid": 2}])
+            return httpx.Response(200, json={})
+
+        action = body["action"]
+        if action["type"] == "order":
+            statuses = [{"resting": {"oid": 100 + i}} for i in range(len(action["orders"]))]
+            return httpx.Response(200, json={"status": "ok", "response": {"type": "order", "data": {"statuses": statuses}}})
+        if action["type"] == "batchModify":
+            statuses = [{"resting": {"oid": m["oid"] + 1}} for m in action["modifies"]]
+            return httpx.Response(200, json={"status": "ok", "response": {"type": "order", "data": {"statuses": statuses}}})
+        if action["type"] == "cancel":
+            statuses = ["success"] * len(action["cancels"])
+            return httpx.Response(200, json={"status": "ok", "response": {"type": "cancel", "data": {"statuses": statuses}}})
+        return httpx.Response(200, json={"status": "ok", "response": {"type": action["type"]}})
+
+    def count(self, path: str, kind: str = None) -> int:
+        return sum(
+            1 for p, body in self.requests
+            if p == path and (kind is None or body.get("type", body.get("action", {}).get("type")) == kind)
+        )
+
+
+@pytest.fixture
+async def fake_and_client():
+    fake = FakeExchange()
+    config = WalletConfig(private_key="0x" + "11" * 32, main_wallet_address="0xabc")
+    http = httpx.AsyncClient(base_url="https://test", transport=httpx.MockTransport(fake))
+    client = AsyncHyperliquidClient(config, mainnet=False, http_client=http)
+    await client.start()
+    yield fake, client
+    await client.close()
+
+
+class TestAsyncClient:
+    """Test the async client surface"""
+
+    @pytest.mark.asyncio
+    async def test_limit_order_is_single_signed_request(self, fake_and_client):
+        fake, client = fake_and_client
+
+        result = await client.place_limit_order("SOL", False, Decimal("199.5"), Decimal("0.5"))
+
+        assert result.success
+        assert result.order_id == "100"
+        assert fake.count("/exchange") == 1
+        assert fake.count("/info", "meta") == 1  # startup only
+        _, body = fake.requests[-1]
+        assert body["action"]["orders"][0]["a"] == 1  # SOL asset id from meta
+        assert "signature" in body
+
+    @pytest.mark.asyncio
+    async def test_order_stamps_sign_and_send_on_bound_trace(self, fake_and_client):
+        fake, client = fake_and_client
+        trace = LatencyTrace(received_ns=0, decoded_ns=0)
+        current_trace.set(trace)
+
+        await client.place_limit_order("SOL", False, Decimal("199.5"), Decimal("0.5"))
+
+        assert trace.sign_started_ns <= trace.signed_ns <= trace.responded_ns
+
+    @pytest.mark.asyncio
+    async def test_actions_released_together_get_distinct_nonces(self, fake_and_client, monkeypatch):
+        fake, client = fake_and_client
+        monkeypatch.setattr("src.exchange.hyperliquid_async.get_timestamp_ms", lambda: 1700000000000)
+
+        await asyncio.gather(
+            client.replace_order("41", OrderSpec("SOL", False, Decimal("201"), Decimal("0.5"))),
+            client.place_limit_order("SOL", True, Decimal("199"), Decimal("0.5")),
+            client.cancel_orders_bulk("SOL", ["1"]),
+        )
+
+        nonces = [body["nonce"] for path, body in fake.requests if path == "/exchange"]
+        assert len(nonces) == 3
+        assert nonces == sorted(set(nonces))
+
+    @pytest.mark.asyncio
+    async def test_open_orders_filtered_by_symbol(self, fake_and_client):
+        _, client = fake_and_client
+
+        orders = await client.get_open_orders("SOL")
+
+        assert orders == [{"coin": "SOL", "oid": 1}]
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_orders_is_one_request(self, fake_and_client):
+        fake, client = fake_and_client
+
+        assert await client.cancel_all_orders("SOL") == 1
+        assert fake.count("/exchange", "cancel") == 1
+        _, body = fake.requests[-1]
+        assert body["action"]["cancels"] == [{"a": 1, "o": 1}]
+
+    @pytest.mark.asyncio
+    async def test_replace_order_is_one_batch_modify(self, fake_and_client):
+        fake, client = fake_and_client
+
+        result = await client.replace_order("41", OrderSpec("SOL", False, Decimal("201"), Decimal("0.5")))
+
+        assert result.success
+        assert result.order_id == "42"
+        assert fake.count("/exchange") == 1
+        _, body = fake.requests[-1]
+        modify, = body["action"]["modifies"]
+        assert modify["oid"] == 41
+        assert modify["order"]["a"] == 1 and modify["order"]["p"] == "201"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_account_reads_coalesce(self, fake_and_client):
+        fake, client = fake_and_client
+
+        balance, positions, position = await asyncio.gather(
+            client.get_balance(), client.get_positions(), client.get_position("SOL")
+        )
+
+        assert fake.count("/info", "clearinghouseState") == 1
+        assert balance.available == Decimal("90")
+        assert positions == {} and position is None
+
+        # Our own action invalidates the snapshot
+        await client.cancel_orders_bulk("SOL", ["1"])
+        await client.get_balance()
+        assert fake.count("/info", "clearinghouseState") == 2
+
+    @pytest.mark.asyncio
+    async def test_read_after_own_action_does_not_join_older_fetch(self):
+        cache = AsyncSnapshotCache(ttl_seconds=5.0)
+        release = asyncio.Event()
+
+        async def slow_fetch():
+            await release.wait()
+            return "before order"
+
+        async def fresh_fetch():
+            return "after order"
+
+        early = asyncio.create_task(cache.get("openOrders", slow_fetch))
+        await asyncio.sleep(0)
+
+        cache.invalidate()  # our own order lands while the read is in flight
+        assert await asyncio.wait_for(cache.get("openOrders", fresh_fetch), timeout=1) == "after order"
+
+        release.set()
+        assert await early == "before order"
+        assert cache.fetches == 2 and cache.coalesced == 0
+        assert await cache.get("openOrders", slow_fetch) == "after order"
+
+    @pytest.mark.asyncio
+    async def test_set_leverage_uses_asset_id(self, fake_and_client):
+        fake, client = fake_and_client
+
+        assert await client.set_leverage("BTC", 100)
+        _, body = fake.requests[-1]
+        assert body["action"] == {"type": "updateLeverage", "asset": 0, "isCross": True, "leverage": 40}
+
+
+class TestRequestScheduler:
+    """Test the weight-based, priority-aware rate limiter"""
+
+    @pytest.mark.asyncio
+    async def test_cancels_and_sells_jump_the_queue(self):
+        scheduler = RequestScheduler(capacity=2, refill_per_second=50)
+        await scheduler.acquire(2, Priority.ORDER)  # Drain the bucket
+
+        granted = []
+
+        async def request(name, priority):
+            await scheduler.acquire(1, priority)
+            granted.append(name)
+
+        tasks = [
+            asyncio.create_task(request(name, priority))
+            for name, priority in (
+                ("read", Priority.READ), ("buy", Priority.ORDER),
+                ("cancel", Priority.CANCEL), ("sell", Priority.REDUCE),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth() == 4
+
+        await asyncio.gather(*tasks)
+
+        assert granted == ["cancel", "sell", "buy", "read"]
+        stats = scheduler.get_stats()
+        assert stats["queue_depth"]["read"] == 0
+        assert stats["lanes"]["read"]["queued"] == 1
+        assert stats["lanes"]["read"]["max_wait_ms"] > stats["lanes"]["cancel"]["max_wait_ms"]
+
+    def test_action_classification_and_weights(self):
+        sell = {"a": 1, "b": False, "p": "200", "s": "1", "r": False, "t": {"limit": {"tif": "Gtc"}}}
+        buy = {**sell, "b": True}
+
+        assert action_priority({"type": "cancel", "cancels": [{"a": 1, "o": 2}]}) == Priority.CANCEL
+        assert action_priority({"type": "order", "orders": [sell, sell], "grouping": "na"}) == Priority.REDUCE
+        assert action_priority({"type": "order", "orders": [buy], "grouping": "na"}) == Priority.ORDER
+        assert action_priority({"type": "order", "orders": [{**buy, "r": True}], "grouping": "na"}) == Priority.REDUCE
+        assert action_weight({"type": "order", "orders": [sell] * 80}) == 3
+        assert info_weight({"type": "allMids"}) == 2
+        assert info_weight({"type": "userFills", "user": "0x"}) == 20
+
+    @pytest.mark.asyncio
+    async def test_client_requests_go_through_scheduler(self, fake_and_client):
+        _, client = fake_and_client
+
+        await client.place_limit_order("SOL", False, Decimal("199.5"), Decimal("0.5"))
+
+        lanes = client.scheduler.get_stats()["lanes"]
+        assert lanes["reduce"]["requests"] == 1
+        assert lanes["read"]["requests"] >= 1  # meta at startup
+
+
+class TestEventLoopLagMonitor:
+    """Test the loop lag metric"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_as_lag(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.02)
+
+        time.sleep(0.1)  # Block the loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        stats = monitor.get_stats()
+        assert stats["samples"] > 0
+        assert stats["max_ms"] >= 50
@@ -0,0 +1,416 @@
+"""
+Tests for HyperliquidClient with the SDK Info/Exchange objects mocked out.
+"""
+
+import threading
+import time
+import pytest
+import requests
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.exchange.wallet_config import WalletConfig
+from src.exchange.market_metadata import MarketMetadataCache
+from src.exchange.snapshot_cache import SnapshotCache
+from src.exchange.price_provider import StreamedPriceProvider
+from src.exchange.instrument_spec import InstrumentSpec
+from src.exchange.client_order_id import ClientOrderIdGenerator, make_cloid
+from src.exchange.hyperliquid_sdk import HyperliquidClient, OrderSpec
+
+
+META = {
+    "universe": [
+        {"name": "BTC", "szDecimals": 5, "maxLeverage": 40},
+        {"name": "ETH", "szDecimals": 4, "maxLeverage": 25},
+        {"name": "SOL", "szDecimals": 2, "maxLeverage": 20},
+    ]
+}
+
+USER_STATE = {
+    "marginSummary": {"accountValue": "1000.0", "totalMarginUsed": "250.0"},
+    "assetPositions": [
+        {"position": {"coin": "SOL", "szi": "-2.5", "entryPx": "200.0", "marginUsed": "25.0"}, "unrealizedPnl": "1.5"}
+    ]
+}
+
+RESTING_RESPONSE = {
+    "status": "ok",
+    "response": {"type": "order", "data": {"statuses": [{"resting": {"oid": 77}}]}}
+}
+
+
+@pytest.fixture
+def client():
+    """Create a HyperliquidClient whose SDK objects are mocks"""
+    config = WalletConfig(private_key="0x" + "11" * 32, main_wallet_address="0xabc")
+
+    with patch("src.exchange.hyperliquid_sdk.Info") as info_cls, \
+            patch("src.exchange.hyperliquid_sdk.Exchange") as exchange_cls:
+        info = Mock()
+        info.meta.return_value = META
+        info.all_mids.return_value = {"SOL": "200.0"}
+        info.user_state.return_value = USER_STATE
+        info_cls.return_value = info
+
+        exchange = Mock()
+        exchange.order.return_value = RESTING_RESPONSE
+        exchange.bulk_orders.return_value = RESTING_RESPONSE
+        exchange_cls.return_value = exchange
+
+        client = HyperliquidClient(config, mainnet=False)
+        yield client
+        client.close()
+
+
+class TestMarketMetadataCache:
+    """Test the symbol-keyed metadata cache"""
+
+    def test_load_indexes_by_symbol(self):
+        cache = MarketMetadataCache(lambda: META)
+        cache.load()
+
+        assert cache.get("ETH")["szDecimals"] == 4
+        assert cache.get("SOL")["assetId"] == 2
+        assert cache.hits == 2
+        assert cache.misses == 0
+
+    def test_miss_reloads_once_then_raises(self):
+        fetch = Mock(return_value=META)
+        cache = MarketMetadataCache(fetch)
+        cache.load()
+
+        with pytest.raises(ValueError):
+            cache.get("DOGE")
+
+        assert cache.misses == 1
+        assert fetch.call_count == 2
+
+    def test_invalidate_symbol_forces_reload(self):
+        fetch = Mock(return_value=META)
+        cache = MarketMetadataCache(fetch)
+        cache.load()
+
+        cache.invalidate("ETH")
+        assert cache.get("ETH")["szDecimals"] == 4
+        assert cache.misses == 1
+        assert fetch.call_count == 2
+
+
+class TestClientMetadata:
+    """Test that the client serves metadata from the cache"""
+
+    def test_meta_loaded_once_at_startup(self, client):
+        assert client.info.meta.call_count == 1
+
+    def test_limit_order_costs_one_exchange_request(self, client):
+        result = client.place_limit_order("SOL", False, Decimal("199.5"), Decimal("0.5"))
+
+        assert result.success
+        assert client.exchange.bulk_orders.call_count == 1
+        # No metadata requests on the order path
+        assert client.info.meta.call_count == 1
+        assert client.market_cache.misses == 0
+
+    def test_stop_buy_uses_cache(self, client):
+        result = client.place_stop_buy("SOL", Decimal("0.5"), Decimal("201"))
+
+        assert result.success
+        assert client.info.meta.call_count == 1
+        assert client.market_cache.hits >= 1
+
+
+class TestBulkOrders:
+    """Test batched order placement"""
+
+    def test_bulk_orders_single_request_maps_statuses(self, client):
+        client.exchange.bulk_orders.return_value = {
+            "status": "ok",
+            "response": {"type": "order", "data": {"statuses": [
+                {"resting": {"oid": 1}},
+                {"error": "Order must have minimum value of $10."},
+                {"filled": {"oid": 3, "totalSz": "0.5", "avgPx": "199.0"}},
+            ]}}
+        }
+        specs = [
+            OrderSpec("SOL", False, Decimal("199"), Decimal("0.5")),
+            OrderSpec("SOL", False, Decimal("198"), Decimal("0.01")),
+            OrderSpec("SOL", True, Decimal("201"), Decimal("0.5"), trigger_price=Decimal("201")),
+        ]
+
+        results = client.place_orders_bulk(specs)
+
+        assert client.exchange.bulk_orders.call_count == 1
+        requests = client.exchange.bulk_orders.call_args[0][0]
+        assert "trigger" in requests[2]["order_type"]
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].order_id == "1"
+        assert "minimum value" in results[1].error_message
+        assert results[2].filled_size == Decimal("0.5")
+
+    def test_bulk_orders_rejected_batch_fails_every_order(self, client):
+        client.exchange.bulk_orders.return_value = {"status": "err", "response": "Rate limited"}
+
+        results = client.place_orders_bulk([
+            OrderSpec("SOL", False, Decimal("199"), Decimal("0.5")),
+            OrderSpec("SOL", False, Decimal("198"), Decimal("0.5")),
+        ])
+
+        assert len(results) == 2
+        assert not any(r.success for r in results)
+
+    def test_replace_order_is_one_modify(self, client):
+        client.exchange.bulk_modify_orders_new.return_value = {
+            "status": "ok",
+            "response": {"type": "order", "data": {"statuses": [{"resting": {"oid": 78}}]}}
+        }
+
+        result = client.replace_order("77", OrderSpec("SOL", False, Decimal("201"), Decimal("0.5")))
+
+        assert result.success
+        assert result.order_id == "78"
+        modify, = client.exchange.bulk_modify_orders_new.call_args[0][0]
+        assert modify["oid"] == 77
+        assert modify["order"]["limit_px"] == 201.0
+        assert client.exchange.bulk_orders.call_count == 0
+        assert client.exchange.cancel.call_count == 0
+
+
+class TestBulkCancel:
+    """Test batched order cancellation"""
+
+    def test_bulk_cancel_maps_statuses_per_order(self, client):
+        client.exchange.bulk_cancel.return_value = {
+            "status": "ok",
+            "response": {"type": "cancel", "data": {"statuses": [
+                "success",
+                {"error": "Order was never placed, already canceled, or filled."},
+            ]}}
+        }
+
+        results = client.cancel_orders_bulk("SOL", ["11", "12"])
+
+        assert client.exchange.bulk_cancel.call_count == 1
+        assert client.exchange.bulk_cancel.call_args[0][0] == [
+            {"coin": "SOL", "oid": 11}, {"coin": "SOL", "oid": 12}
+        ]
+        assert results == {"11": True, "12": False}
+
+    def test_cancel_all_orders_is_one_request(self, client):
+        client.info.open_orders.return_value = [
+            {"coin": "SOL", "oid": 11}, {"coin": "BTC", "oid": 12}, {"coin": "SOL", "oid": 13}
+        ]
+        client.exchange.bulk_cancel.return_value = {
+            "status": "ok",
+            "response": {"type": "cancel", "data": {"statuses": ["success", "success"]}}
+        }
+
+        assert client.cancel_all_orders("SOL") == 2
+        assert client.exchange.bulk_cancel.call_count == 1
+        assert client.exchange.cancel.call_count == 0
+
+
+class TestAccountSnapshot:
+    """Test the coalesced user_state snapshot"""
+
+    def test_account_reads_share_one_user_state(self, client):
+        balance = client.get_balance()
+        positions = client.get_positions()
+        position = client.get_position("SOL")
+
+        assert client.info.user_state.call_count == 1
+        assert balance.available == Decimal("750.0")
+        assert "SOL" in positions
+        assert not position.is_long and position.size == Decimal("2.5")
+
+    def test_own_order_invalidates_snapshot(self, client):
+        client.get_balance()
+        client.place_limit_order("SOL", False, Decimal("199.5"), Decimal("0.5"))
+        client.get_balance()
+
+        assert client.info.user_state.call_count == 2
+
+    def test_concurrent_readers_share_one_fetch(self):
+        cache = SnapshotCache(ttl_seconds=5.0)
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return {"value": 1}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("state", fetch))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"value": 1}] * 4
+        assert cache.coalesced == 3
+
+    def test_invalidation_during_fetch_is_not_cached(self):
+        cache = SnapshotCache(ttl_seconds=5.0)
+
+        def fetch():
+            cache.invalidate()  # e.g. our own order lands mid-read
+            return "stale"
+
+        assert cache.get("state", fetch) == "stale"
+        assert cache.get("state", lambda: "fresh") == "fresh"
+
+
+    def test_reader_after_invalidation_does_not_join_older_fetch(self):
+        cache = SnapshotCache(ttl_seconds=5.0)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch():
+            started.set()
+            release.wait(1)
+            return "before order"
+
+        results = []
+        early = threading.Thread(target=lambda: results.append(cache.get("state", slow_fetch)))
+        early.start()
+        started.wait(1)
+
+        cache.invalidate()  # our own order lands while the read is in flight
+        assert cache.get("state", lambda: "after order") == "after order"
+
+        release.set()
+        early.join()
+        assert results == ["before order"]
+        assert cache.fetches == 2 and cache.coalesced == 0
+        assert cache.get("state", lambda: "refetched") == "after order"
+
+class TestPriceProvider:
+    """Test sizing from the streamed price"""
+
+    def test_fresh_streamed_price_skips_rest(self, client):
+        provider = StreamedPriceProvider(max_age_seconds=5.0)
+        provider.update("SOL", Decimal("250"))
+        client.set_price_provider(provider)
+
+        size = client.calculate_position_size("SOL", Decimal("100"))
+
+        assert size == Decimal("0.4")
+        assert client.info.all_mids.call_count == 0
+        assert client.info.meta.call_count == 1
+
+    def test_stale_or_missing_price_falls_back_to_rest(self, client):
+        provider = StreamedPriceProvider(max_age_seconds=0.0)
+        provider.update("SOL", Decimal("250"))
+        client.set_price_provider(provider)
+        time.sleep(0.01)
+
+        assert client.calculate_position_size("SOL", Decimal("100")) == Decimal("0.5")
+        assert provider.stale == 1
+        assert client.info.all_mids.call_count == 1
+        assert provider.get_price("ETH") is None
+
+
+class TestInstrumentSpec:
+    """Test exchange price and size rounding rules"""
+
+    def test_price_significant_figures_and_decimals(self):
+        btc = InstrumentSpec.from_meta(0, META["universe"][0])
+        eth = InstrumentSpec.from_meta(1, META["universe"][1])
+        sol = InstrumentSpec.from_meta(2, META["universe"][2])
+
+        assert btc.round_price(Decimal("65432.17")) == Decimal("65432")
+        assert btc.round_price(Decimal("123456.7")) == Decimal("123457")  # integers always valid
+        assert eth.round_price(Decimal("2001.2345")) == Decimal("2001.2")
+        assert sol.round_price(Decimal("1.234567")) == Decimal("1.2346")
+        assert sol.round_price(Decimal("0.0123456")) == Decimal("0.0123")  # capped at 6 - szDecimals
+
+    def test_size_rounds_to_sz_decimals(self):
+        eth = InstrumentSpec.from_meta(1, META["universe"][1])
+
+        assert eth.round_size(Decimal("1.234567")) == Decimal("1.2346")
+        assert eth.round_size(0.5) == Decimal("0.5000")
+
+    def test_spec_is_immutable(self):
+        eth = InstrumentSpec.from_meta(1, META["universe"][1])
+
+        with pytest.raises(Exception):
+            eth.sz_decimals = 2
+
+    def test_stop_buy_price_is_not_rounded_with_sz_decimals(self, client):
+        client.place_stop_buy("ETH", Decimal("0.5"), Decimal("2001.2345"))
+
+        request, = client.exchange.bulk_orders.call_args[0][0]
+        assert request["limit_px"] == 2001.2
+        assert request["order_type"]["trigger"]["triggerPx"] == 2001.2
+
+
+class TestClientOrderIds:
+    """Test deterministic cloids and safe retry of timed-out placements"""
+
+    CLOID = make_cloid("SOL", -1, 0)
+
+    def test_cloids_are_deterministic_and_unique(self):
+        first = ClientOrderIdGenerator("SOL", namespace="s1")
+        again = ClientOrderIdGenerator("SOL", namespace="s1")
+        other = ClientOrderIdGenerator("SOL", namespace="s2")
+
+        cloids = [first.next(-1), first.next(-1), first.next(-2)]
+        assert cloids == [again.next(-1), again.next(-1), again.next(-2)]
+        assert len(set(cloids)) == 3
+        assert other.next(-1) != cloids[0]
+        assert cloids[0].startswith("0x") and len(cloids[0]) == 34
+
+    def test_cloid_is_sent_with_order(self, client):
+        client.place_limit_order("SOL", False, Decimal("200"), Decimal("1"), cloid=self.CLOID)
+
+        request, = client.exchange.bulk_orders.call_args[0][0]
+        assert request["cloid"].to_raw() == self.CLOID
+
+    def test_timed_out_order_that_landed_is_not_resent(self, client):
+        client.exchange.bulk_orders.side_effect = requests.exceptions.Timeout()
+        client.info.query_order_by_cloid.return_value = {
+            "status": "order",
+            "order": {"status": "open", "order": {"oid": 91, "cloid": self.CLOID}},
+        }
+
+        result = client.place_limit_order("SOL", False, Decimal("200"), Decimal("1"), cloid=self.CLOID)
+
+        assert result.success and result.order_id == "91"
+        assert client.exchange.bulk_orders.call_count == 1
+
+    def test_timed_out_order_that_never_landed_is_resent(self, client):
+        client.exchange.bulk_orders.side_effect = [requests.exceptions.Timeout(), RESTING_RESPONSE]
+        client.info.query_order_by_cloid.return_value = {"status": "unknownOid"}
+
+        result = client.place_limit_order("SOL", False, Decimal("200"), Decimal("1"), cloid=self.CLOID)
+
+        assert result.success and result.order_id == "77"
+        assert client.exchange.bulk_orders.call_count == 2
+        first, second = (call[0][0][0]["cloid"] for call in client.exchange.bulk_orders.call_args_list)
+        assert first.to_raw() == second.to_raw() == self.CLOID
+
+    def test_exhausted_retries_cancel_by_cloid(self, client):
+        client.exchange.bulk_orders.side_effect = requests.exceptions.Timeout()
+        client.info.query_order_by_cloid.return_value = {"status": "unknownOid"}
+
+        result = client.place_limit_order("SOL", False, Decimal("200"), Decimal("1"), cloid=self.CLOID)
+
+        assert not result.success
+        assert client.exchange.bulk_orders.call_count == client.order_retries + 1
+        client.exchange.bulk_cancel_by_cloid.assert_called_once()
+
+    def test_timeout_without_cloid_is_not_retried(self, client):
+        client.exchange.bulk_orders.side_effect = requests.exceptions.Timeout()
+
+        result = client.place_limit_order("SOL", False, Decimal("200"), Decimal("1"))
+
+        assert not result.success
+        assert client.exchange.bulk_orders.call_count == 1
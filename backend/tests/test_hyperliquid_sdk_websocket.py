@@ -0,0 +1,643 @@
+"""
+Tests for HyperliquidSDKWebSocketClient against a local WebSocket server.
+"""
+
+import asyncio
+import json
+import threading
+import pytest
+from decimal import Decimal
+from websockets.asyncio.server import serve
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.exchange.hyperliquid_sdk_websocket import HyperliquidSDKWebSocketClient
+from src.exchange.ws_multiplexer import WebSocketMultiplexer
+from src.exchange.tape_recorder import TapeRecorder, read_tape
+from src.monitoring.latency import current_trace
+from src.exchange.feed_bridge import ConflatingPriceSlot, LosslessQueue
+from src.exchange.fill_dedup import FillDeduplicator
+from src.exchange.market_data import PriceSource, loads, to_decimal
+
+USER = "0xAbC0000000000000000000000000000000000001"
+OTHER_USER = "0xDeF0000000000000000000000000000000000002"
+
+
+class FakeFeed:
+    """Local server that records subscriptions and pushes scripted frames once all are in"""
+
+    def __init__(self, frames, expected_subscriptions):
+        self.frames = frames
+        self.expected_subscriptions = expected_subscriptions
+        self.received = []
+
+    async def handler(self, connection):
+        await connection.send("Websocket connection established.")
+        async for message in connection:
+            self.received.append(json.loads(message))
+            if len(self.received) == self.expected_subscriptions:
+                for frame in self.frames:
+                    await connection.send(json.dumps(frame))
+                await connection.close()
+
+
+async def run_feed(feed, subscribe):
+    """Connect a client to the feed, subscribe, and listen until the server closes"""
+    async with serve(feed.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        ws = HyperliquidSDKWebSocketClient(mainnet=False, reconnect=False)
+        ws.ws_url = f"ws://127.0.0.1:{port}"
+
+        assert await ws.connect()
+        listener = asyncio.create_task(ws.listen())
+        await subscribe(ws)
+        await asyncio.wait_for(listener, timeout=5)
+
+        # Let the consumers drain what the reader handed off
+        while ws.event_queue.depth() or any(sink.slot.depth() for route in ws.routes.values() for sink in route.sinks):
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await ws.disconnect()
+    return ws
+
+
+class TestNativeTransport:
+    """Test that frames are read and dispatched on the caller's event loop"""
+
+    @pytest.mark.asyncio
+    async def test_trades_dispatch_last_price_on_loop_thread(self):
+        prices, threads = [], []
+        feed = FakeFeed([
+            {"channel": "subscriptionResponse", "data": {"method": "subscribe"}},
+            {"channel": "trades", "data": [{"coin": "ETH", "px": "2000.5"}, {"coin": "ETH", "px": "2001.5"}]},
+            {"channel": "pong"},
+            {"channel": "trades", "data": [{"coin": "BTC", "px": "65000"}]},
+        ], expected_subscriptions=1)
+
+        def on_price(price):
+            prices.append(price)
+            threads.append(threading.get_ident())
+
+        await run_feed(feed, lambda ws: ws.subscribe_to_trades("ETH", price_callback=on_price))
+
+        assert feed.received == [{"method": "subscribe", "subscription": {"type": "trades", "coin": "ETH"}}]
+        assert prices == [Decimal("2001.5")]
+        assert threads == [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test_price_callback_runs_with_batch_latency_trace(self):
+        traces = []
+        feed = FakeFeed([
+            {"channel": "trades", "data": [{"coin": "ETH", "px": "2000.5", "time": 1700000000000}]},
+        ], expected_subscriptions=1)
+
+        await run_feed(feed, lambda ws: ws.subscribe_to_trades(
+            "ETH", price_callback=lambda price: traces.append(current_trace.get())))
+
+        trace = traces[0]
+        assert 0 < trace.received_ns <= trace.decoded_ns
+        assert trace.exchange_ms == 1700000000000
+        assert current_trace.get() is None
+
+    @pytest.mark.asyncio
+    async def test_user_fills_and_order_updates_reach_callbacks(self):
+        fills, updates = [], []
+        feed = FakeFeed([
+            {"channel": "userFills", "data": {"user": USER, "isSnapshot": True, "fills": [
+                {"coin": "ETH", "px": "1990", "sz": "0.5", "side": "B", "oid": 6, "tid": 10, "time": 1000},
+                {"coin": "ETH", "px": "1980", "sz": "0.5", "side": "B", "oid": 5, "tid": 9, "time": 4102444700000},
+            ]}},
+            {"channel": "userFills", "data": {"user": USER, "fills": [
+                {"coin": "ETH", "px": "2000", "sz": "0.5", "side": "B", "oid": 7, "tid": 11, "time": 4102444800000},
+                {"coin": "ETH", "px": "1990", "sz": "0.5", "side": "B", "oid": 6, "tid": 10, "time": 1000},
+            ]}},
+            {"channel": "orderUpdates", "data": [
+                {"order": {"coin": "ETH", "side": "A", "limitPx": "2010", "sz": "0.5", "oid": 8, "origSz": "0.5"},
+                 "status": "open", "statusTimestamp": 1},
+            ]},
+        ], expected_subscriptions=3)
+
+        async def on_fill(order_id, price, size):
+            fills.append((order_id, price, size))
+
+        async def subscribe(ws):
+            await ws.subscribe_to_trades("ETH", price_callback=lambda price: None, fill_callback=on_fill)
+            await ws.subscribe_to_user_fills(USER)
+            await ws.subscribe_to_order_updates(USER, order_callback=updates.append)
+
+        ws = await run_feed(feed, subscribe)
+
+        # The first snapshot's history from before startup seeds the index and is never delivered,
+        # so repeating it later is a duplicate; the snapshot fill made since startup is delivered once
+        assert fills == [("5", Decimal("1980"), Decimal("0.5")), ("7", Decimal("2000"), Decimal("0.5"))]
+        assert ws.get_feed_stats()["fills"]["duplicates"] == 1
+        assert ws.get_feed_stats()["fills"]["seeded"] == 1
+        assert [update["order"]["oid"] for update in updates] == [8]
+
+    def test_decoded_prices_round_trip_to_exact_decimals(self):
+        trades = loads(json.dumps({"channel": "trades", "data": [{"px": "2001.37"}, {"px": "0.000123"}, {"px": "98765"}]}))
+
+        assert [to_decimal(float(trade["px"])) for trade in trades["data"]] == [
+            Decimal("2001.37"), Decimal("0.000123"), Decimal("98765")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_requires_connection(self):
+        ws = HyperliquidSDKWebSocketClient(mainnet=False)
+
+        assert not await ws.subscribe_to_trades("ETH")
+        assert ws.ws_url == "wss://api.hyperliquid-testnet.xyz/ws"
+
+
+class TestBookFeed:
+    """Test top-of-book price sources"""
+
+    BBO = {"channel": "bbo", "data": {"coin": "ETH", "time": 1, "bbo": [
+        {"px": "2000.1", "sz": "3", "n": 2}, {"px": "2000.3", "sz": "1", "n": 1},
+    ]}}
+    L2 = {"channel": "l2Book", "data": {"coin": "ETH", "time": 1, "levels": [
+        [{"px": "2000.1", "sz": "3", "n": 2}, {"px": "2000.0", "sz": "5", "n": 4}],
+        [{"px": "2000.3", "sz": "1", "n": 1}],
+    ]}}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("source, expected", [
+        (PriceSource.MID, Decimal("2000.2")),
+        (PriceSource.BID, Decimal("2000.1")),
+        (PriceSource.ASK, Decimal("2000.3")),
+    ])
+    async def test_bbo_source_selects_side(self, source, expected):
+        prices = []
+        feed = FakeFeed([self.BBO], expected_subscriptions=1)
+
+        await run_feed(feed, lambda ws: ws.subscribe_to_book("ETH", source=source, price_callback=prices.append))
+
+        assert feed.received[0]["subscription"] == {"type": "bbo", "coin": "ETH"}
+        assert prices == [expected]
+
+    @pytest.mark.asyncio
+    async def test_l2_book_uses_best_levels(self):
+        prices = []
+        feed = FakeFeed([self.L2], expected_subscriptions=1)
+
+        await run_feed(feed, lambda ws: ws.subscribe_to_book(
+            "ETH", source=PriceSource.BID, price_callback=prices.append, channel="l2Book"))
+
+        assert prices == [Decimal("2000.1")]
+
+    @pytest.mark.asyncio
+    async def test_fill_only_trades_subscription_sends_nothing(self):
+        feed = FakeFeed([self.BBO], expected_subscriptions=1)
+
+        async def subscribe(ws):
+            await ws.subscribe_to_trades("ETH", fill_callback=lambda *args: None)
+            await ws.subscribe_to_book("ETH", price_callback=lambda price: None)
+
+        ws = await run_feed(feed, subscribe)
+
+        assert [message["subscription"]["type"] for message in feed.received] == ["bbo"]
+        assert "ETH" in ws.fill_callbacks
+
+
+class TestFeedBridge:
+    """Test conflation of prices and lossless hand-off of user events"""
+
+    @pytest.mark.asyncio
+    async def test_busy_consumer_gets_newest_price_with_high_and_low(self):
+        slot = ConflatingPriceSlot()
+        for price in ("100", "103", "98", "101"):
+            slot.put(Decimal(price))
+
+        batch = await slot.get()
+
+        assert (batch.last, batch.high, batch.low, batch.ticks) == (Decimal("101"), Decimal("103"), Decimal("98"), 4)
+        assert slot.depth() == 0
+        assert slot.get_stats()["conflation_ratio"] == 4.0
+        assert slot.get_stats()["dropped"] == 3
+
+    @pytest.mark.asyncio
+    async def test_path_keeps_ordered_bucket_extremes(self):
+        slot = ConflatingPriceSlot(bucket=lambda price: int(price))
+        for price in ("100.5", "101.2", "102.3", "101.7", "100.4", "100.6", "102.1"):
+            slot.put(Decimal(price))
+
+        batch = await slot.get()
+
+        # Monotonic runs collapse to their furthest point, reversals are kept
+        assert batch.path == [Decimal("100.5"), Decimal("102.3"), Decimal("100.6"), Decimal("102.1")]
+        assert batch.path[-1] == batch.last
+
+    @pytest.mark.asyncio
+    async def test_path_callback_receives_path(self):
+        paths = []
+        feed = FakeFeed([
+            {"channel": "trades", "data": [{"coin": "ETH", "px": px} for px in ("2000.5", "2003.5", "2000.2")]},
+        ], expected_subscriptions=1)
+
+        await run_feed(feed, lambda ws: ws.subscribe_to_trades(
+            "ETH", path_callback=paths.append, price_bucket=lambda price: int(price)))
+
+        assert paths == [[Decimal("2000.5"), Decimal("2003.5"), Decimal("2000.2")]]
+
+    @pytest.mark.asyncio
+    async def test_consumer_waits_for_next_price(self):
+        slot = ConflatingPriceSlot()
+        waiter = asyncio.create_task(slot.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        slot.put(Decimal("100"))
+        batch = await asyncio.wait_for(waiter, timeout=1)
+
+        assert batch.last == Decimal("100") and batch.ticks == 1
+
+    @pytest.mark.asyncio
+    async def test_lossless_queue_applies_backpressure_instead_of_dropping(self):
+        queue = LosslessQueue(maxsize=2)
+        await queue.put(1)
+        await queue.put(2)
+
+        blocked = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        assert await queue.get() == 1
+        await asyncio.wait_for(blocked, timeout=1)
+        assert [await queue.get(), await queue.get()] == [2, 3]
+        assert queue.get_stats()["full_waits"] == 1
+        assert queue.get_stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_burst_of_trade_messages_is_conflated(self):
+        prices = []
+        frames = [{"channel": "trades", "data": [{"coin": "ETH", "px": str(2000 + i)}]} for i in range(50)]
+        feed = FakeFeed(frames, expected_subscriptions=1)
+
+        ws = await run_feed(feed, lambda ws: ws.subscribe_to_trades("ETH", price_callback=prices.append))
+
+        stats = ws.get_feed_stats()["prices"]["trades:ETH"][0]
+        assert prices[-1] == Decimal("2049")
+        assert stats["ticks_in"] == 50
+        assert stats["batches_out"] == len(prices)
+
+
+class TestTapeRecorder:
+    """Test recording and replaying raw frames"""
+
+    @pytest.mark.asyncio
+    async def test_frames_round_trip_in_order_with_receive_times(self, tmp_path):
+        recorder = TapeRecorder(tmp_path)
+        recorder.start()
+        frames = [json.dumps({"channel": "trades", "data": [{"px": str(2000 + i)}]}) for i in range(3)]
+        for frame in frames:
+            recorder.record(frame)
+        recorder.record(b'{"channel":"pong"}')
+        await recorder.stop()
+
+        tape = list(read_tape(tmp_path))
+
+        assert [frame for _, frame in tape] == frames + ['{"channel":"pong"}']
+        times = [received_ns for received_ns, _ in tape]
+        assert times == sorted(times)
+        assert recorder.get_stats()["written"] == 4
+
+    @pytest.mark.asyncio
+    async def test_rotates_files_and_reads_them_back_in_order(self, tmp_path):
+        recorder = TapeRecorder(tmp_path, prefix="ETH", max_file_bytes=1)
+        for i in range(3):
+            recorder.record(f"frame {i}")
+            await recorder.flush()
+
+        assert len(list(tmp_path.glob("ETH-*.tape.gz"))) == 3
+        assert [frame for _, frame in read_tape(tmp_path, prefix="ETH")] == ["frame 0", "frame 1", "frame 2"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_batch_keeps_earlier_frames(self, tmp_path):
+        recorder = TapeRecorder(tmp_path)
+        recorder.record("kept")
+        await recorder.flush()
+        recorder.record("lost in a crash")
+        await recorder.flush()
+
+        path = next(tmp_path.glob("*.tape.gz"))
+        path.write_bytes(path.read_bytes()[:-10])
+
+        assert [frame for _, frame in read_tape(path)] == ["kept"]
+
+    def test_full_buffer_drops_oldest(self, tmp_path):
+        recorder = TapeRecorder(tmp_path, max_pending=2)
+        for frame in ("a", "b", "c"):
+            recorder.record(frame)
+
+        assert recorder.get_stats()["pending"] == 2
+        assert recorder.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_client_records_every_frame(self, tmp_path):
+        frames = [
+            {"channel": "subscriptionResponse", "data": {"method": "subscribe"}},
+            {"channel": "trades", "data": [{"coin": "ETH", "px": "2000.5"}]},
+        ]
+        feed = FakeFeed(frames, expected_subscriptions=1)
+
+        async with serve(feed.handler, "127.0.0.1", 0) as server:
+            recorder = TapeRecorder(tmp_path)
+            ws = HyperliquidSDKWebSocketClient(
+                mainnet=False, reconnect=False, recorder=recorder,
+                ws_url=f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            )
+            assert await ws.connect()
+            listener = asyncio.create_task(ws.listen())
+            await ws.subscribe_to_trades("ETH", price_callback=lambda price: None)
+            await asyncio.wait_for(listener, timeout=5)
+            await ws.disconnect()
+
+        recorded = [json.loads(frame) for _, frame in read_tape(tmp_path) if frame.startswith("{")]
+        assert recorded == frames
+        assert ws.get_feed_stats()["tape"]["written"] == 3  # plus the greeting
+
+
+class TestFillDeduplicator:
+    """Test exactly-once fill delivery"""
+
+    def test_repeated_fill_is_rejected(self):
+        index = FillDeduplicator()
+        fill = {"coin": "ETH", "px": "2000", "sz": "0.5", "oid": 7, "tid": 11, "time": 1}
+
+        assert index.add(fill)
+        assert not index.add(dict(fill))
+        assert index.add({**fill, "tid": 12})  # another trade against the same order
+        assert index.get_stats() == {"size": 2, "accepted": 2, "duplicates": 1}
+
+    def test_fill_without_trade_id_falls_back_to_content(self):
+        index = FillDeduplicator()
+        fill = {"hash": "0xab", "oid": 7, "px": "2000", "sz": "0.5", "time": 1}
+
+        assert index.add(fill)
+        assert not index.add(dict(fill))
+        assert index.add({**fill, "sz": "0.25"})
+
+    def test_oldest_keys_are_evicted_at_capacity(self):
+        index = FillDeduplicator(capacity=2)
+        for tid in (1, 2, 3):
+            index.add({"oid": 7, "tid": tid})
+
+        assert len(index) == 2
+        assert not index.add({"oid": 7, "tid": 3})
+        assert index.add({"oid": 7, "tid": 1})
+
+
+class RecordingFeed:
+    """Local server that records every message and pushes frames on demand"""
+
+    def __init__(self):
+        self.received = []
+        self.connections = []
+
+    async def handler(self, connection):
+        self.connections.append(connection)
+        async for message in connection:
+            self.received.append(json.loads(message))
+
+    async def push(self, frame):
+        await self.connections[-1].send(json.dumps(frame))
+
+
+async def wait_until(condition, timeout=2.0):
+    """Poll until condition() holds"""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+class TestMultiplexing:
+    """Test many subscribers sharing one connection"""
+
+    @pytest.mark.asyncio
+    async def test_shared_route_subscribes_once_and_fans_out(self):
+        feed = RecordingFeed()
+        first, second, btc = [], [], []
+
+        async with serve(feed.handler, "127.0.0.1", 0) as server:
+            ws = HyperliquidSDKWebSocketClient(mainnet=False, reconnect=False)
+            ws.ws_url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            assert await ws.connect()
+            listener = asyncio.create_task(ws.listen())
+
+            sub_first = await ws.subscribe_to_trades("ETH", price_callback=first.append)
+            sub_second = await ws.subscribe_to_trades("ETH", price_callback=second.append)
+            await ws.subscribe_to_trades("BTC", price_callback=btc.append)
+            await wait_until(lambda: len(feed.received) == 2)
+
+            await feed.push({"channel": "trades", "data": [{"coin": "ETH", "px": "2000.5"}]})
+            await feed.push({"channel": "trades", "data": [{"coin": "BTC", "px": "65000"}]})
+            await wait_until(lambda: first and second and btc)
+
+            assert [m["subscription"]["coin"] for m in feed.received] == ["ETH", "BTC"]
+            assert first == second == [Decimal("2000.5")]
+            assert btc == [Decimal("65000")]
+            assert ws.get_feed_stats()["routes"] == {"trades:ETH": 2, "trades:BTC": 1}
+
+            # The exchange subscription outlives the first subscriber, not the last
+            await ws.unsubscribe(sub_first)
+            await feed.push({"channel": "trades", "data": [{"coin": "ETH", "px": "2001"}]})
+            await wait_until(lambda: len(second) == 2)
+            assert first == [Decimal("2000.5")]
+            assert len(feed.received) == 2
+
+            await ws.unsubscribe(sub_second)
+            await wait_until(lambda: len(feed.received) == 3)
+            assert feed.received[-1] == {"method": "unsubscribe", "subscription": {"type": "trades", "coin": "ETH"}}
+            assert ("trades", "ETH") not in ws.routes
+
+            await ws.disconnect()
+            await asyncio.wait_for(listener, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_fill_reaches_every_subscriber_of_the_symbol(self):
+        fills = {"a": [], "b": []}
+        feed = FakeFeed([
+            {"channel": "userFills", "data": {"user": USER.lower(), "fills": [
+                {"coin": "ETH", "px": "2000", "sz": "0.5", "side": "B", "oid": 7, "tid": 1, "time": 1},
+            ]}},
+        ], expected_subscriptions=1)
+
+        async def subscribe(ws):
+            await ws.subscribe_to_trades("ETH", fill_callback=lambda oid, px, sz: fills["a"].append(oid))
+            await ws.subscribe_to_trades("ETH", fill_callback=lambda oid, px, sz: fills["b"].append(oid))
+            await ws.subscribe_to_user_fills(USER)
+            await ws.subscribe_to_user_fills(USER)
+
+        await run_feed(feed, subscribe)
+
+        assert len(feed.received) == 1
+        assert fills == {"a": ["7"], "b": ["7"]}
+
+    @pytest.mark.asyncio
+    async def test_order_updates_route_per_user(self):
+        feed = RecordingFeed()
+        mine, also_mine, other = [], [], []
+        update = {"order": {"coin": "ETH", "side": "B", "limitPx": "1990", "sz": "0.5", "oid": 9, "origSz": "0.5"},
+                  "status": "open", "statusTimestamp": 1}
+
+        async with serve(feed.handler, "127.0.0.1", 0) as server:
+            ws = HyperliquidSDKWebSocketClient(mainnet=False, reconnect=False)
+            ws.ws_url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            assert await ws.connect()
+            listener = asyncio.create_task(ws.listen())
+
+            first = await ws.subscribe_to_order_updates(USER, order_callback=mine.append)
+            second = await ws.subscribe_to_order_updates(USER.lower(), order_callback=also_mine.append)
+            # Messages do not name the user, so a second wallet cannot share the connection
+            assert await ws.subscribe_to_order_updates(OTHER_USER, order_callback=other.append) is None
+            await wait_until(lambda: len(feed.received) == 1)
+
+            await feed.push({"channel": "orderUpdates", "data": [update]})
+            await wait_until(lambda: mine and also_mine)
+
+            assert feed.received == [{"method": "subscribe", "subscription": {"type": "orderUpdates", "user": USER}}]
+            assert ws.get_feed_stats()["routes"] == {f"orderUpdates:{USER.lower()}": 2}
+            assert mine == also_mine == [update]
+            assert other == []
+
+            # Once the last subscriber of the first wallet leaves, another wallet can subscribe
+            await ws.unsubscribe(first)
+            await ws.unsubscribe(second)
+            assert await ws.subscribe_to_order_updates(OTHER_USER, order_callback=other.append) is not None
+            await feed.push({"channel": "orderUpdates", "data": [update]})
+            await wait_until(lambda: other)
+            assert len(mine) == 1
+
+            await ws.disconnect()
+            await asyncio.wait_for(listener, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_multiplexer_shares_one_client_per_network(self):
+        feed = RecordingFeed()
+        async with serve(feed.handler, "127.0.0.1", 0) as server:
+            url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            feeds = WebSocketMultiplexer(reconnect=False, ws_url=url)
+
+            first = await feeds.acquire(mainnet=False)
+            second = await feeds.acquire(mainnet=False)
+
+            assert first is second
+            assert len(feed.connections) == 1
+            assert feeds.get_stats()["testnet"]["users"] == 2
+
+            await feeds.release(mainnet=False)
+            assert first.is_connected
+            await feeds.release(mainnet=False)
+            assert not first.is_connected
+            assert feeds.get_stats() == {}
+
+
+class TestReconnect:
+    """Test recovery after the connection drops"""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_resubscribes_and_backfills_fills(self):
+        fills, connections, reconnected = [], [], []
+
+        async def handler(connection):
+            connections.append(connection)
+            subscriptions = [json.loads(await connection.recv()) for _ in range(2)]
+            if len(connections) == 1:
+                await connection.send(json.dumps({"channel": "userFills", "data": {"user": USER, "fills": [
+                    {"coin": "ETH", "px": "2000", "sz": "0.5", "side": "B", "oid": 1, "tid": 1, "time": 4102444800000},
+                ]}}))
+                await connection.close()  # drop the connection
+            else:
+                connection.subscriptions = subscriptions
+                # Snapshot after resubscribe: repeats a fill that was already delivered
+                await connection.send(json.dumps({"channel": "userFills", "data": {"user": USER, "isSnapshot": True, "fills": [
+                    {"coin": "ETH", "px": "2000", "sz": "0.5", "side": "B", "oid": 1, "tid": 1, "time": 4102444800000},
+                ]}}))
+                await connection.wait_closed()
+
+        async def on_fill(order_id, price, size):
+            fills.append(order_id)
+
+        async with serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            ws = HyperliquidSDKWebSocketClient(mainnet=False, user_address=USER, reconnect_initial_delay=0.01)
+            ws.ws_url = f"ws://127.0.0.1:{port}"
+            ws.add_reconnect_callback(lambda: reconnected.append(True))
+
+            requested = []
+
+            async def fetch_fills_since(user, start_ms):
+                requested.append((user, start_ms))
+                # Inclusive window: the last fill seen comes back along with the one that was missed
+                return [
+                    {"coin": "ETH", "px": "2000", "sz": "0.5", "side": "B", "oid": 1, "tid": 1, "time": 4102444800000},
+                    {"coin": "ETH", "px": "1990", "sz": "0.5", "side": "B", "oid": 2, "tid": 2, "time": 4102444805000},
+                ]
+
+            ws._fetch_fills_since = fetch_fills_since
+
+            assert await ws.connect()
+            listener = asyncio.create_task(ws.listen())
+            await ws.subscribe_to_trades("ETH", price_callback=lambda price: None, fill_callback=on_fill)
+            await ws.subscribe_to_user_fills(USER)
+
+            for _ in range(500):
+                if ws.reconnects and len(fills) == 2 and ws.event_queue.depth() == 0:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+
+            assert len(connections) == 2
+            assert [s["subscription"]["type"] for s in connections[1].subscriptions] == ["trades", "userFills"]
+            assert requested == [(USER, 4102444800000)]
+            assert fills == ["1", "2"]
+            assert reconnected == [True]
+            assert ws.get_feed_stats()["fills"]["duplicates"] == 2
+            assert ws.last_recovery_seconds is not None
+
+            await ws.disconnect()
+            await asyncio.wait_for(listener, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_failed_resubscribe_is_retried(self):
+        connections = []
+
+        async def handler(connection):
+            connections.append([])
+            async for message in connection:
+                connections[-1].append(json.loads(message))
+                if len(connections) == 1:
+                    await connection.close()  # drop the first connection after its subscription
+
+        async with serve(handler, "127.0.0.1", 0) as server:
+            ws = HyperliquidSDKWebSocketClient(mainnet=False, reconnect_initial_delay=0.01)
+            ws.ws_url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            backfills = []
+
+            async def backfill_fills():
+                backfills.append(True)
+                if len(backfills) == 1:
+                    raise ConnectionError("connection lost while resubscribing")
+
+            ws._backfill_fills = backfill_fills
+
+            assert await ws.connect()
+            listener = asyncio.create_task(ws.listen())
+            await ws.subscribe_to_trades("ETH", price_callback=lambda price: None)
+
+            await wait_until(lambda: ws.reconnects == 1 and len(connections) == 3 and connections[2])
+
+            # The listener survives the failed attempt and the next one resubscribes and backfills again
+            assert not listener.done()
+            assert len(backfills) == 2
+            assert [[m["subscription"]["coin"] for m in received] for received in connections[1:]] == [["ETH"], ["ETH"]]
+            assert ws.is_connected
+
+            await ws.disconnect()
+            await asyncio.wait_for(listener, timeout=1)
@@ -0,0 +1,84 @@
+"""
+Tests for the tick-to-trade latency histograms and traces.
+"""
+
+import random
+import pytest
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.monitoring.latency import LatencyHistogram, LatencyTrace, LatencyTracer
+
+
+class TestLatencyHistogram:
+    """Test the log-linear histogram"""
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        assert histogram.percentile(50) == 50
+        assert histogram.percentile(99) == 99
+        assert (histogram.min, histogram.max, histogram.count) == (1, 100, 100)
+
+    def test_percentiles_stay_within_relative_error(self):
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(14, 1.5)) for _ in range(20_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for pct in (50, 90, 99, 99.9):
+            exact = values[max(1, round(pct / 100 * len(values))) - 1]
+            assert abs(histogram.percentile(pct) - exact) <= exact / 64 + 1
+        assert histogram.percentile(100) == values[-1]
+        assert len(histogram.counts) < 1000
+
+    def test_negative_durations_count_as_zero(self):
+        histogram = LatencyHistogram()
+        histogram.record(-5)
+
+        assert histogram.get_stats()["max_ms"] == 0.0
+        assert histogram.count == 1
+
+
+class TestLatencyTracer:
+    """Test stage durations derived from trace marks"""
+
+    def test_completed_trace_records_every_stage(self):
+        tracer = LatencyTracer()
+        trace = LatencyTrace(
+            received_ns=1_000, decoded_ns=1_100, exchange_ms=5, received_wall_ns=7_000_000,
+            detected_ns=1_300, scheduled_ns=1_600, sign_started_ns=2_000, signed_ns=2_500,
+            responded_ns=9_500, acked_ns=9_600,
+        )
+
+        tracer.record_trace(trace)
+        stats = tracer.histograms
+
+        assert {stage: histogram.max for stage, histogram in stats.items()} == {
+            "receive": 2_000_000, "decode": 100, "detect": 200, "schedule": 300,
+            "sign": 500, "send": 7_000, "ack": 100, "tick_to_trade": 8_600,
+        }
+
+    def test_missing_marks_skip_their_stages(self):
+        tracer = LatencyTracer()
+        tracer.record_trace(LatencyTrace(received_ns=0, decoded_ns=10, acked_ns=50))
+
+        counts = {stage: histogram.count for stage, histogram in tracer.histograms.items()}
+        assert counts["decode"] == counts["tick_to_trade"] == 1
+        assert counts["sign"] == counts["receive"] == counts["schedule"] == 0
+
+    def test_dump_writes_json(self, tmp_path):
+        tracer = LatencyTracer()
+        tracer.record("send", 2_000_000)
+
+        stats = tracer.dump(tmp_path / "latency.json")
+
+        assert stats["send"]["samples"] == 1
+        assert '"send"' in (tmp_path / "latency.json").read_text()
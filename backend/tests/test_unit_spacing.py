@@ -0,0 +1,123 @@
+"""
+Test suite for linear and geometric unit spacing.
+"""
+
+import random
+import numpy as np
+import pytest
+from decimal import Decimal
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.strategy.unit_spacing import GeometricSpacing, LinearSpacing, make_spacing
+from src.strategy.unit_tracker import UnitTracker
+from src.strategy.position_map import PositionMap
+
+
+def random_walk(start, steps, seed, max_move=0.004):
+    """Prices (two decimals) wandering by up to max_move per step"""
+    rng = random.Random(seed)
+    prices, price = [], start
+    for _ in range(steps):
+        price = max(0.01, round(price * (1 + rng.uniform(-max_move, max_move * 1.2)), 2))
+        prices.append(price)
+    return prices
+
+
+class TestGeometricSpacing:
+    """Test suite for percentage units."""
+
+    def test_units_are_a_fixed_percentage_apart(self):
+        """Unit n starts at anchor * (1 + spacing)^n, in both directions."""
+        spacing = GeometricSpacing(Decimal("100"), Decimal("0.01"))
+
+        assert spacing.unit_price(0) == Decimal("100")
+        assert spacing.unit_price(2) == Decimal("102.01")
+        assert abs(spacing.unit_price(-1) - Decimal("99.0099")) < Decimal("0.0001")
+        assert str(spacing) == "1%"
+
+    def test_closed_form_unit_matches_boundaries(self):
+        """The log-based unit agrees with the exact boundaries, on and next to them, over a 10x range."""
+        spacing = GeometricSpacing(Decimal("150"), Decimal("0.0037"))
+
+        rng = random.Random(3)
+        prices = [Decimal(f"{rng.uniform(40, 1500):.2f}") for _ in range(3000)]
+        for unit in range(-300, 600, 7):
+            boundary = spacing.unit_price(unit)
+            prices += [boundary, boundary - Decimal("1e-20"), boundary + Decimal("1e-20")]
+
+        for price in prices:
+            unit = spacing.unit_of(price)
+            assert spacing.unit_price(unit) <= price < spacing.unit_price(unit + 1), price
+
+            ticks = int(price.scaleb(7)) if price == price.quantize(Decimal("1e-7")) else None
+            if ticks is not None:
+                assert spacing.unit_of_ticks(ticks, 7) == unit, price
+
+    def test_position_round_trips(self):
+        """price_to_unit and unit_to_price are inverses, including between boundaries."""
+        tracker = UnitTracker(grid_spacing=Decimal("0.01"), anchor_price=Decimal("150"))
+
+        assert abs(tracker.unit_to_price(5) - Decimal("157.6515")) < Decimal("0.0001")
+        for price in (Decimal("150"), Decimal("151.2345"), Decimal("1500"), Decimal("15.5")):
+            assert abs(tracker.unit_to_price(tracker.price_to_unit(price)) - price) < Decimal("1e-20")
+        assert tracker.price_to_unit(Decimal("150") * Decimal("1.01") ** 3) == 3
+
+    def test_make_spacing_needs_exactly_one_unit_size(self):
+        """Linear or geometric, never both or neither."""
+        assert isinstance(make_spacing(Decimal("100"), unit_size_usd=Decimal("1")), LinearSpacing)
+        assert isinstance(make_spacing(Decimal("100"), grid_spacing=Decimal("0.01")), GeometricSpacing)
+        with pytest.raises(ValueError):
+            make_spacing(Decimal("100"))
+        with pytest.raises(ValueError):
+            make_spacing(Decimal("100"), unit_size_usd=Decimal("1"), grid_spacing=Decimal("0.01"))
+
+
+class TestGeometricTracking:
+    """UnitTracker and PositionMap on a geometric ladder."""
+
+    def test_scalar_tick_and_bulk_paths_agree_over_a_10x_move(self):
+        """update_price, update_ticks and process_array see the same crossings as the price rallies 10x."""
+        prices = random_walk(150.0, 20000, seed=5)
+        assert max(prices) > 1500
+
+        decimal_tracker = UnitTracker(grid_spacing=Decimal("0.005"), anchor_price=Decimal("150"))
+        tick_tracker = UnitTracker(grid_spacing=Decimal("0.005"), anchor_price=Decimal("150"))
+        bulk_tracker = UnitTracker(grid_spacing=Decimal("0.005"), anchor_price=Decimal("150"))
+
+        expected = [
+            (i, event.previous_unit, event.current_unit)
+            for i, event in enumerate(decimal_tracker.update_price(Decimal(repr(px))) for px in prices)
+            if event
+        ]
+        tick_events = [tick_tracker.update_ticks(tick_tracker.to_ticks(px)) for px in prices]
+        bulk_events = bulk_tracker.process_array(np.array(prices))
+
+        assert [(i, e.previous_unit, e.current_unit) for i, e in enumerate(tick_events) if e] == expected
+        assert [tuple(int(v) for v in row) for row in bulk_events[["index", "previous_unit", "current_unit"]]] == expected
+        assert decimal_tracker.current_unit > 400  # ~log(10) / log(1.005)
+        assert bulk_tracker.get_state() == decimal_tracker.get_state()
+
+    def test_tracker_and_map_share_one_ladder(self):
+        """Orders are priced on the same boundaries the tracker measures crossings against."""
+        spacing = make_spacing(Decimal("2000"), grid_spacing=Decimal("0.01"))
+        tracker = UnitTracker(spacing=spacing)
+        position_map = PositionMap(spacing=spacing)
+
+        for unit in (-20, -1, 0, 1, 20):
+            assert position_map.map[unit].price == tracker.get_unit_price(unit)
+
+        position_map.add_order(unit=35, order_id="far", order_type="sell", size=Decimal("0.1"))
+        assert position_map.map[35].price == Decimal("2000") * Decimal("1.01") ** 35
+
+        event = tracker.update_price(tracker.get_unit_price(1))
+        assert (event.previous_unit, event.current_unit) == (0, 1)
+        assert tracker.update_price(tracker.get_unit_price(2) - Decimal("0.0001")) is None
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])
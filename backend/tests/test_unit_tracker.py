@@ -2,6 +2,8 @@
 Test suite for UnitTracker to verify proper unit boundary detection.
 """
 
+import random
+import numpy as np
 import pytest
 from decimal import Decimal
 import sys
@@ -10,7 +12,8 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.strategy.unit_tracker import UnitTracker, Direction, UnitChangeEvent
+from src.strategy.unit_tracker import UnitTracker, UnitTrackerGroup, Direction, UnitChangeEvent
+from src.exchange.feed_bridge import ConflatingPriceSlot
 
 
 class TestUnitTracker:
@@ -160,7 +163,289 @@ class TestUnitTracker:
         tracker.update_price(Decimal("49899"))  # Unit -2
         assert tracker.current_unit == -2
 
+    def test_update_path_reports_intra_batch_reversals(self):
+        """A batch that swings up two units and back emits every crossing, not just the last."""
+        tracker = UnitTracker(
+            unit_size_usd=Decimal("1"),
+            anchor_price=Decimal("100")
+        )
+
+        events = tracker.update_path([Decimal("100.5"), Decimal("102.3"), Decimal("100.6"), Decimal("102.1")])
+
+        assert [(e.previous_unit, e.current_unit) for e in events] == [(0, 2), (2, 0), (0, 2)]
+        assert tracker.current_unit == 2
+        assert tracker.current_price == Decimal("102.1")
+        assert tracker.unit_of(Decimal("99.99")) == -1
+
+
+    def test_tick_unit_of_matches_decimal_units(self):
+        """The float/integer-tick fast path agrees with Decimal, including exactly on boundaries."""
+        tracker = UnitTracker(
+            unit_size_usd=Decimal("0.37"),
+            anchor_price=Decimal("2001.23")
+        )
+
+        rng = random.Random(7)
+        prices = [f"{rng.uniform(1990, 2010):.2f}" for _ in range(2000)]
+        prices += [str(tracker.get_unit_price(unit)) for unit in range(-20, 20)]
+        prices += [f"{tracker.get_unit_price(3) - Decimal('0.000001')}"]
+
+        for px in prices:
+            assert tracker.tick_unit_of(float(px)) == tracker.unit_of(Decimal(px)), px
+
+    def test_cached_thresholds_match_full_recomputation(self):
+        """update_price and update_ticks emit exactly the events a unit_of() on every tick would."""
+        rng = random.Random(11)
+        prices, price = [], 2000.0
+        for _ in range(5000):
+            price = round(price + rng.choice((-0.05, 0.05)) * rng.randint(1, 6), 2)
+            prices.append(price)
+        prices += [float(Decimal("2000") + unit * Decimal("0.25")) for unit in (3, 2, 2, -7)]
+
+        scalar = UnitTracker(unit_size_usd=Decimal("0.25"), anchor_price=Decimal("2000"))
+        ticks = UnitTracker(unit_size_usd=Decimal("0.25"), anchor_price=Decimal("2000"))
+        expected, unit = [], 0
+        for px in prices:
+            new_unit = scalar.unit_of(Decimal(repr(px)))
+            if new_unit != unit:
+                expected.append((unit, new_unit))
+                unit = new_unit
+
+        decimal_events = [scalar.update_price(Decimal(repr(px))) for px in prices]
+        tick_events = [ticks.update_ticks(ticks.to_ticks(px)) for px in prices]
+
+        assert [(e.previous_unit, e.current_unit) for e in decimal_events if e] == expected
+        assert [(e.previous_unit, e.current_unit) for e in tick_events if e] == expected
+        assert [e.price for e in tick_events if e] == [e.price for e in decimal_events if e]
+        assert ticks.current_price == scalar.current_price
+
+    def test_setting_current_unit_moves_thresholds(self):
+        """A unit set from outside (e.g. on restore) is where the next crossing is measured from."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"))
+        tracker.current_unit = -2
+
+        event = tracker.update_price(Decimal("100.5"))
+
+        assert (event.previous_unit, event.current_unit) == (-2, 0)
+        assert tracker.update_price(Decimal("100.9")) is None
+
+    def test_process_array_matches_scalar_path(self):
+        """Bulk processing finds the scalar crossings and leaves the tracker in the same state."""
+        rng = random.Random(23)
+        prices, price = [], 2000.0
+        for _ in range(20000):
+            price = round(price + rng.choice((-0.01, 0.0, 0.01)) * rng.randint(1, 40), 2)
+            prices.append(price)
+        prices += [float(Decimal("2000") + unit * Decimal("0.25")) for unit in (-4, -5, -5, 2)]
+        timestamps = np.arange(len(prices), dtype=np.int64) * 100 + 1_700_000_000_000
+
+        scalar = UnitTracker(unit_size_usd=Decimal("0.25"), anchor_price=Decimal("2000"))
+        bulk = UnitTracker(unit_size_usd=Decimal("0.25"), anchor_price=Decimal("2000"))
+        expected = [
+            (i, event.previous_unit, event.current_unit, 1 if event.current_direction == Direction.UP else -1)
+            for i, event in enumerate(scalar.update_price(Decimal(repr(px))) for px in prices)
+            if event
+        ]
+
+        events = bulk.process_array(np.array(prices), timestamps)
+
+        assert len(events) > 100
+        assert [tuple(int(v) for v in row) for row in events[["index", "previous_unit", "current_unit", "direction"]]] == expected
+        assert (events["timestamp"] == timestamps[events["index"]]).all()
+        assert bulk.get_state() == scalar.get_state()
+
+        # Continuing on either path gives the same next event
+        assert bulk.update_price(Decimal("2010")).previous_unit == scalar.update_price(Decimal("2010")).previous_unit
+
+    def test_process_array_decimal_input_and_edge_cases(self):
+        """Decimal arrays use the Decimal unit math; empty input changes nothing; lengths must agree."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"))
+        prices = np.array([Decimal("100.5"), Decimal("101"), Decimal("99.99"), Decimal("99.5")], dtype=object)
+
+        events = tracker.process_array(prices)
+
+        assert events["index"].tolist() == [1, 2]
+        assert events["direction"].tolist() == [1, -1]
+        assert events["timestamp"].tolist() == [0, 0]
+        assert (tracker.current_unit, tracker.previous_unit) == (-1, 1)
+        assert (tracker.current_direction, tracker.previous_direction) == (Direction.DOWN, Direction.UP)
+        assert tracker.current_price == Decimal("99.5")
+
+        assert len(tracker.process_array(np.array([]))) == 0
+        assert tracker.current_unit == -1
+
+        with pytest.raises(ValueError):
+            tracker.process_array(np.array([100.0, 101.0]), np.array([1]))
+
+
+class TestHysteresis:
+    """Crossing confirmation by hysteresis band and dwell time."""
+
+    def test_flapping_around_a_boundary_is_suppressed(self):
+        """Flips a few ticks either side of a boundary emit nothing and are counted."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"), hysteresis=Decimal("0.2"))
+
+        events = [tracker.update_price(Decimal(px)) for px in ["101.01", "100.99"] * 100]
+
+        assert not any(events)
+        assert tracker.current_unit == 0
+        assert tracker.suppressed_flips == 100
+
+        event = tracker.update_price(Decimal("101.20"))
+        assert (event.previous_unit, event.current_unit) == (0, 1)
+        assert tracker.hysteresis_confirmations == 1
+
+        # Back down: 20% into unit 0 is needed again
+        assert tracker.update_price(Decimal("100.81")) is None
+        event = tracker.update_price(Decimal("100.80"))
+        assert (event.previous_unit, event.current_unit) == (1, 0)
+
+    def test_jump_confirms_the_units_fully_cleared(self):
+        """A gap over several units confirms every unit the price is past the band of."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"), hysteresis=Decimal("0.2"))
+
+        assert tracker.update_price(Decimal("103.1")).current_unit == 2
+        assert tracker.update_price(Decimal("103.2")).current_unit == 3
+        assert tracker.update_price(Decimal("97.5")).current_unit == -3
+
+    def test_ticks_and_geometric_units_use_the_same_band(self):
+        """update_ticks applies the band, measured as a fraction of the (geometric) unit entered."""
+        tracker = UnitTracker(grid_spacing=Decimal("0.01"), anchor_price=Decimal("100"), hysteresis=Decimal("0.5"))
+
+        assert tracker.update_ticks(tracker.to_ticks(101.5)) is None  # unit 1 is 101 to 102.01, half is 101.505
+        assert tracker.update_ticks(tracker.to_ticks(100.5)) is None
+        assert tracker.suppressed_flips == 1
+        assert tracker.update_ticks(tracker.to_ticks(101.51)).current_unit == 1
+
+    def test_conflation_keeps_confirmations_inside_a_burst(self):
+        """Bucketing by the confirmation band keeps a confirming price that a later one in the same unit would overwrite."""
+        prices = [100.5, 101.3, 101.1, 101.05]  # up 30% into unit 1, then back inside the 20% band
+        confirmed, unit_only = (
+            UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"), hysteresis=Decimal("0.2"))
+            for _ in range(2)
+        )
+
+        for tracker, bucket in ((confirmed, confirmed.tick_bucket_of), (unit_only, unit_only.tick_unit_of)):
+            slot = ConflatingPriceSlot(bucket=bucket)
+            for price in prices:
+                slot.put(price)
+            tracker.update_path([Decimal(repr(price)) for price in slot._batch.path])
+
+        assert confirmed.current_unit == 1
+        assert unit_only.current_unit == 0  # 101.3 was overwritten by 101.05
+
+        # Zones split exactly at the thresholds the tracker confirms on, both ways
+        assert confirmed.tick_bucket_of(101.19) < confirmed.tick_bucket_of(101.2) == confirmed.tick_bucket_of(101.8)
+        assert confirmed.tick_bucket_of(101.8) < confirmed.tick_bucket_of(101.81)
+
+    def test_dwell_time_confirms_a_crossing(self):
+        """Staying past the boundary long enough confirms the crossing; coming back restarts the clock."""
+        now = [0.0]
+        tracker = UnitTracker(
+            unit_size_usd=Decimal("1"),
+            anchor_price=Decimal("100"),
+            dwell_seconds=5.0,
+            clock=lambda: now[0]
+        )
+
+        assert tracker.update_price(Decimal("101.01")) is None
+        now[0] = 3.0
+        assert tracker.update_price(Decimal("100.99")) is None
+        assert tracker.update_price(Decimal("101.01")) is None
+        now[0] = 7.0
+        assert tracker.update_price(Decimal("101.02")) is None
+        now[0] = 8.0
+        event = tracker.update_price(Decimal("101.02"))
+
+        assert (event.previous_unit, event.current_unit) == (0, 1)
+        assert tracker.get_state()["suppressed_flips"] == 1
+        assert tracker.get_state()["dwell_confirmations"] == 1
+
+    def test_process_array_refuses_banded_trackers(self):
+        """The bulk path has no notion of pending crossings."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"), hysteresis=Decimal("0.2"))
+
+        with pytest.raises(ValueError):
+            tracker.process_array(np.array([101.5]))
+
+
+def make_members():
+    """Trackers of different sizes, anchors and spacings, one of them banded"""
+    return {
+        "fine": UnitTracker(unit_size_usd=Decimal("0.25"), anchor_price=Decimal("2000")),
+        "coarse": UnitTracker(unit_size_usd=Decimal("2"), anchor_price=Decimal("2000.5")),
+        "pct": UnitTracker(grid_spacing=Decimal("0.001"), anchor_price=Decimal("1999")),
+        "banded": UnitTracker(unit_size_usd=Decimal("0.5"), anchor_price=Decimal("2000"), hysteresis=Decimal("0.3")),
+    }
+
+
+class TestUnitTrackerGroup:
+    """Several trackers on one price stream."""
+
+    def test_group_matches_independent_trackers(self):
+        """Every member emits exactly what it would fed on its own, and ends in the same state."""
+        rng = random.Random(17)
+        prices, price = [], 2000.0
+        for _ in range(20000):
+            price = round(price + rng.choice((-0.01, 0.0, 0.01)) * rng.randint(1, 5), 2)
+            prices.append(Decimal(repr(price)))
+
+        alone, members = make_members(), make_members()
+        expected = {name: [] for name in alone}
+        dispatched = {name: [] for name in members}
+        for name in members:
+            members[name].on_unit_change = dispatched[name].append
+        group = UnitTrackerGroup(members)
+
+        returned = []
+        for price in prices:
+            for name, tracker in alone.items():
+                event = tracker.update_price(price)
+                if event:
+                    expected[name].append((event.previous_unit, event.current_unit))
+            returned += [(name, e.previous_unit, e.current_unit) for name, e in group.update_price(price)]
+
+        for name in alone:
+            assert [(e.previous_unit, e.current_unit) for e in dispatched[name]] == expected[name], name
+            assert members[name].get_state() == alone[name].get_state(), name
+            assert group.events[name] == len(expected[name])
+        assert len(returned) == sum(len(events) for events in expected.values())
+        assert group.fast_path_ticks > len(prices) // 2
+
+    def test_unit_set_from_outside_moves_the_shared_band(self):
+        """Changing a member's unit directly is seen by the next group update."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"))
+        group = UnitTrackerGroup({"grid": tracker})
+        assert group.update_price(Decimal("100.5")) == []
+
+        tracker.current_unit = 3
+        events = group.update_price(Decimal("100.6"))
+
+        assert [(name, e.previous_unit, e.current_unit) for name, e in events] == [("grid", 3, 0)]
+
+    def test_bucket_changes_with_any_member(self):
+        """The conflation bucket moves on every member's boundaries, ordered like the price."""
+        group = UnitTrackerGroup({
+            "fine": UnitTracker(unit_size_usd=Decimal("0.5"), anchor_price=Decimal("100")),
+            "coarse": UnitTracker(unit_size_usd=Decimal("2"), anchor_price=Decimal("101")),
+        })
+
+        assert group.tick_unit_of(100.2) == group.tick_unit_of(100.4)
+        assert group.tick_unit_of(100.4) < group.tick_unit_of(100.6) < group.tick_unit_of(101.0)
+        assert UnitTrackerGroup({"only": UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"))}).tick_unit_of(101.5) == 1
+
+    def test_members_belong_to_one_group(self):
+        """A tracker is fed by one group at a time; removing it frees it."""
+        tracker = UnitTracker(unit_size_usd=Decimal("1"), anchor_price=Decimal("100"))
+        group = UnitTrackerGroup({"grid": tracker})
+
+        with pytest.raises(ValueError):
+            UnitTrackerGroup({"grid": tracker})
+        assert group.remove("grid") is tracker
+        assert len(group) == 0 and group.update_price(Decimal("105")) == []
+        UnitTrackerGroup({"grid": tracker})
+
 
 if __name__ == "__main__":
     # Run tests with pytest
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])